@@ -1,8 +1,11 @@
 # -*- mode: python ; coding: utf-8 -*-
-from PyInstaller.utils.hooks import collect_data_files
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 
 datas = collect_data_files('assets', includes=['*.png', '*.ico'])
 
+# the plugins of the registries are imported by name on first use, so the analysis can't find them
+plugins = collect_submodules('data_sources') + collect_submodules('tracking_approaches') + collect_submodules('publishers')
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -11,7 +14,7 @@ a = Analysis(
     # there is a problem with Tk not finding some dynamically loaded modules,
     # which is why we need to manually add them.
     # https://stackoverflow.com/questions/52675162/pyinstaller-doesnt-play-well-with-imagetk-and-tkinter
-    hiddenimports=['PIL._tkinter_finder'],
+    hiddenimports=['PIL._tkinter_finder'] + plugins,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1 @@
+"""Micro and macro benchmarks of the gaze pipeline. Run them with `python -m benchmarks`."""
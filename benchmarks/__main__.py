@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+from functools import partial
+
+from benchmarks import harness, micro, pipeline
+
+parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks the gaze pipeline.")
+parser.add_argument("--only", choices=["micro", "pipeline"], help="Run just one kind of benchmarks.")
+parser.add_argument("--number", type=int, default=1000, help="Calls per round of a micro benchmark.")
+parser.add_argument("--duration", type=float, default=3.0, help="Seconds per rate of the pipeline benchmark.")
+parser.add_argument("--save", metavar="FILE", help="Store the results as JSON baseline.")
+parser.add_argument("--compare", metavar="FILE", help="Compare the results against a stored JSON baseline.")
+parser.add_argument(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    help="Relative slowdown against the baseline that counts as regression. default=%(default)s",
+)
+args = parser.parse_args()
+
+results = {}
+if args.only in (None, "micro"):
+    results.update(micro.run(partial(harness.measure, number=args.number)))
+if args.only in (None, "pipeline"):
+    results.update(pipeline.run(args.duration))
+
+harness.print_results(results)
+
+if args.save:
+    os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+    harness.save_results(args.save, results)
+
+if args.compare:
+    regressions = harness.compare_results(harness.load_results(args.compare), results, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,70 @@
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable
+
+import config
+
+
+def measure(func: Callable[[], object], number: int = 1000, repeat: int = 7) -> dict:
+    """Calls `func` `number` times per round, for `repeat` rounds.
+    Returns the per-call time of the fastest and the median round, and the resulting throughput."""
+    func()  # warm up
+    rounds_ns = []
+    for _ in range(repeat):
+        start_ns = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        rounds_ns.append((time.perf_counter_ns() - start_ns) / number)
+    best_ns = min(rounds_ns)
+    return {
+        "best_ns_per_call": best_ns,
+        "median_ns_per_call": statistics.median(rounds_ns),
+        "calls_per_sec": 1_000_000_000 / best_ns if best_ns > 0 else None,
+    }
+
+
+def environment() -> dict:
+    return {
+        "app_version": config.APP_VERSION,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def save_results(path: str, results: dict):
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """Compares the timings of two result sets. Returns a description of every benchmark that
+    got slower than the baseline by more than the given tolerance, e.g. 0.1 for 10%."""
+    regressions = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        for metric, value in result.items():
+            baseline_value = baseline[name].get(metric)
+            if not metric.endswith(("_ns_per_call", "_ms")) or value is None or not baseline_value:
+                continue  # only timings, where lower is better, are compared
+            change = (value - baseline_value) / baseline_value
+            if change > tolerance:
+                regressions.append(f"{name}.{metric}: {baseline_value:.4g} -> {value:.4g} (+{change:.0%})")
+    return regressions
+
+
+def print_results(results: dict):
+    for name, result in results.items():
+        values = ", ".join(f"{metric}={value:.4g}" for metric, value in result.items() if value is not None)
+        print(f"{name}: {values}")
@@ -0,0 +1,185 @@
+import socket
+import struct
+import time
+
+import msgpack
+import numpy as np
+import screeninfo
+
+from calibration import CalibrationResult
+from data_sources.clients.opentrack import Opentrack
+from data_sources.clients.pupil import Pupil
+from engine import Engine
+from mouse_movement import MouseMovement, MouseMovementType
+from publishers.udp_publisher import UdpPublisher
+from tracking_approaches.d_pad_tracking_approach import DPadTrackingApproach
+from tracking_approaches.gaze_on_screen_tracking_approach import \
+    GazeOnScreenTrackingApproach
+from tracking_approaches.homography import (
+    CompiledHomography, compute_perspective_transformation_matrix,
+    perspective_transform)
+
+SCREEN_CORNERS = [(-1, 1), (1, 1), (1, -1), (-1, -1)]
+SOURCE_CORNERS = [(-0.31, 0.22), (0.29, 0.25), (0.33, -0.18), (-0.27, -0.21)]
+
+# a pupil.0.3d datum as sent by Pupil Capture
+PUPIL_3D_DATUM = {
+    "topic": "pupil.0.3d",
+    "norm_pos": [0.6230617370365481, 0.449595459323777],
+    "sphere": {"center": [6.7109385469479275, 1.6606580627008913, 67.99231785358006], "radius": 10.392304845413264},
+    "projected_sphere": {
+        "center": [417.25137406222336, 264.1373773194449],
+        "axes": [359.1299569911837, 359.1299569911837],
+        "angle": 0.0,
+    },
+    "circle_3d": {
+        "center": [4.671217960276486, 1.4050545057383488, 57.80535526652906],
+        "normal": [-0.19627220496439637, -0.024595463736358302, -0.9802409319764236],
+        "radius": 2.1060521273894866,
+    },
+    "diameter_3d": 4.212104254778973,
+    "ellipse": {
+        "center": [398.7595117033908, 264.19417952458707],
+        "axes": [82.42911034745876, 82.73431891534082],
+        "angle": 167.54346135904302,
+    },
+    "location": [398.7595117033908, 264.19417952458707],
+    "confidence": 0.98,
+    "timestamp": 1234.5678,
+    "model_confidence": 1.0,
+    "theta": 1.5953942709902191,
+    "phi": -1.76841162139929,
+    "id": 0,
+    "method": "3d c++",
+}
+
+SYNTHETIC_MONITOR = screeninfo.Monitor(x=0, y=0, width=1920, height=1080)
+# the vectors translated at once by the batch API, e.g. a second of a 100 Hz recording
+BATCH_SIZE = 100
+
+
+def benchmark_homography(measure) -> dict:
+    transformation_matrix = compute_perspective_transformation_matrix(SOURCE_CORNERS, SCREEN_CORNERS)
+    compiled_transformation = CompiledHomography(transformation_matrix)
+    out = [0.0, 0.0]
+    return {
+        "compute_perspective_transformation_matrix": measure(
+            lambda: compute_perspective_transformation_matrix(SOURCE_CORNERS, SCREEN_CORNERS)
+        ),
+        "perspective_transform": measure(lambda: perspective_transform(transformation_matrix, (0.1, -0.05))),
+        "CompiledHomography.transform_into": measure(
+            lambda: compiled_transformation.transform_into(0.1, -0.05, out)
+        ),
+    }
+
+
+def benchmark_mouse_position(measure) -> dict:
+    engine = Engine(monitor=SYNTHETIC_MONITOR)
+    to_position = MouseMovement(MouseMovementType.TO_POSITION, (0.25, -0.4))
+    by = MouseMovement(MouseMovementType.BY, (0.6, 0.3))
+    last_mouse_position = [960, 540]
+    mouse_position = [960.0, 540.0]
+    return {
+        "get_new_mouse_position.TO_POSITION": measure(
+            lambda: engine.get_new_mouse_position(to_position, last_mouse_position)
+        ),
+        "get_new_mouse_position.BY": measure(lambda: engine.get_new_mouse_position(by, last_mouse_position)),
+        "update_mouse_position.TO_POSITION": measure(lambda: engine.update_mouse_position(to_position, mouse_position)),
+        "update_mouse_position.BY": measure(lambda: engine.update_mouse_position(by, mouse_position)),
+    }
+
+
+def benchmark_batch(measure) -> dict:
+    """The batch API against translating the same vectors one by one, per batch of `BATCH_SIZE` vectors."""
+    engine = Engine(monitor=SYNTHETIC_MONITOR)
+    vectors = np.random.default_rng(0).uniform(-0.35, 0.35, (BATCH_SIZE, 2))
+    vector_list = [tuple(vector) for vector in vectors.tolist()]
+    last_mouse_position = [960.0, 540.0]
+    results = {}
+    for name, clazz in (("gaze_on_screen", GazeOnScreenTrackingApproach), ("d_pad", DPadTrackingApproach)):
+        tracking_approach = clazz()
+        tracking_approach.calibrate(CalibrationResult(SOURCE_CORNERS))
+        mouse_movements = tracking_approach.get_mouse_movements(vectors)
+
+        def one_by_one():
+            mouse_position = last_mouse_position
+            for vector in vector_list:
+                mouse_movement = tracking_approach.get_next_mouse_movement(vector)
+                mouse_position = engine.get_new_mouse_position(mouse_movement, mouse_position)
+
+        results[f"get_mouse_movements.{name}"] = measure(lambda: tracking_approach.get_mouse_movements(vectors))
+        results[f"get_new_mouse_positions.{name}"] = measure(
+            lambda: engine.get_new_mouse_positions(mouse_movements, last_mouse_position)
+        )
+        results[f"get_next_mouse_movement.{name}.one_by_one"] = measure(one_by_one)
+    return results
+
+
+def benchmark_udp_publisher(measure) -> dict:
+    # nobody listens on the port, sending to it still goes through the whole socket stack
+    results = {}
+    for name, message_format, batch_size in (
+        ("UdpPublisher.push", "json", 1),
+        ("UdpPublisher.push.binary", "binary", 1),
+        ("UdpPublisher.push.binary_batch_8", "binary", 8),
+    ):
+        destinations = [("127.0.0.1", _free_udp_port())]
+        publisher = UdpPublisher(destinations=destinations, message_format=message_format, batch_size=batch_size)
+        publisher.start()
+        try:
+            results[name] = measure(lambda: publisher.push((812.5, 377.25)))
+        finally:
+            publisher.stop()
+    return results
+
+
+def benchmark_opentrack(measure, datagrams: int = 20000) -> dict:
+    payload = struct.pack("6d", -1.5, 6.65, 114.1, -3.69, 15.14, 1.71)
+    decoder = Opentrack()
+    results = {"Opentrack.decode": measure(lambda: decoder.update_last_data(struct.unpack("6d", payload)))}
+
+    # the receive path, fed by datagrams over the loopback interface
+    # the client conflates, so several datagrams arriving at once are delivered as one pose
+    delivered = []
+    port = _free_udp_port()
+    client = Opentrack(port=port, on_data=lambda data, timestamp_ns: delivered.append(time.perf_counter_ns()))
+    client.start()
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        start_ns = time.perf_counter_ns()
+        for _ in range(datagrams):
+            sender.sendto(payload, ("127.0.0.1", port))
+        time.sleep(0.5)  # let the receiver drain what is left
+    finally:
+        sender.close()
+        client.stop()
+    duration_ns = (delivered[-1] if delivered else time.perf_counter_ns()) - start_ns
+    results["Opentrack.receive"] = {
+        "sent": datagrams,
+        "delivered": len(delivered),
+        "sent_per_sec": datagrams * 1_000_000_000 / duration_ns if duration_ns > 0 else None,
+    }
+    return results
+
+
+def benchmark_pupil(measure) -> dict:
+    payload = msgpack.dumps(PUPIL_3D_DATUM)
+    pupil = Pupil(on_data=lambda data, timestamp_ns: None)
+    return {"Pupil.decode": measure(lambda: pupil._handle_message(b"pupil.0.3d", payload, 0))}
+
+
+def run(measure) -> dict:
+    results = {}
+    results.update(benchmark_homography(measure))
+    results.update(benchmark_mouse_position(measure))
+    results.update(benchmark_batch(measure))
+    results.update(benchmark_udp_publisher(measure))
+    results.update(benchmark_opentrack(measure))
+    results.update(benchmark_pupil(measure))
+    return results
+
+
+def _free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
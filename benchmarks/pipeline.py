@@ -0,0 +1,84 @@
+import math
+import threading
+import time
+from typing import Optional
+
+from benchmarks.micro import SOURCE_CORNERS, SYNTHETIC_MONITOR, _free_udp_port
+from calibration import CalibrationResult
+from data_sources.data_source import DataSource
+from engine import Engine
+from latency import LatencyTracker
+from publishers.udp_publisher import UdpPublisher
+from tracking_approaches.gaze_on_screen_tracking_approach import GazeOnScreenTrackingApproach
+
+RATES_IN_HZ = (60, 120, 250, 1000)
+
+
+class SyntheticDataSource(DataSource):
+    """Produces a gaze wandering along a Lissajous curve within the calibrated area at a fixed rate."""
+
+    def __init__(self, rate_in_hz: float):
+        super().__init__()
+        self.rate_in_hz = rate_in_hz
+        self.produced = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._mark_started()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._mark_stopped()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def _produce(self):
+        interval_ns = int(1_000_000_000 / self.rate_in_hz)
+        next_ns = time.monotonic_ns()
+        while not self._stop_event.is_set():
+            t = self.produced / self.rate_in_hz
+            self._publish_vector((0.25 * math.sin(1.3 * t), 0.18 * math.sin(2.1 * t)))
+            self.produced += 1
+            next_ns += interval_ns
+            remaining_ns = next_ns - time.monotonic_ns()
+            if remaining_ns > 0:
+                time.sleep(remaining_ns / 1_000_000_000)
+
+
+def benchmark_rate(rate_in_hz: float, duration_in_sec: float) -> dict:
+    latency_tracker = LatencyTracker()
+    engine = Engine(monitor=SYNTHETIC_MONITOR, latency_tracker=latency_tracker)
+
+    engine.selected_tracking_approach = "gaze-on-screen"
+    engine.tracking_approach = GazeOnScreenTrackingApproach()
+    engine.calibration_result = CalibrationResult(SOURCE_CORNERS)
+    engine.tracking_approach.calibrate(engine.calibration_result)
+
+    data_source = SyntheticDataSource(rate_in_hz)
+    engine.set_publisher("udp", UdpPublisher(port=_free_udp_port()))
+    engine.set_data_source("synthetic", data_source)
+
+    cpu_start = time.process_time()
+    engine.start()
+    time.sleep(duration_in_sec)
+    engine.stop()
+    cpu_seconds = time.process_time() - cpu_start
+
+    total = latency_tracker.summary()["total"]
+    return {
+        "produced": data_source.produced,
+        "published": total["count"],
+        "published_ratio": total["count"] / data_source.produced if data_source.produced else None,
+        "cpu_percent": 100 * cpu_seconds / duration_in_sec,
+        "latency_p50_ms": total["p50_ms"],
+        "latency_p95_ms": total["p95_ms"],
+        "latency_p99_ms": total["p99_ms"],
+    }
+
+
+def run(duration_in_sec: float) -> dict:
+    return {f"pipeline.{rate}hz": benchmark_rate(rate, duration_in_sec) for rate in RATES_IN_HZ}
@@ -1,7 +1,14 @@
 import csv
+import math
 import os
-from typing import List
+import struct
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional
 
+import numpy as np
+
+import config
 from misc import Vector
 
 
@@ -24,35 +31,228 @@ class CalibrationInstructions:
 
 
 class CalibrationResult:
-    def __init__(self, vectors: List[Vector]):
+    """The calibration vectors, one per CalibrationInstruction. If known, also the number of samples
+    each vector is estimated from and their dispersion, see `estimate_calibration_vector`,
+    and the monitor the calibration was done on."""
+
+    def __init__(
+        self,
+        vectors: List[Vector],
+        sample_counts: List[int] = None,
+        dispersions: List[float] = None,
+        created_ns: int = None,
+        screen: tuple[int, int, int, int] = (0, 0, 0, 0),
+    ):
         self.vectors = vectors
+        self.sample_counts = sample_counts if sample_counts is not None else [0] * len(vectors)
+        self.dispersions = dispersions if dispersions is not None else [math.nan] * len(vectors)
+        # when the calibration was done, as `time.time_ns()`, it also identifies the result
+        self.created_ns = created_ns if created_ns is not None else time.time_ns()
+        # x, y, width and height of the monitor calibrated on
+        self.screen = screen
+
+
+def estimate_calibration_vector(
+    vectors: np.ndarray, outlier_threshold: float = config.CALIBRATION_OUTLIER_THRESHOLD_IN_MAD
+) -> tuple[Vector, int, float]:
+    """Estimates the vector the user looked at from the (N, 2) array of vectors collected meanwhile.
 
+    Vectors further off the median than `outlier_threshold` times the median absolute deviation (MAD,
+    scaled to match the standard deviation of normal distributions) on any axis are rejected as outliers,
+    e.g. blinks or glances away. Returns the mean of the remaining vectors, their number and their
+    dispersion, the root mean square distance to the mean."""
+    if len(vectors) == 0:
+        return (0, 0), 0, math.nan
+    median = np.median(vectors, axis=0)
+    deviations = np.abs(vectors - median)
+    mad = 1.4826 * np.median(deviations, axis=0)
+    inliers = vectors[(deviations <= outlier_threshold * mad).all(axis=1)]
+    mean = inliers.mean(axis=0)
+    dispersion = float(np.sqrt(((inliers - mean) ** 2).sum(axis=1).mean()))
+    return (float(mean[0]), float(mean[1])), len(inliers), dispersion
+
+
+# A calibration result file is a header followed by one record per calibration vector.
+# Files are replaced atomically, the replaced result moves into the history.
+HEADER = struct.Struct("<8sIqiiiiI4x")  # magic, version, created_ns, screen x, y, width, height, count
+MAGIC = b"MIRCAL\x00\x00"
+VERSION = 1
+RECORD_DTYPE = np.dtype(
+    [
+        ("x", "<f8"),
+        ("y", "<f8"),
+        ("sample_count", "<i8"),
+        ("dispersion", "<f8"),
+    ]
+)
 
 directory = ".calibration_results"
-file_format = f"{directory}/{{}}_{{}}.csv"
+history_directory = f"{directory}/history"
+file_format = f"{directory}/{{}}.mcal"
+history_file_format = f"{history_directory}/{{}}_{{}}.mcal"
+# results of older versions, only read
+legacy_file_format = f"{directory}/{{}}_{{}}.csv"
+
+
+def result_name(data_source: str, tracking_approach: str, monitor: str = None) -> str:
+    """Names the results of a data source and tracking approach combination. Each monitor has its own
+    results, see `Monitor.id`. Those of the primary monitor (`monitor` is None) have no monitor id,
+    as the results of older versions."""
+    if monitor is None:
+        return f"{data_source}_{tracking_approach}"
+    return f"{data_source}_{tracking_approach}@{monitor}"
+
+
+def has_result(data_source: str, tracking_approach: str, monitor: str = None) -> bool:
+    return os.path.exists(file_format.format(result_name(data_source, tracking_approach, monitor))) or (
+        monitor is None and os.path.exists(legacy_file_format.format(data_source, tracking_approach))
+    )
+
+
+def load_result(data_source: str, tracking_approach: str, monitor: str = None) -> CalibrationResult:
+    path = file_format.format(result_name(data_source, tracking_approach, monitor))
+    if os.path.exists(path) or monitor is not None:
+        return read_result(path)
+    return load_legacy_result(data_source, tracking_approach)
+
+
+def read_result(path: str) -> CalibrationResult:
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a calibration result: the header is incomplete.")
+    magic, version, created_ns, x, y, width, height, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a calibration result.")
+    if version != VERSION:
+        raise ValueError(f"{path} has the unsupported calibration result version {version}.")
+    records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count, offset=HEADER.size)
+    return CalibrationResult(
+        [(float(record["x"]), float(record["y"])) for record in records],
+        [int(sample_count) for sample_count in records["sample_count"]],
+        [float(dispersion) for dispersion in records["dispersion"]],
+        created_ns=created_ns,
+        screen=(x, y, width, height),
+    )
+
 
+def write_result(path: str, calibration_result: CalibrationResult):
+    """Writes the result to a temporary file first and then replaces the file at `path` with it,
+    so a crash leaves either the old or the new result, but never a broken one."""
+    records = np.empty(len(calibration_result.vectors), dtype=RECORD_DTYPE)
+    records["x"] = [vector[0] for vector in calibration_result.vectors]
+    records["y"] = [vector[1] for vector in calibration_result.vectors]
+    records["sample_count"] = calibration_result.sample_counts
+    records["dispersion"] = calibration_result.dispersions
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(
+            HEADER.pack(MAGIC, VERSION, calibration_result.created_ns, *calibration_result.screen, len(records))
+        )
+        f.write(records.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
 
-def has_result(data_source: str, tracking_approach: str) -> bool:
-    return os.path.exists(file_format.format(data_source, tracking_approach))
 
+def save_result(data_source: str, tracking_approach: str, calibration_result: CalibrationResult, monitor: str = None):
+    """Stores the result as the current one, the one it replaces is kept in the history."""
+    os.makedirs(history_directory, exist_ok=True)
+    name = result_name(data_source, tracking_approach, monitor)
+    path = file_format.format(name)
+    legacy_path = legacy_file_format.format(data_source, tracking_approach)
+    previous_result = None
+    if os.path.exists(path):
+        previous_result = read_result(path)
+    elif monitor is None and os.path.exists(legacy_path):
+        previous_result = load_legacy_result(data_source, tracking_approach)
+    if previous_result is not None:
+        history_path = history_file_format.format(name, previous_result.created_ns)
+        if not os.path.exists(history_path):
+            write_result(history_path, previous_result)
+        _prune_history(name)
+    write_result(path, calibration_result)
+    if monitor is None and os.path.exists(legacy_path):
+        os.remove(legacy_path)
 
-def load_result(data_source: str, tracking_approach: str) -> CalibrationResult:
+
+def list_history(data_source: str, tracking_approach: str, monitor: str = None) -> list[int]:
+    """The creation timestamps of the previous results, the newest first."""
+    return _list_history(result_name(data_source, tracking_approach, monitor))
+
+
+def load_history_result(
+    data_source: str, tracking_approach: str, created_ns: int, monitor: str = None
+) -> CalibrationResult:
+    return read_result(history_file_format.format(result_name(data_source, tracking_approach, monitor), created_ns))
+
+
+def restore_result(
+    data_source: str, tracking_approach: str, created_ns: int, monitor: str = None
+) -> CalibrationResult:
+    """Makes the previous result with the given creation timestamp the current one again.
+    It leaves the history, while the result it replaces moves into it."""
+    name = result_name(data_source, tracking_approach, monitor)
+    calibration_result = load_history_result(data_source, tracking_approach, created_ns, monitor)
+    save_result(data_source, tracking_approach, calibration_result, monitor)
+    history_path = history_file_format.format(name, created_ns)
+    if os.path.exists(history_path):
+        os.remove(history_path)
+    return calibration_result
+
+
+def delete_result(data_source: str, tracking_approach: str, monitor: str = None):
+    config_files = [file_format.format(result_name(data_source, tracking_approach, monitor))]
+    if monitor is None:
+        config_files.append(legacy_file_format.format(data_source, tracking_approach))
+    for config_file in config_files:
+        if os.path.exists(config_file):
+            os.remove(config_file)
+
+
+def load_legacy_result(data_source: str, tracking_approach: str) -> CalibrationResult:
+    """Loads a result stored as CSV by older versions."""
     vectors = []
-    with open(file_format.format(data_source, tracking_approach), "r") as f:
+    with open(legacy_file_format.format(data_source, tracking_approach), "r") as f:
         for row in csv.reader(f):
             vectors.append((float(row[0]), float(row[1])))  # Convert strings to floats
-    return CalibrationResult(vectors)
+    return CalibrationResult(vectors, created_ns=0)
+
+
+def _list_history(name: str) -> list[int]:
+    prefix = f"{name}_"
+    if not os.path.exists(history_directory):
+        return []
+    created = []
+    for file_name in os.listdir(history_directory):
+        file_name, extension = os.path.splitext(file_name)
+        if extension == ".mcal" and file_name.startswith(prefix) and file_name[len(prefix) :].isdigit():
+            created.append(int(file_name[len(prefix) :]))
+    return sorted(created, reverse=True)
+
+
+def _prune_history(name: str):
+    for created_ns in _list_history(name)[config.CALIBRATION_HISTORY_SIZE :]:
+        os.remove(history_file_format.format(name, created_ns))
+
 
+class CompiledCalibrationCache:
+    """A least recently used cache of calibrated TrackingApproach states, see
+    `TrackingApproach.get_compiled_calibration`. The keys identify a calibration, e.g. by
+    data source, tracking approach, monitor and creation timestamp of the result."""
 
-def save_result(data_source: str, tracking_approach: str, calibration_result: CalibrationResult):
-    if not os.path.exists(directory):
-        os.mkdir(directory)
-    with open(file_format.format(data_source, tracking_approach), "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(calibration_result.vectors)
+    def __init__(self, capacity: int = config.CALIBRATION_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
 
+    def get(self, key: Hashable) -> Optional[object]:
+        compiled_calibration = self._entries.get(key)
+        if compiled_calibration is not None:
+            self._entries.move_to_end(key)
+        return compiled_calibration
 
-def delete_result(data_source: str, tracking_approach: str):
-    config_file = file_format.format(data_source, tracking_approach)
-    if os.path.exists(config_file):
-        os.remove(config_file)
+    def put(self, key: Hashable, compiled_calibration: object):
+        self._entries[key] = compiled_calibration
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
@@ -12,7 +12,98 @@ APP_LINK_CODE = "https://codeberg.org/eyes-on-disabilities/miranda-eye-tracking-
 # in application
 MOUSE_SPEED_IN_PX = 20
 LOOP_SLEEP_IN_MILLISEC = 100
+DATA_SOURCE_TIMEOUT_IN_MILLISEC = 500
+# the GUI renders the latest state of the pipeline at most this often, however fast the data source is
+GUI_FRAME_RATE_IN_HZ = 60
+MOUSE_DATA_SOURCE_RATE_IN_HZ = 60
+# the sample history keeps the last seconds of a data source, at up to the given rate
+SAMPLE_HISTORY_IN_SEC = 10
+SAMPLE_HISTORY_MAX_RATE_IN_HZ = 1000
+# measures per-stage latencies of the pipeline, also enabled by --latency-report
+LATENCY_INSTRUMENTATION_ENABLED = False
+LATENCY_DISPLAY_INTERVAL_IN_MILLISEC = 1000
+# The OSC addresses EyeTrackVR sends an (x, y) vector to, by eye, and the eye to use as data source.
+# Add e.g. "left" and "right" with the addresses configured in EyeTrackVR to track a single eye.
+EYETRACKVR_ADDRESSES = {"both": "/tracking/eye/LeftRightVec"}
+EYETRACKVR_EYE = "both"
+# Launches Orlosky's 3DEyeTracker with this command, e.g. ["python", "Orlosky3DEyeTracker.py"], and reads its
+# output lines over a pipe instead of watching 3DTracker/gaze_vector.txt. The lines need the format of that file.
+ORLOSKY_TRACKER_COMMAND = None
+# transforms and publishes with preallocated structures instead of creating new ones per sample
+FAST_PATH_ENABLED = True
+# The UDP publisher sends to every (host, port) here, a host may also be a multicast group like "239.0.0.1".
+# The format is "json" or "binary", see README. A batch size > 1 sends that many vectors per datagram.
+UDP_PUBLISHER_DESTINATIONS = [("127.0.0.1", 9999)]
+UDP_PUBLISHER_FORMAT = "json"
+UDP_PUBLISHER_BATCH_SIZE = 1
+# a batch that didn't fill up is sent once its first vector is this old
+UDP_PUBLISHER_MAX_BATCH_AGE_IN_MILLISEC = 50
+UDP_PUBLISHER_MULTICAST_TTL = 1
+# Runs every publisher on an own thread behind a queue of the given size, by publisher key, so a slow output
+# never stalls the pipeline. A full queue drops its oldest vector, a size of 1 only keeps the latest one.
+PUBLISHER_WORKERS_ENABLED = True
+PUBLISHER_QUEUE_SIZES = {"udp": 64, "mouse": 1}
+# How the mouse cursor is read and moved: "xlib" talks to the X server directly, "pyautogui" works everywhere,
+# "auto" uses "xlib" on Linux with X11 and "pyautogui" otherwise
+CURSOR_BACKEND = "auto"
+# The mouse publisher pauses when the cursor is further than this from where it moved it, as the user moved it then
+MOUSE_PUBLISHER_MANUAL_MOVE_TOLERANCE_IN_PX = 2
+# The filters smoothing the mouse positions, by data source key, as list of (filter key, keyword arguments).
+# See filters/__init__.py for the available filters.
+FILTERS = {
+    "pupil": [("one-euro", {})],
+    "eyetrackvr": [("one-euro", {})],
+}
+# the defaults of the 1€ filter, beta is per pixel per second
+ONE_EURO_FILTER_MIN_CUTOFF_IN_HZ = 1.0
+ONE_EURO_FILTER_BETA = 0.007
+ONE_EURO_FILTER_DERIVATIVE_CUTOFF_IN_HZ = 1.0
+# Publishes on a fixed output clock instead of once per sample, by publisher key, e.g. at the display refresh rate.
+# Positions in between are interpolated, delayed by one interval of the data source. A positive lead time
+# extrapolates ahead instead, to hide the latency of the pipeline. Extrapolation stops this long after the
+# latest sample, then nothing gets published till the next one. Off by default, since the interpolation adds
+# latency, e.g. {"mouse": 60} moves the cursor at 60 Hz.
+RESAMPLER_OUTPUT_RATES_IN_HZ = {}
+RESAMPLER_LEAD_TIME_IN_MILLISEC = 0
+RESAMPLER_MAX_EXTRAPOLATION_IN_MILLISEC = 50
+# Classifies the mouse positions into fixations, saccades and signal loss, with "ivt" (velocity threshold)
+# or "idt" (dispersion threshold). A fixation counts once it lasted the minimum duration.
+GAZE_CLASSIFIER_METHOD = "ivt"
+IVT_VELOCITY_THRESHOLD_IN_PX_PER_SEC = 1000
+# a fixation only ends after this many samples in a row exceeded the velocity threshold, fewer are skipped as noise
+IVT_MIN_SACCADE_SAMPLES = 2
+IDT_DISPERSION_THRESHOLD_IN_PX = 50
+MIN_FIXATION_DURATION_IN_MILLISEC = 100
+MAX_GAZE_SAMPLE_GAP_IN_MILLISEC = 100
+# These publishers, by key, only get the centroids of fixations, whenever one starts or its centroid moves.
+FIXATION_ONLY_PUBLISHERS = []
+FIXATION_CENTROID_MIN_CHANGE_IN_PX = 1.0
+# the gaze buttons fill up with the duration of fixations on them, instead of the time positions were on them
+GAZE_BUTTON_DWELL_ON_FIXATIONS = True
 SHOW_FINAL_CALIBRATION_TEXT_FOR_SEC = 30
 SHOW_PREP_CALIBRATION_TEXT_FOR_SEC = 10
 WAIT_TIME_BEFORE_COLLECTING_VECTORS_IN_SEC = 3
 VECTOR_COLLECTION_TIME_IN_SEC = 3
+# calibration vectors further off the median than this many (normal-scaled) median absolute deviations are ignored
+CALIBRATION_OUTLIER_THRESHOLD_IN_MAD = 3
+# The monitor mouse positions are mapped onto and calibrations are done on: "primary", "all" to span all monitors,
+# the index or the name of a monitor. Every monitor has its own calibration. Also set by --monitor.
+CALIBRATION_MONITOR = "primary"
+# how often the monitors are read again, to notice resolution changes and monitors plugged in or out
+MONITOR_LAYOUT_REFRESH_IN_SEC = 2
+# the number of previous calibration results kept per data source, tracking approach and monitor
+CALIBRATION_HISTORY_SIZE = 10
+# the number of calibrated tracking approaches kept in memory, for switching between them without recomputing
+CALIBRATION_CACHE_SIZE = 16
+# While calibrating, the publishers keep getting the positions of the stored calibration, unless paused.
+PAUSE_PUBLISHING_WHILE_CALIBRATING = False
+# Corrects the drift of a calibration online, with what the user looks at meanwhile: the center at a drift check,
+# and, if enabled, triggered gaze buttons and clicks in the calibration window. Those are off by default, as not
+# every click is a reliable target, e.g. "Cancel" after a bad calibration. The forgetting factor (< 1) lets older
+# corrections count less, the initial uncertainty sets how far the first corrections may pull the calibration.
+DRIFT_CORRECTION_ENABLED = True
+DRIFT_CORRECTION_FROM_INTERACTIONS = False
+DRIFT_CORRECTION_FORGETTING_FACTOR = 0.98
+DRIFT_CORRECTION_INITIAL_UNCERTAINTY = 1.0
+# how long before a click the gaze counts for drift correction
+DRIFT_CORRECTION_CLICK_WINDOW_IN_MILLISEC = 300
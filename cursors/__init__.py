@@ -0,0 +1,25 @@
+import os
+import sys
+
+import config
+from cursors.cursor_backend import CursorBackend
+
+
+def create_cursor_backend(name: str = None) -> CursorBackend:
+    """Creates the cursor backend with the given name, by default the one of `config.CURSOR_BACKEND`.
+
+    "auto" uses the Xlib backend on Linux with X11 and falls back to pyautogui
+    if python-xlib or the XTEST extension is missing."""
+    name = name if name is not None else config.CURSOR_BACKEND
+    if name == "xlib" or (name == "auto" and sys.platform.startswith("linux") and os.environ.get("DISPLAY")):
+        try:
+            from cursors.xlib_cursor_backend import XlibCursorBackend
+
+            return XlibCursorBackend()
+        except Exception as e:
+            if name == "xlib":
+                raise
+            print(f"The Xlib cursor backend is not available ({e}), using pyautogui instead.")
+    from cursors.pyautogui_cursor_backend import PyautoguiCursorBackend
+
+    return PyautoguiCursorBackend()
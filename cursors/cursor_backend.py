@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+Position = tuple[int, int]
+
+
+class CursorBackend(ABC):
+    """Reads and moves the system's mouse cursor.
+    A backend is not thread-safe, it must not be used by several threads at the same time."""
+
+    @abstractmethod
+    def position(self) -> Position:
+        """The current position of the cursor in pixels."""
+        pass
+
+    @abstractmethod
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Left, top, right and bottom of the desktop the cursor moves on, which spans all monitors.
+        Right and bottom are exclusive. Left and top may be negative, e.g. for a monitor left of the primary one."""
+        pass
+
+    @abstractmethod
+    def _move(self, x: int, y: int):
+        """Moves the cursor to the given pixel, which lies on the desktop."""
+        pass
+
+    def move_to(self, x: float, y: float, current_position: Optional[Position] = None) -> Position:
+        """Moves the cursor to the pixel nearest to (x, y) on the desktop and returns that pixel.
+        If the caller already knows the current position, the move is skipped when the cursor
+        is already there."""
+        left, top, right, bottom = self.bounds()
+        x = min(max(round(x), left), right - 1)
+        y = min(max(round(y), top), bottom - 1)
+        if current_position is None or current_position[0] != x or current_position[1] != y:
+            self._move(x, y)
+        return (x, y)
+
+    def close(self):
+        """Releases all resources of the backend."""
+        pass
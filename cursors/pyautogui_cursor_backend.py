@@ -0,0 +1,28 @@
+import pyautogui
+
+from cursors.cursor_backend import CursorBackend, Position
+from monitors import MonitorLayout
+
+
+class PyautoguiCursorBackend(CursorBackend):
+    """Works on every platform pyautogui supports."""
+
+    def __init__(self):
+        # Since in our case touching the corners is expected, we deactivate pyautogui's failsafe.
+        # see https://pyautogui.readthedocs.io/en/latest/#fail-safes
+        pyautogui.FAILSAFE = False
+        # pyautogui's size is the one of the primary monitor only, but it moves across all of them
+        bounds = MonitorLayout().bounds
+        self._bounds = (bounds.x, bounds.y, bounds.right, bounds.bottom)
+
+    def position(self) -> Position:
+        return tuple(pyautogui.position())
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        return self._bounds
+
+    def _move(self, x: int, y: int):
+        pyautogui.moveTo(x, y, _pause=False)
+
+    def close(self):
+        pyautogui.FAILSAFE = True
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from Xlib import X, display
+from Xlib.ext import xtest
+
+from cursors.cursor_backend import CursorBackend, Position
+
+
+class XlibCursorBackend(CursorBackend):
+    """Talks to the X server directly over one display connection.
+
+    Reading the position is one round-trip to the X server. Moving sends an XTest motion event
+    without waiting for an answer, so a position query followed by a move costs a single round-trip."""
+
+    def __init__(self, display_name: Optional[str] = None):
+        self._display = display.Display(display_name)
+        if not self._display.has_extension("XTEST"):
+            self._display.close()
+            raise RuntimeError("The X server does not support the XTEST extension")
+        screen = self._display.screen()
+        self._root = screen.root
+        # the root window spans all monitors
+        self._bounds = (0, 0, screen.width_in_pixels, screen.height_in_pixels)
+
+    def position(self) -> Position:
+        pointer = self._root.query_pointer()
+        return (pointer.root_x, pointer.root_y)
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        return self._bounds
+
+    def _move(self, x: int, y: int):
+        xtest.fake_input(self._display, X.MotionNotify, x=x, y=y)
+        self._display.flush()
+
+    def close(self):
+        self._display.close()
@@ -1,46 +1,47 @@
-from data_sources.mouse_data_source import MouseDataSource
-from data_sources.opentrack_data_source import OpentrackDataSource
-from data_sources.orlosky_data_source import OrloskyDataSource
-from data_sources.pupil_data_source import PupilDataSource
-from guis.tkinter.main_menu_window import MainMenuOption
 from misc import resource_path
-from data_sources.eyetrackvr_data_source import EyeTrackVRDataSource
-from data_sources.opentrack_and_pupil_data_source import OpentrackAndPupilDataSource
+from plugins import PluginOption
 
-data_sources: dict[MainMenuOption] = {
-    "mouse": MainMenuOption(
+data_sources: dict[str, PluginOption] = {
+    "mouse": PluginOption(
         key="mouse",
         title="Mouse Position",
         description="The mouse position as input. Great for testing.",
         icon=resource_path("assets/data_source_mouse.png"),
-        clazz=MouseDataSource,
+        clazz="data_sources.mouse_data_source:MouseDataSource",
     ),
-    "orlosky": MainMenuOption(
+    "orlosky": PluginOption(
         key="orlosky",
         title="Orlosky",
         description="The 3DEyeTracker from Jason Orlosky.",
         icon=resource_path("assets/data_source_orlosky.png"),
-        clazz=OrloskyDataSource,
+        clazz="data_sources.orlosky_data_source:OrloskyDataSource",
     ),
-    "opentrack": MainMenuOption(
+    "opentrack": PluginOption(
         key="opentrack",
         title="OpenTrack",
         description="The rotation of your head with OpenTrack.",
         icon=resource_path("assets/data_source_opentrack.png"),
-        clazz=OpentrackDataSource,
+        clazz="data_sources.opentrack_data_source:OpentrackDataSource",
     ),
-    "pupil": MainMenuOption(
+    "pupil": PluginOption(
         key="pupil",
         title="Pupil",
         description="Pupil Lab's 3d-eye detection.",
         icon=resource_path("assets/data_source_pupil.png"),
-        clazz=PupilDataSource,
+        clazz="data_sources.pupil_data_source:PupilDataSource",
     ),
-    "eyetrackvr": MainMenuOption(
+    "eyetrackvr": PluginOption(
         key="eyetrackvr",
         title="EyeTrackVR",
         description="Eye tracking with EyeTrackVR.",
         icon=resource_path("assets/data_source_eyetrackvr.png"),
-        clazz=EyeTrackVRDataSource,
+        clazz="data_sources.eyetrackvr_data_source:EyeTrackVRDataSource",
+    ),
+    "replay": PluginOption(
+        key="replay",
+        title="Replay",
+        description="Plays back a recording made with --record.",
+        icon=resource_path("assets/icon.png"),
+        clazz="data_sources.replay_data_source:ReplayDataSource",
     ),
 }
@@ -1,38 +1,100 @@
+import asyncio
 import threading
+import time
+from typing import Callable, Optional
 
-from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import BlockingOSCUDPServer
+from pythonosc.osc_packet import OscPacket, ParseError
+
+# per eye, the OSC address EyeTrackVR sends its (x, y) vector to
+DEFAULT_ADDRESSES = {"both": "/tracking/eye/LeftRightVec"}
+
+EyeTrackVRSnapshot = tuple[float, float, int]  # x, y, time.monotonic_ns() of arrival
+
+
+class _OscProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_datagram: Callable[[bytes], None]):
+        self.on_datagram = on_datagram
+
+    def datagram_received(self, data: bytes, addr):
+        self.on_datagram(data)
 
 
 class EyeTrackVR:
-    def __init__(self, ip="127.0.0.1", port=9000, timeout=0.3):
+    """Receives the eye vectors of EyeTrackVR over OSC.
+
+    The datagrams are received by an asyncio event loop, which sleeps in the OS until data
+    arrives. A datagram, be it a single message or a bundle, is handled in one pass: all its
+    messages update the snapshots of their eyes, and listeners are called once per eye.
+    A snapshot (x, y, timestamp) is replaced as a whole, so readers never see torn values."""
+
+    def __init__(
+        self,
+        ip="127.0.0.1",
+        port=9000,
+        timeout=0.3,
+        on_data: Optional[Callable[[str, float, float, int], None]] = None,
+        addresses: dict[str, str] = None,
+    ):
         self.ip = ip
         self.port = port
         self.timeout = timeout
+        self.on_data = on_data
+        addresses = addresses if addresses is not None else DEFAULT_ADDRESSES
+        self._eye_by_address = {address: eye for eye, address in addresses.items()}
 
-        dispatcher = Dispatcher()
-        dispatcher.map("/tracking/eye/LeftRightVec", lambda addr, *args: self._update_data(args[0], args[1]))
-        self.osc_server = BlockingOSCUDPServer((self.ip, self.port), dispatcher)
-
-        self.last_x = None
-        self.last_y = None
+        self._snapshots: dict[str, EyeTrackVRSnapshot] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._transport = None
+        self.thread = None
 
     def start(self):
-        self.thread = threading.Thread(target=self._serve)
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self.thread = threading.Thread(target=self._serve, args=(started,), daemon=True)
         self.thread.start()
+        started.wait(self.timeout)
 
     def stop(self):
-        self.osc_server.shutdown()
-        self.osc_server.server_close()
-        if self.thread.is_alive():
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self.thread is not None and self.thread.is_alive():
             self.thread.join(timeout=1)
 
-    def get_last_data(self):
-        return (self.last_x, self.last_y)
+    def get_last_data(self, eye: str = "both") -> Optional[EyeTrackVRSnapshot]:
+        return self._snapshots.get(eye)
 
-    def _update_data(self, new_x: float, new_y: float):
-        self.last_x = new_x
-        self.last_y = new_y
+    def _handle_datagram(self, datagram: bytes):
+        timestamp_ns = time.monotonic_ns()
+        try:
+            messages = OscPacket(datagram).messages
+        except ParseError:
+            return
+        updated_eyes = []
+        for timed_message in messages:
+            message = timed_message.message
+            eye = self._eye_by_address.get(message.address)
+            if eye is None or len(message.params) < 2:
+                continue
+            self._snapshots[eye] = (message.params[0], message.params[1], timestamp_ns)
+            if eye not in updated_eyes:
+                updated_eyes.append(eye)
+        if self.on_data is not None:
+            for eye in updated_eyes:
+                x, y, _ = self._snapshots[eye]
+                self.on_data(eye, x, y, timestamp_ns)
 
-    def _serve(self):
-        self.osc_server.serve_forever(self.timeout)
+    def _serve(self, started: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._transport, _ = self._loop.run_until_complete(
+                self._loop.create_datagram_endpoint(
+                    lambda: _OscProtocol(self._handle_datagram), local_addr=(self.ip, self.port)
+                )
+            )
+            started.set()
+            self._loop.run_forever()
+        finally:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
+            self._loop.close()
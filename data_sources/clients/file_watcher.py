@@ -0,0 +1,104 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Optional
+
+# see inotify(7)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class FileWatcher:
+    """Waits for changes of a single file.
+
+    On Linux, inotify tells us about changes the moment they happen. The directory of the file
+    is watched, so replacing the file is noticed as well. Everywhere else, or if inotify is not
+    available, the modification time and size of the file are compared every `poll_interval`
+    seconds, which is much cheaper than reading the file."""
+
+    def __init__(self, path: str, poll_interval: float = 0.01):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._inotify_fd: Optional[int] = None
+        self._last_stat = None
+
+    def start(self):
+        self._inotify_fd = self._init_inotify()
+        self._last_stat = self._stat()
+
+    def stop(self):
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+    def uses_inotify(self) -> bool:
+        return self._inotify_fd is not None
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Blocks till the file changed or the timeout passed. Returns True on a change."""
+        if self._inotify_fd is not None:
+            return self._wait_with_inotify(timeout)
+        return self._wait_with_stat(timeout)
+
+    def _wait_with_inotify(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self._inotify_fd], [], [], timeout)
+        if not readable:
+            return False
+        changed = False
+        name = os.path.basename(self.path).encode()
+        try:
+            while True:  # drain all events, several writes count as one change
+                events = os.read(self._inotify_fd, 4096)
+                offset = 0
+                while offset < len(events):
+                    _, _, _, name_length = INOTIFY_EVENT.unpack_from(events, offset)
+                    offset += INOTIFY_EVENT.size
+                    event_name = events[offset : offset + name_length].rstrip(b"\0")
+                    offset += name_length
+                    changed = changed or event_name == name
+        except BlockingIOError:
+            pass
+        return changed
+
+    def _wait_with_stat(self, timeout: float) -> bool:
+        end_time = time.monotonic() + timeout
+        while True:
+            stat = self._stat()
+            if stat != self._last_stat:
+                self._last_stat = stat
+                return stat is not None
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.poll_interval, remaining))
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            return None
+
+    def _init_inotify(self) -> Optional[int]:
+        if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return None
+            directory = os.path.dirname(os.path.abspath(self.path)).encode()
+            if libc.inotify_add_watch(fd, directory, IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
@@ -1,16 +1,46 @@
+import select
 import socket
 import struct
+import threading
+import time
+from typing import Callable, Optional
+
+# one datagram of OpenTrack's "UDP over network" output: x, y, z, yaw, pitch, roll as doubles
+POSE = struct.Struct("6d")
+WSAEMSGSIZE = 10040
 
 
 class Opentrack:
-    def __init__(self, ip="127.0.0.1", port=4242, socket_timeout=0.1):
+    """Receives the poses of OpenTrack on an own thread.
+
+    All datagrams waiting in the socket are drained at once and only the newest pose is kept,
+    so a slow consumer never gets served outdated poses from the queue. Reading the last pose
+    never blocks."""
+
+    def __init__(
+        self,
+        ip="127.0.0.1",
+        port=4242,
+        socket_timeout=0.1,
+        on_data: Optional[Callable[[dict, int], None]] = None,
+        receive_buffer_size=64 * 1024,
+    ):
         self.socket = None
         self.last_data = None
+        self.last_timestamp_ns = None
         self.ip = ip
         self.port = port
         self.socket_timeout = socket_timeout
+        self.on_data = on_data
+        self.receive_buffer_size = receive_buffer_size
+
+        self.buffer_size = POSE.size  # Size of one message
+        # one byte more than a pose, to tell apart datagrams which are too long
+        self._buffer = bytearray(self.buffer_size + 1)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
 
-    def update_last_data(self, new_values):
+    def update_last_data(self, new_values, timestamp_ns: int = None):
         assert len(new_values) == 6
         self.last_data = {
             "x": new_values[0],
@@ -20,27 +50,58 @@ class Opentrack:
             "pitch": new_values[4],
             "roll": new_values[5],
         }
+        self.last_timestamp_ns = timestamp_ns if timestamp_ns is not None else time.monotonic_ns()
+        if self.on_data is not None:
+            self.on_data(self.last_data, self.last_timestamp_ns)
 
     def start(self):
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.settimeout(5)
+        # the kernel shall queue bursts instead of dropping them, we drain the queue anyway
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size)
         self.socket.bind((self.ip, self.port))
-        self.socket.settimeout(self.socket_timeout)
-        self.buffer_size = 6 * 8  # Size of one message
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.buffer_size)
+        self.socket.setblocking(False)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._receive_loop, daemon=True)
+        self._thread.start()
 
     def stop(self):
+        self._running = False
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1)
         self.socket.close()
 
     def get_last_data(self):
-        try:
-            data, addr = self.socket.recvfrom(self.buffer_size)
-            if len(data) == self.buffer_size:
-                new_values = struct.unpack("6d", data)
-                self.update_last_data(new_values)
-            else:
-                self.last_data = None
-        except Exception:
-            self.last_data = None
-        finally:
-            return self.last_data
+        return self.last_data
+
+    def _receive_loop(self):
+        buffer = self._buffer
+        while self._running:
+            try:
+                readable, _, _ = select.select([self.socket], [], [], self.socket_timeout)
+                if not readable:
+                    self.last_data = None
+                    continue
+
+                received_pose = False
+                timestamp_ns = None
+                while True:  # drain everything that is waiting, only the newest pose counts
+                    try:
+                        size = self.socket.recv_into(buffer)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    except OSError as e:
+                        if getattr(e, "winerror", None) == WSAEMSGSIZE:
+                            continue  # Windows refuses datagrams which are larger than the buffer
+                        raise
+                    if size == self.buffer_size:
+                        received_pose = True
+                        timestamp_ns = time.monotonic_ns()
+                        newest_pose = POSE.unpack_from(buffer)
+
+                if received_pose:
+                    self.update_last_data(newest_pose, timestamp_ns)
+            except OSError:
+                if self._running:
+                    self.last_data = None
+                    time.sleep(self.socket_timeout)
@@ -1,12 +1,28 @@
 import os
+import subprocess
 import threading
-import time
 import tkinter.filedialog as fd
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
+
+from data_sources.clients.file_watcher import FileWatcher
 
 
 class Orlosky:
-    def __init__(self):
+    """Reads the gaze vector of Jason Orlosky's 3DEyeTracker.
+
+    By default, the tracker's output file `3DTracker/gaze_vector.txt` is re-read whenever it changed.
+    With a `tracker_command`, the tracker is launched by us instead and its output lines are
+    consumed over a pipe, so samples arrive at the tracker's native rate. The command is run
+    in the tracker's directory and has to print lines in the format of `gaze_vector.txt`."""
+
+    def __init__(
+        self,
+        on_data: Optional[Callable[[Dict[str, float]], None]] = None,
+        tracker_command: Optional[List[str]] = None,
+    ):
+        self.on_data = on_data
+        self.tracker_command = tracker_command
+        self._process: Optional[subprocess.Popen] = None
         self._data_lock = threading.Lock()
         self._latest_data: Optional[Dict[str, float]] = None
         self._running = False
@@ -18,13 +34,29 @@ class Orlosky:
         if not self._select_valid_directory():
             return
         self._running = True
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        if self.tracker_command is not None:
+            self._process = subprocess.Popen(
+                self.tracker_command,
+                cwd=os.path.join(self._tracker_path, "3DTracker"),
+                stdout=subprocess.PIPE,
+                bufsize=0,
+            )
+            self._thread = threading.Thread(target=self._run_pipe_loop, daemon=True)
+        else:
+            self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._running = False
+        if self._process is not None:
+            self._process.terminate()  # also ends the pipe loop waiting for the next line
+            try:
+                self._process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
         if self._thread:
-            self._thread.join()
+            self._thread.join(timeout=1)
 
     def get_last_data(self) -> Optional[Dict[str, float]]:
         with self._data_lock:
@@ -60,18 +92,55 @@ class Orlosky:
 
     def _run_loop(self):
         gaze_file = os.path.join(self._tracker_path, "3DTracker", "gaze_vector.txt")
-        while self._running:
+        watcher = FileWatcher(gaze_file)
+        watcher.start()
+        buffer = bytearray(4096)
+        f = None
+        changed = True
+        try:
+            while self._running:
+                if changed:
+                    try:
+                        if f is None or self._got_replaced(f, gaze_file):
+                            if f is not None:
+                                f.close()
+                            f = open(gaze_file, "rb", buffering=0) if os.path.exists(gaze_file) else None
+                        if f is not None:
+                            # the tracker rewrites the whole file, so the newest line always starts at offset 0
+                            f.seek(0)
+                            size = f.readinto(buffer)
+                            self._handle_line(bytes(buffer[:size]))
+                    except Exception:
+                        pass
+                # after a timeout, the file is only read again if it is missing or got replaced unnoticed
+                changed = watcher.wait_for_change(0.5) or f is None or self._got_replaced(f, gaze_file)
+        finally:
+            watcher.stop()
+            if f is not None:
+                f.close()
+
+    def _run_pipe_loop(self):
+        for line in self._process.stdout:
+            if not self._running:
+                break
             try:
-                if os.path.exists(gaze_file):
-                    with open(gaze_file, "r") as f:
-                        line = f.read().strip()
-                        if line:
-                            parts = [float(p) for p in line.split(",")]
-                            if len(parts) >= 6:
-                                x, y, z = parts[3], parts[4], parts[5]
-                                with self._data_lock:
-                                    self._latest_data = {"x": x, "y": y, "z": z}
+                self._handle_line(line)
             except Exception:
                 pass
-            time.sleep(0.05)
 
+    def _got_replaced(self, f, path: str) -> bool:
+        try:
+            return os.fstat(f.fileno()).st_ino != os.stat(path).st_ino
+        except OSError:
+            return True
+
+    def _handle_line(self, line: bytes):
+        line = line.strip()
+        if line:
+            parts = [float(p) for p in line.split(b",")]
+            if len(parts) >= 6:
+                x, y, z = parts[3], parts[4], parts[5]
+                with self._data_lock:
+                    self._latest_data = {"x": x, "y": y, "z": z}
+                if self.on_data is not None:
+                    self.on_data(self.get_last_data())
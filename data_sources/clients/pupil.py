@@ -1,16 +1,37 @@
 import threading
 import time
-from datetime import datetime, timedelta
+from typing import Callable, Optional
 
 import msgpack
 import zmq
 
+# per topic, the only fields of a datum that get decoded
+DECODED_FIELDS = {
+    b"pupil.0.2d": frozenset(("norm_pos", "confidence", "timestamp")),
+    b"pupil.0.3d": frozenset(("theta", "phi", "confidence", "timestamp")),
+}
+
 
 class Pupil:
-    def __init__(self, ip="127.0.0.1", port=50020, timeout=0.3):
+    """Receives pupil data from Pupil Capture's network API on an own thread.
+
+    The thread blocks in a zmq.Poller until messages arrive, then drains all waiting messages
+    and decodes only the newest one per topic. So a backlog never builds up, even when
+    Pupil Capture sends faster than we consume."""
+
+    def __init__(
+        self,
+        ip="127.0.0.1",
+        port=50020,
+        timeout=0.3,
+        on_data: Optional[Callable[[dict, int], None]] = None,
+        topics=(b"pupil.0.2d", b"pupil.0.3d"),
+    ):
         self.ip = ip
         self.port = port
         self.timeout = timeout
+        self.on_data = on_data
+        self.topics = topics
 
         self.last_2d_data = None
         self.last_3d_data = None
@@ -19,6 +40,8 @@ class Pupil:
         self._ctx = None
         self._req_subscriber = None
         self._sub_subscriber = None
+        self._poller = None
+        self._unpacker = msgpack.Unpacker(raw=False)
 
     def start(self):
         self._running = True
@@ -36,24 +59,6 @@ class Pupil:
             "3d": self.last_3d_data,
         }
 
-    def _retry(self, func: callable, try_for_seconds=0):
-        end_time = datetime.now() + timedelta(seconds=try_for_seconds)
-        tried_once = False
-        result = None
-        error = None
-        while not tried_once or (result is None and datetime.now() < end_time):
-            try:
-                if tried_once:
-                    time.sleep(0.1)
-                result = func()
-            except Exception as e:
-                error = e
-            finally:
-                tried_once = True
-        if result is None:
-            raise error
-        return result
-
     def _disconnect(self):
         if self._req_subscriber is not None:
             self._req_subscriber.close()
@@ -67,6 +72,8 @@ class Pupil:
             self._ctx.term()
             self._ctx = None
 
+        self._poller = None
+        self._unpacker = msgpack.Unpacker(raw=False)  # drop whatever a failed decoding left behind
         self.last_2d_data = None
         self.last_3d_data = None
 
@@ -77,34 +84,69 @@ class Pupil:
         self._req_subscriber.connect(f"tcp://{self.ip}:{self.port}")
 
         self._req_subscriber.send_string("SUB_PORT")
-        sub_port = self._retry(
-            lambda: self._req_subscriber.recv_string(flags=zmq.NOBLOCK), try_for_seconds=self.timeout
-        )
+        if not self._req_subscriber.poll(int(self.timeout * 1000)):
+            raise TimeoutError(f"Pupil Capture did not answer on {self.ip}:{self.port}")
+        sub_port = self._req_subscriber.recv_string()
 
         self._sub_subscriber = self._ctx.socket(zmq.SUB)
         self._sub_subscriber.setsockopt(zmq.LINGER, 1000)
         self._sub_subscriber.connect(f"tcp://{self.ip}:{sub_port}")
-        self._sub_subscriber.subscribe("gaze.")
-        self._sub_subscriber.subscribe("pupil.")
+        for topic in self.topics:
+            self._sub_subscriber.subscribe(topic)
+
+        self._poller = zmq.Poller()
+        self._poller.register(self._sub_subscriber, zmq.POLLIN)
+
+    def _decode(self, topic: bytes, payload: bytes) -> dict:
+        """Decodes only the fields of the datum we use, all others are skipped."""
+        fields = DECODED_FIELDS[topic]
+        unpacker = self._unpacker
+        unpacker.feed(payload)
+        message = {}
+        for _ in range(unpacker.read_map_header()):
+            key = unpacker.unpack()
+            if key in fields:
+                message[key] = unpacker.unpack()
+            else:
+                unpacker.skip()
+        return message
+
+    def _handle_message(self, topic: bytes, payload: bytes, timestamp_ns: int = None):
+        if topic not in DECODED_FIELDS:
+            return
+        message = self._decode(topic, payload)
+        if topic == b"pupil.0.2d":
+            self.last_2d_data = message
+        if topic == b"pupil.0.3d":
+            self.last_3d_data = message
+        if self.on_data is not None:
+            self.on_data(self.get_last_data(), timestamp_ns if timestamp_ns is not None else time.monotonic_ns())
 
     def _subscribe_and_consume(self):
+        newest_payloads = {}
         while self._running:
             try:
                 if not self._sub_subscriber:
                     self._connect()
 
-                topic, payload = self._retry(
-                    lambda: self._sub_subscriber.recv_multipart(flags=zmq.NOBLOCK),
-                    try_for_seconds=self.timeout,
-                )
-                message = msgpack.loads(payload)
-                print(message)
-                if topic == b"pupil.0.2d":
-                    self.last_2d_data = message
-                if topic == b"pupil.0.3d":
-                    self.last_3d_data = message
+                if not self._poller.poll(int(self.timeout * 1000)):
+                    raise TimeoutError("Pupil Capture sent no data")
+                timestamp_ns = time.monotonic_ns()
+
+                # drain everything that is waiting, only the newest message per topic counts
+                while True:
+                    try:
+                        topic, payload = self._sub_subscriber.recv_multipart(flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    newest_payloads[topic] = payload
+
+                for topic, payload in newest_payloads.items():
+                    self._handle_message(topic, payload, timestamp_ns)
+                newest_payloads.clear()
 
             except Exception:
+                newest_payloads.clear()
                 self._disconnect()
 
         self._disconnect()
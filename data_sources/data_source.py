@@ -1,12 +1,30 @@
+import threading
+import time
 from abc import ABC, abstractmethod
 from misc import Vector
-from typing import Optional
+from typing import Callable, Optional
+
+VectorCallback = Callable[[Vector, int], None]
 
 
 class DataSource(ABC):
     """Provides any kind of two-dimensional vector.
     This vector could be the coordinates of the mouse position
-    or the rotation angles of an eye."""
+    or the rotation angles of an eye.
+
+    A DataSource pushes every new vector via `_publish_vector`. Consumers either
+    subscribe to it or block in `get_next_vector` until the next vector arrives.
+    Implementations call `_mark_started` in `start` and `_mark_stopped` in `stop`, which
+    wakes up the consumers blocked in `get_next_vector`."""
+
+    def __init__(self):
+        self._vector_condition = threading.Condition()
+        self._last_vector: Optional[Vector] = None
+        self._last_timestamp_ns: Optional[int] = None
+        self._published_count = 0
+        self._consumed_count = 0
+        self._subscribers: list[VectorCallback] = []
+        self._stopped = False
 
     @abstractmethod
     def start(self):
@@ -18,8 +36,78 @@ class DataSource(ABC):
         """Stops the DataSource."""
         pass
 
-    @abstractmethod
-    def get_next_vector(self, timeout_in_ms: int) -> Optional[Vector]:
-        """Gets the current vector, if one is available.
-        Returns None if the DataSource is not running or we hit the timeout."""
-        pass
+    def subscribe(self, callback: VectorCallback):
+        """Calls `callback(vector, timestamp_ns)` for every new vector.
+        The callback runs on the thread that received the vector, so it has to be fast.
+        The timestamp is taken from `time.monotonic_ns()`."""
+        with self._vector_condition:
+            self._subscribers = self._subscribers + [callback]
+
+    def unsubscribe(self, callback: VectorCallback):
+        with self._vector_condition:
+            self._subscribers = [s for s in self._subscribers if s is not callback]
+
+    def get_next_vector(self, timeout_in_ms: Optional[int] = None) -> Optional[Vector]:
+        """Waits for a vector that has not been returned by this method before.
+        Returns None if the DataSource is not running or we hit the timeout.
+        A timeout of None waits forever."""
+        sample = self.get_next_sample(timeout_in_ms)
+        return sample[0] if sample is not None else None
+
+    def get_next_sample(self, timeout_in_ms: Optional[int] = None) -> Optional[tuple[Vector, int]]:
+        """Like `get_next_vector`, but returns the vector together with its timestamp."""
+        with self._vector_condition:
+            if self._published_count == self._consumed_count:
+                timeout = None if timeout_in_ms is None else timeout_in_ms / 1000
+                if not self._vector_condition.wait_for(
+                    lambda: self._stopped or self._published_count != self._consumed_count, timeout
+                ):
+                    return None
+                if self._published_count == self._consumed_count:
+                    return None  # stopped meanwhile
+            self._consumed_count = self._published_count
+            self._vector_condition.notify_all()
+            return self._last_vector, self._last_timestamp_ns
+
+    def get_last_vector(self) -> Optional[Vector]:
+        """Gets the most recent vector without waiting."""
+        return self._last_vector
+
+    def get_last_timestamp_ns(self) -> Optional[int]:
+        """Gets the `time.monotonic_ns()` timestamp of the most recent vector."""
+        return self._last_timestamp_ns
+
+    def _wait_until_consumed(self, timeout_in_ms: Optional[int] = None) -> bool:
+        """Waits until the last published vector got picked up by `get_next_vector`.
+        Returns False if we hit the timeout."""
+        timeout = None if timeout_in_ms is None else timeout_in_ms / 1000
+        with self._vector_condition:
+            return self._vector_condition.wait_for(
+                lambda: self._stopped or self._published_count == self._consumed_count, timeout
+            )
+
+    def _mark_started(self):
+        with self._vector_condition:
+            self._stopped = False
+
+    def _mark_stopped(self):
+        """Wakes up everyone waiting in `get_next_vector` and `_wait_until_consumed`."""
+        with self._vector_condition:
+            self._stopped = True
+            self._vector_condition.notify_all()
+
+    def _publish_vector(self, vector: Optional[Vector], timestamp_ns: int = None):
+        """Hands a new vector to all waiting and subscribed consumers.
+        None vectors are dropped, they mean that the client has no usable data."""
+        if vector is None:
+            return
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        with self._vector_condition:
+            self._last_vector = vector
+            self._last_timestamp_ns = timestamp_ns
+            self._published_count += 1
+            subscribers = self._subscribers
+            self._vector_condition.notify_all()
+        for subscriber in subscribers:
+            subscriber(vector, timestamp_ns)
@@ -1,20 +1,23 @@
-from typing import Optional
-
+import config
 from data_sources.data_source import DataSource
-from misc import Vector
 from data_sources.clients.eyetrackvr import EyeTrackVR
 
 
 class EyeTrackVRDataSource(DataSource):
-    def __init__(self):
-        self.eyetrackvr = EyeTrackVR()
+    def __init__(self, eye: str = config.EYETRACKVR_EYE):
+        super().__init__()
+        self.eye = eye
+        self.eyetrackvr = EyeTrackVR(on_data=self._on_data, addresses=config.EYETRACKVR_ADDRESSES)
 
     def start(self):
+        self._mark_started()
         self.eyetrackvr.start()
 
     def stop(self):
+        self._mark_stopped()
         self.eyetrackvr.stop()
 
-    def get_next_vector(self) -> Optional[Vector]:
-        x, y = self.eyetrackvr.get_last_data()
-        return (x, y) if x and y else None
+    def _on_data(self, eye: str, x: float, y: float, timestamp_ns: int):
+        # zero is a valid value, e.g. when looking straight ahead
+        if eye == self.eye:
+            self._publish_vector((x, y), timestamp_ns)
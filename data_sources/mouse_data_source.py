@@ -1,17 +1,38 @@
-from misc import Vector
+import threading
 from typing import Optional
-import pyautogui
 
+import config
+from cursors import create_cursor_backend
 from data_sources.data_source import DataSource
 
 
 class MouseDataSource(DataSource):
+    """The mouse has no push mechanism, so its position is sampled on an own thread."""
+
+    def __init__(self):
+        super().__init__()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
 
     def start(self):
-        pass
+        self._mark_started()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
 
     def stop(self):
-        pass
+        self._mark_stopped()
+        self._stop_event.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1)
 
-    def get_next_vector(self) -> Optional[Vector]:
-        return pyautogui.position()
+    def _sample_loop(self):
+        interval = 1 / config.MOUSE_DATA_SOURCE_RATE_IN_HZ
+        # an own backend, so it is never used by another thread at the same time
+        cursor_backend = create_cursor_backend()
+        try:
+            while not self._stop_event.is_set():
+                self._publish_vector(cursor_backend.position())
+                self._stop_event.wait(interval)
+        finally:
+            cursor_backend.close()
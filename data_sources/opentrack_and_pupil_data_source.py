@@ -11,18 +11,21 @@ from misc import Vector
 class OpentrackAndPupilDataSource(DataSource):
 
     def __init__(self):
-        self.opentrack = Opentrack()
-        self.pupil = Pupil()
+        super().__init__()
+        self.opentrack = Opentrack(on_data=lambda *_: self._publish_vector(self._to_vector()))
+        self.pupil = Pupil(on_data=lambda *_: self._publish_vector(self._to_vector()), topics=(b"pupil.0.3d",))
 
     def start(self):
+        self._mark_started()
         self.opentrack.start()
         self.pupil.start()
 
     def stop(self):
+        self._mark_stopped()
         self.opentrack.stop()
         self.pupil.stop()
 
-    def get_next_vector(self) -> Optional[Vector]:
+    def _to_vector(self) -> Optional[Vector]:
         """
         example data:
         head:
@@ -8,14 +8,18 @@ from misc import Vector
 class OpentrackDataSource(DataSource):
 
     def __init__(self):
-        self.opentrack = Opentrack()
+        super().__init__()
+        self.opentrack = Opentrack(
+            on_data=lambda head, timestamp_ns: self._publish_vector(self._to_vector(head), timestamp_ns)
+        )
 
     def start(self):
+        self._mark_started()
         self.opentrack.start()
 
     def stop(self):
+        self._mark_stopped()
         self.opentrack.stop()
 
-    def get_next_vector(self) -> Optional[Vector]:
-        head = self.opentrack.get_last_data()
+    def _to_vector(self, head) -> Optional[Vector]:
         return (head["yaw"], head["pitch"]) if head is not None else None
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import config
 from data_sources.clients.orlosky import Orlosky
 from data_sources.data_source import DataSource
 from misc import Vector
@@ -7,16 +8,21 @@ from misc import Vector
 
 class OrloskyDataSource(DataSource):
     def __init__(self):
-        self.orlosky = Orlosky()
+        super().__init__()
+        self.orlosky = Orlosky(
+            on_data=lambda data: self._publish_vector(self._to_vector(data)),
+            tracker_command=config.ORLOSKY_TRACKER_COMMAND,
+        )
 
     def start(self):
+        self._mark_started()
         self.orlosky.start()
 
     def stop(self):
+        self._mark_stopped()
         self.orlosky.stop()
 
-    def get_next_vector(self) -> Optional[Vector]:
-        last_data = self.orlosky.get_last_data()
+    def _to_vector(self, last_data) -> Optional[Vector]:
         if not last_data:
             return None
 
@@ -7,14 +7,20 @@ from misc import Vector
 
 class PupilDataSource(DataSource):
     def __init__(self):
-        self.pupil = Pupil()
+        super().__init__()
+        self.pupil = Pupil(
+            on_data=lambda data, timestamp_ns: self._publish_vector(self._to_vector(data), timestamp_ns),
+            topics=(b"pupil.0.3d",),
+        )
 
     def start(self):
+        self._mark_started()
         self.pupil.start()
 
     def stop(self):
+        self._mark_stopped()
         self.pupil.stop()
 
-    def get_next_vector(self) -> Optional[Vector]:
-        last_data = self.pupil.get_last_data()["3d"]
+    def _to_vector(self, data) -> Optional[Vector]:
+        last_data = data["3d"]
         return (last_data["theta"], last_data["phi"]) if last_data else None
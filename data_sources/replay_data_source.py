@@ -0,0 +1,62 @@
+import threading
+import time
+import tkinter.filedialog as fd
+from typing import Optional
+
+from data_sources.data_source import DataSource
+from recording import open_recording
+
+
+class ReplayDataSource(DataSource):
+    """Plays back a recording made with `--record`.
+
+    The recording is memory-mapped, so even long sessions are not loaded into RAM.
+    With `realtime`, samples are played back with their original timing. Otherwise they are
+    played back as fast as the pipeline picks them up."""
+
+    CHUNK_SIZE = 4096
+
+    def __init__(self, path: str = None, realtime: bool = True, timeout_in_ms: int = 1000):
+        super().__init__()
+        self.path = path
+        self.realtime = realtime
+        self.timeout_in_ms = timeout_in_ms
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.path is None:
+            self.path = fd.askopenfilename(title="Select a Miranda recording") or None
+            if self.path is None:
+                return
+        self._mark_started()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._replay, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._mark_stopped()
+        self._stop_event.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1)
+
+    def _replay(self):
+        records = open_recording(self.path)
+        if records is None:
+            return
+
+        first_timestamp_ns = int(records[0]["timestamp_ns"])
+        start_ns = time.monotonic_ns()
+        # the records are read in chunks, so only one chunk at a time is paged in and converted
+        for chunk_start in range(0, len(records), self.CHUNK_SIZE):
+            chunk = records[chunk_start : chunk_start + self.CHUNK_SIZE]
+            for timestamp_ns, x, y in zip(chunk["timestamp_ns"].tolist(), chunk["x"].tolist(), chunk["y"].tolist()):
+                if self._stop_event.is_set():
+                    return
+                if self.realtime:
+                    delay_ns = (timestamp_ns - first_timestamp_ns) - (time.monotonic_ns() - start_ns)
+                    if delay_ns > 0 and self._stop_event.wait(delay_ns / 1_000_000_000):
+                        return
+                else:
+                    self._wait_until_consumed(self.timeout_in_ms)
+                self._publish_vector((x, y))
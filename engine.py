@@ -0,0 +1,532 @@
+import time
+import traceback
+from threading import Thread
+from typing import Callable, Optional
+
+import numpy as np
+import screeninfo
+
+import calibration
+import config
+from calibration import CalibrationResult
+from data_sources import data_sources
+from data_sources.data_source import DataSource
+from filters import create_filters
+from filters.filter import Filter
+from gaze_classifier import GazeClassifier, GazeEventType
+from latency import LatencyTracker
+from misc import Vector
+from monitors import Monitor, MonitorLayout
+from mouse_movement import MouseMovement, MouseMovements, MouseMovementType
+from publishers import publishers
+from publishers.publisher import Publisher
+from publishers.publisher_worker import PublisherWorker
+from recording import Recorder
+from resampler import Resampler
+from sample_buffer import SampleBuffer
+from tracking_approaches import tracking_approaches
+from tracking_approaches.tracking_approach import TrackingApproach
+
+EngineCallback = Callable[[Optional[Vector], Optional[Vector]], None]
+GazeEventCallback = Callable[[GazeEventType, GazeClassifier], None]
+
+
+class Engine:
+    """Runs the pipeline DataSource -> TrackingApproach -> Publisher independent of any GUI.
+
+    The engine owns the selected components and the calibration state. GUIs are optional
+    observers: they register via `on_update` and get called with the latest data source vector
+    and the resulting mouse position after every sample. Observers are called from the engine's
+    thread, so they have to hand over to their own thread if needed."""
+
+    def __init__(
+        self,
+        monitor=None,
+        monitor_selection: str = config.CALIBRATION_MONITOR,
+        latency_tracker: LatencyTracker = None,
+        data_source_arguments: dict[str, dict] = None,
+        recording_path: str = None,
+        fast_path: bool = config.FAST_PATH_ENABLED,
+        publisher_workers: bool = config.PUBLISHER_WORKERS_ENABLED,
+    ):
+        self.selected_data_source: Optional[str] = None
+        self.selected_tracking_approach: Optional[str] = None
+        self.selected_publisher: Optional[str] = None
+
+        self.data_source: Optional[DataSource] = None
+        self.tracking_approach: Optional[TrackingApproach] = None
+        self.publisher: Optional[Publisher] = None
+
+        # keyword arguments for creating a data source, by data source key
+        self.data_source_arguments = data_source_arguments if data_source_arguments is not None else {}
+
+        self.calibration_result: Optional[CalibrationResult] = None
+        # the calibration the pipeline runs with for testing, till it is committed or rolled back
+        self.previewed_calibration_result: Optional[CalibrationResult] = None
+        # the calibrated states of tracking approaches, so switching back and forth needs no recomputation
+        self.compiled_calibrations = calibration.CompiledCalibrationCache()
+
+        # records all raw samples of the data sources when given
+        self.recording_path = recording_path
+        self.recorder: Optional[Recorder] = None
+
+        # the full-rate history of the current data source
+        self.sample_buffer = SampleBuffer(config.SAMPLE_HISTORY_IN_SEC * config.SAMPLE_HISTORY_MAX_RATE_IN_HZ)
+
+        # optional instrumentation of the per-stage latencies, None when disabled
+        self.latency_tracker = latency_tracker
+
+        # smooth the mouse positions, created per data source
+        self.filters: list[Filter] = []
+        self._filtered_mouse_position = [0.0, 0.0]
+
+        # runs publishers on own threads, so they never stall the loop
+        self.publisher_workers = publisher_workers
+
+        # labels fixations, saccades and signal loss in the stream of mouse positions
+        self.gaze_classifier = GazeClassifier()
+        # publish only the centroids of fixations, for the publishers in FIXATION_ONLY_PUBLISHERS
+        self.publish_fixations_only = False
+        self._published_fixation_start_ns: Optional[int] = None
+        self._published_fixation_centroid = [0.0, 0.0]
+
+        # publishes on a fixed output clock for the publishers configured in RESAMPLER_OUTPUT_RATES_IN_HZ
+        self.resampler: Optional[Resampler] = None
+
+        # while paused, mouse positions are still computed and passed to observers, but not published
+        self.publishing_paused = False
+
+        # the monitors of the desktop, only the given one when a monitor is given
+        self.monitors_detected = monitor is None
+        # without a display, mouse positions get mapped onto the screen stored with the calibration
+        self.screen_from_calibration = False
+        if monitor is not None:
+            self.monitor_layout = MonitorLayout([Monitor.of(monitor)])
+        else:
+            try:
+                self.monitor_layout = MonitorLayout()
+            except screeninfo.ScreenInfoError:
+                print("No display found, using the screen stored with the calibration.")
+                self.monitors_detected = False
+                self.screen_from_calibration = True
+                self.monitor_layout = MonitorLayout([Monitor(0, 0, 1920, 1080, is_primary=True)])
+        self.monitor_selection = monitor_selection
+        # the monitor mouse positions are mapped onto and calibrations are done on, see `select_monitor`.
+        # Mouse positions are in pixels of the desktop spanning all monitors.
+        # Replaced as a whole, never changed in place.
+        self.monitor = self.monitor_layout.get(monitor_selection)
+        self.last_data_source_vector: Optional[Vector] = None
+        self.last_mouse_position = list(self.monitor.to_screen((0, 0)))
+
+        # In the fast path, every sample is written into these preallocated structures.
+        # Observers and publishers get the same mouse position list for every sample,
+        # so they must not keep a reference to it.
+        self.fast_path = fast_path
+        self._mouse_movement = MouseMovement(MouseMovementType.TO_POSITION, [0.0, 0.0])
+
+        self._observers: list[EngineCallback] = []
+        self._gaze_observers: list[GazeEventCallback] = []
+        self._running = False
+        self._thread: Optional[Thread] = None
+
+    def on_update(self, func: EngineCallback):
+        self._observers.append(func)
+
+    def on_gaze_event(self, func: GazeEventCallback):
+        """Registers an observer of the gaze classification, called for every classified mouse position
+        and on signal loss with the label and the classifier holding the current fixation."""
+        self._gaze_observers.append(func)
+
+    def reload_data_source(self, data_source_key: str):
+        self.set_data_source(
+            data_source_key,
+            data_sources[data_source_key].clazz(**self.data_source_arguments.get(data_source_key, {})),
+        )
+
+    def set_data_source(self, data_source_key: str, data_source: DataSource):
+        """Replaces the current data source by the given one and starts it."""
+        self.selected_data_source = data_source_key
+        if self.data_source is not None:
+            self.data_source.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+        self.data_source = data_source
+        self.filters = create_filters(data_source_key)
+        self.sample_buffer.clear()
+        self.data_source.subscribe(self.sample_buffer.append)
+        if self.recording_path is not None:
+            self.recorder = Recorder(self.recording_path, self.selected_data_source)
+            self.recorder.start()
+            self.data_source.subscribe(self.recorder.record)
+        self.data_source.start()
+
+    def reload_tracking_approach(self, tracking_approach_key: str):
+        self.selected_tracking_approach = tracking_approach_key
+        self.tracking_approach = tracking_approaches[self.selected_tracking_approach].clazz()
+
+    def reload_publisher(self, publisher_key: str):
+        self.set_publisher(publisher_key, publishers[publisher_key].clazz())
+
+    def set_publisher(self, publisher_key: str, publisher: Publisher):
+        """Replaces the current publisher by the given one and starts it.
+        If publisher workers are enabled, it runs behind a `PublisherWorker`."""
+        self.selected_publisher = publisher_key
+        if self.resampler is not None:
+            self.resampler.stop()
+            self.resampler = None
+        if self.publisher is not None:
+            self.publisher.stop()
+        if self.publisher_workers and not isinstance(publisher, PublisherWorker):
+            publisher = PublisherWorker(publisher, config.PUBLISHER_QUEUE_SIZES.get(publisher_key, 1))
+        self.publisher = publisher
+        self.publisher.start()
+        self.publish_fixations_only = publisher_key in config.FIXATION_ONLY_PUBLISHERS
+        self._published_fixation_start_ns = None
+        # fixation centroids are steady already, interpolating between them makes no sense
+        if publisher_key in config.RESAMPLER_OUTPUT_RATES_IN_HZ and not self.publish_fixations_only:
+            self.resampler = Resampler(
+                config.RESAMPLER_OUTPUT_RATES_IN_HZ[publisher_key],
+                self._push_resampled,
+                lead_time_ns=int(config.RESAMPLER_LEAD_TIME_IN_MILLISEC * 1_000_000),
+                max_extrapolation_ns=int(config.RESAMPLER_MAX_EXTRAPOLATION_IN_MILLISEC * 1_000_000),
+                bounds=(self.monitor.x, self.monitor.y, self.monitor.right, self.monitor.bottom),
+            )
+            self.resampler.start()
+
+    def _push_resampled(self, mouse_position: Vector):
+        if not self.publishing_paused:
+            self.publisher.push(mouse_position)
+
+    def select_monitor(self, monitor_selection: str):
+        """Maps the mouse positions onto the selected monitor, see `MonitorLayout.get`.
+        Every monitor has its own calibration, so `reload_calibration_result` has to follow."""
+        self.monitor_selection = monitor_selection
+        self._set_monitor(self.monitor_layout.get(monitor_selection))
+
+    def refresh_monitor_layout(self) -> bool:
+        """Reads the monitors again, e.g. after a resolution change. Returns True if they changed,
+        then `reload_calibration_result` has to follow."""
+        if not self.monitor_layout.refresh():
+            return False
+        self._set_monitor(self.monitor_layout.get(self.monitor_selection))
+        return True
+
+    def _set_monitor(self, monitor: Monitor):
+        self.monitor = monitor
+        self.last_mouse_position = list(monitor.to_screen((0, 0)))
+        if self.resampler is not None:
+            self.resampler.bounds = (monitor.x, monitor.y, monitor.right, monitor.bottom)
+            self.resampler.reset()
+
+    def _monitor_id(self) -> Optional[str]:
+        """Identifies the calibration results of the monitor, None for the primary monitor."""
+        if not self.monitors_detected:
+            # the given or stored screen has no name, so the selection tells the results apart
+            return None if self.monitor_selection == "primary" else self.monitor_selection
+        return None if self.monitor is self.monitor_layout.primary else self.monitor.id
+
+    def publisher_summary(self) -> Optional[dict]:
+        """The queue and timing counters of the publisher worker, None without one."""
+        if isinstance(self.publisher, PublisherWorker):
+            return self.publisher.summary()
+        return None
+
+    def reload_calibration_result(self) -> bool:
+        """Loads the stored calibration of the selected data source and tracking approach.
+        Returns True if there is one."""
+        self.calibration_result = None
+        self.previewed_calibration_result = None
+        self.last_mouse_position = list(self.monitor.to_screen((0, 0)))
+        self.reset_filters()
+        if self.resampler is not None:
+            self.resampler.reset()
+        self.gaze_classifier.reset()
+        if calibration.has_result(self.selected_data_source, self.selected_tracking_approach, self._monitor_id()):
+            self.calibration_result = calibration.load_result(
+                self.selected_data_source, self.selected_tracking_approach, self._monitor_id()
+            )
+            x, y, width, height = self.calibration_result.screen
+            if self.screen_from_calibration and width > 0 and height > 0:
+                screen = Monitor(x, y, width, height, is_primary=True, spans=self.monitor_selection == "all")
+                self.monitor_layout = MonitorLayout([screen])
+                self._set_monitor(screen)
+            self.apply_calibration_result(self.calibration_result)
+        return self.calibration_result is not None
+
+    def save_calibration_result(self, calibration_result: CalibrationResult):
+        """Stores the calibration the tracking approach got calibrated with last as the current one."""
+        calibration_result.screen = self.monitor.key
+        calibration.save_result(
+            self.selected_data_source, self.selected_tracking_approach, calibration_result, self._monitor_id()
+        )
+        self.calibration_result = calibration_result
+        # compiled from the result, since the current snapshot may be drift corrected already
+        compiled_calibration = self.tracking_approach.compile_calibration(calibration_result)
+        if compiled_calibration is not None:
+            self.compiled_calibrations.put(self._compiled_calibration_key(calibration_result), compiled_calibration)
+
+    def preview_calibration_result(self, calibration_result: CalibrationResult):
+        """Runs the pipeline with the given calibration without storing it. The pipeline switches
+        to it with a single reference swap. `commit_calibration_result` stores it,
+        `rollback_calibration_result` switches back to the stored calibration."""
+        compiled_calibration = self.tracking_approach.compile_calibration(calibration_result)
+        if compiled_calibration is not None:
+            self.tracking_approach.set_compiled_calibration(compiled_calibration)
+        else:
+            self.tracking_approach.calibrate(calibration_result)
+        self.previewed_calibration_result = calibration_result
+
+    def commit_calibration_result(self):
+        if self.previewed_calibration_result is not None:
+            self.save_calibration_result(self.previewed_calibration_result)
+            self.previewed_calibration_result = None
+
+    def rollback_calibration_result(self):
+        if self.previewed_calibration_result is None:
+            return
+        self.previewed_calibration_result = None
+        if self.calibration_result is not None:
+            self.apply_calibration_result(self.calibration_result)
+        elif self.tracking_approach.get_compiled_calibration() is not None:
+            self.tracking_approach.set_compiled_calibration(None)
+        else:
+            # the tracking approach can't be uncalibrated, so it gets replaced by an uncalibrated one
+            self.tracking_approach = tracking_approaches[self.selected_tracking_approach].clazz()
+
+    def add_correspondence(self, vector: Vector, target: Vector) -> bool:
+        """Corrects the drift of the calibration with a data source vector and the target the user
+        looked at meanwhile, see `TrackingApproach.add_correspondence`."""
+        if not config.DRIFT_CORRECTION_ENABLED:
+            return False
+        return self.tracking_approach.add_correspondence(vector, target)
+
+    def add_screen_correspondence(self, screen_position: Vector, start_ns: int, end_ns: int) -> bool:
+        """Corrects the drift of the calibration with a position on the screen the user looked at from
+        `start_ns` to `end_ns`, e.g. a gaze button that got triggered by a fixation on it.
+        Only for tracking approaches with targets on the screen, with `DRIFT_CORRECTION_FROM_INTERACTIONS`,
+        and not while a calibration is previewed, which is no stored one to correct yet."""
+        if (
+            not config.DRIFT_CORRECTION_FROM_INTERACTIONS
+            or not self.tracking_approach.has_screen_targets
+            or self.previewed_calibration_result is not None
+        ):
+            return False
+        _, vectors = self.sample_buffer.window(start_ns, end_ns)
+        if len(vectors) == 0:
+            return False
+        vector, _, _ = calibration.estimate_calibration_vector(vectors)
+        return self.add_correspondence(vector, self.monitor.from_screen(screen_position))
+
+    def list_calibration_history(self) -> list[int]:
+        """The creation timestamps of the previous calibrations of the selected data source, tracking approach
+        and monitor, the newest first."""
+        return calibration.list_history(self.selected_data_source, self.selected_tracking_approach, self._monitor_id())
+
+    def restore_calibration_result(self, created_ns: int):
+        """Makes the previous calibration with the given creation timestamp the current one again,
+        see `calibration.list_history`."""
+        self.calibration_result = calibration.restore_result(
+            self.selected_data_source, self.selected_tracking_approach, created_ns, self._monitor_id()
+        )
+        self.apply_calibration_result(self.calibration_result)
+
+    def _compiled_calibration_key(self, calibration_result: CalibrationResult) -> tuple:
+        return (
+            self.selected_data_source,
+            self.selected_tracking_approach,
+            self.monitor.key,
+            calibration_result.created_ns,
+        )
+
+    def apply_calibration_result(self, calibration_result: CalibrationResult):
+        """Calibrates the tracking approach, from the cache if it got calibrated with the result before."""
+        key = self._compiled_calibration_key(calibration_result)
+        compiled_calibration = self.compiled_calibrations.get(key)
+        if compiled_calibration is None:
+            compiled_calibration = self.tracking_approach.compile_calibration(calibration_result)
+            if compiled_calibration is None:
+                self.tracking_approach.calibrate(calibration_result)
+                return
+            self.compiled_calibrations.put(key, compiled_calibration)
+        self.tracking_approach.set_compiled_calibration(compiled_calibration)
+
+    def reset_filters(self):
+        for position_filter in self.filters:
+            position_filter.reset()
+
+    def start(self):
+        self._running = True
+        self._thread = Thread(target=self._loop)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        if self.data_source is not None:
+            self.data_source.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+        if self.resampler is not None:
+            self.resampler.stop()
+        if self.publisher is not None:
+            self.publisher.stop()
+
+    def _loop(self):
+        while self._running:
+            try:
+                sample = self.data_source.get_next_sample(config.DATA_SOURCE_TIMEOUT_IN_MILLISEC)
+                if sample is None:
+                    self.process_vector(None)
+                else:
+                    self.process_vector(*sample)
+            except Exception:
+                traceback.print_exc()
+                time.sleep(config.LOOP_SLEEP_IN_MILLISEC / 1000)
+
+    def process_vector(self, vector: Optional[Vector], received_ns: int = None):
+        """Runs one data source vector through the tracking approach and the publisher.
+        `received_ns` is the `time.monotonic_ns()` timestamp of when the data source received the vector."""
+        latency_tracker = self.latency_tracker
+        if latency_tracker is not None:
+            picked_up_ns = time.monotonic_ns()
+        self.last_data_source_vector = vector
+        mouse_position = None
+        gaze_event_type = None
+        if vector is None:
+            # the signal got lost, old positions must not pull on the next ones
+            self.reset_filters()
+        # read once, the calibration of the tracking approach may be swapped by another thread meanwhile
+        tracking_approach = self.tracking_approach
+        if vector is not None and tracking_approach.is_calibrated():
+            if self.fast_path:
+                if tracking_approach.update_mouse_movement(vector, self._mouse_movement):
+                    self.update_mouse_position(self._mouse_movement, self.last_mouse_position)
+                    mouse_position = self.last_mouse_position
+            else:
+                mouse_movement = tracking_approach.get_next_mouse_movement(vector)
+                if mouse_movement is not None:
+                    self.last_mouse_position = self.get_new_mouse_position(mouse_movement, self.last_mouse_position)
+                    mouse_position = self.last_mouse_position
+
+            timestamp_ns = received_ns if received_ns is not None else time.monotonic_ns()
+            if mouse_position is not None and self.filters:
+                # filtered in a copy, the BY movements continue from the unfiltered position
+                filtered_mouse_position = self._filtered_mouse_position
+                filtered_mouse_position[0] = mouse_position[0]
+                filtered_mouse_position[1] = mouse_position[1]
+                for position_filter in self.filters:
+                    position_filter.apply(filtered_mouse_position, timestamp_ns)
+                mouse_position = filtered_mouse_position
+
+            if mouse_position is not None:
+                gaze_event_type = self.gaze_classifier.classify(mouse_position, timestamp_ns)
+                if latency_tracker is not None:
+                    transformed_ns = time.monotonic_ns()
+                published = False
+                if self.resampler is not None:
+                    # the resampler publishes on its own clock and skips publishing while paused
+                    self.resampler.add(mouse_position, timestamp_ns)
+                    published = True
+                elif not self.publishing_paused:
+                    if not self.publish_fixations_only:
+                        self.publisher.push(mouse_position)
+                        published = True
+                    elif self._has_new_fixation_centroid():
+                        self.publisher.push(self.gaze_classifier.fixation_centroid)
+                        published = True
+                if latency_tracker is not None and received_ns is not None:
+                    published_ns = time.monotonic_ns() if published else None
+                    latency_tracker.record(received_ns, picked_up_ns, transformed_ns, published_ns)
+        elif vector is None:
+            gaze_event_type = self.gaze_classifier.signal_lost()
+        for observer in self._observers:
+            observer(vector, mouse_position)
+        if gaze_event_type is not None:
+            for gaze_observer in self._gaze_observers:
+                gaze_observer(gaze_event_type, self.gaze_classifier)
+
+    def _has_new_fixation_centroid(self) -> bool:
+        """True if a fixation got confirmed or its centroid moved since it was published last."""
+        gaze_classifier = self.gaze_classifier
+        if not gaze_classifier.is_fixation_confirmed():
+            return False
+        centroid = gaze_classifier.fixation_centroid
+        published_centroid = self._published_fixation_centroid
+        if (
+            gaze_classifier.fixation_start_ns == self._published_fixation_start_ns
+            and abs(centroid[0] - published_centroid[0]) < config.FIXATION_CENTROID_MIN_CHANGE_IN_PX
+            and abs(centroid[1] - published_centroid[1]) < config.FIXATION_CENTROID_MIN_CHANGE_IN_PX
+        ):
+            return False
+        self._published_fixation_start_ns = gaze_classifier.fixation_start_ns
+        published_centroid[0] = centroid[0]
+        published_centroid[1] = centroid[1]
+        return True
+
+    def scale_vector_to_screen(self, vector: Vector) -> Vector:
+        return self.monitor.to_screen(vector)
+
+    def get_new_mouse_position(self, mouse_movement: MouseMovement, last_mouse_position: Vector) -> Vector:
+        if mouse_movement.type == MouseMovementType.TO_POSITION:
+            new_mouse_position = self.scale_vector_to_screen(mouse_movement.vector)
+        if mouse_movement.type == MouseMovementType.BY:
+            new_mouse_position = [
+                last_mouse_position[0] + mouse_movement.vector[0] * config.MOUSE_SPEED_IN_PX,
+                last_mouse_position[1] - mouse_movement.vector[1] * config.MOUSE_SPEED_IN_PX,
+            ]
+            self.monitor.clamp_into(new_mouse_position)
+        return new_mouse_position
+
+    def update_mouse_position(self, mouse_movement: MouseMovement, mouse_position: list):
+        """The allocation-free counterpart of `get_new_mouse_position`: moves the given mouse position in place."""
+        monitor = self.monitor
+        if mouse_movement.type is MouseMovementType.TO_POSITION:
+            monitor.to_screen_into(mouse_movement.vector, mouse_position)
+        else:
+            mouse_position[0] += mouse_movement.vector[0] * config.MOUSE_SPEED_IN_PX
+            mouse_position[1] -= mouse_movement.vector[1] * config.MOUSE_SPEED_IN_PX
+            monitor.clamp_into(mouse_position)
+
+    def get_new_mouse_positions(self, mouse_movements: MouseMovements, last_mouse_position: Vector) -> np.ndarray:
+        """The vectorized counterpart of `get_new_mouse_position`. Returns an (N, 2) array with the
+        mouse position after each of the MouseMovements. Where the mask of the MouseMovements is
+        False, the mouse stays at its previous position."""
+        n = len(mouse_movements)
+        mask = mouse_movements.mask
+        monitor = self.monitor
+        if mouse_movements.type == MouseMovementType.TO_POSITION:
+            new_mouse_positions = np.empty((n, 2), dtype=np.float64)
+            new_mouse_positions[:, 0] = monitor.x + (mouse_movements.vectors[:, 0] + 1) * 0.5 * monitor.width
+            new_mouse_positions[:, 1] = monitor.y + (mouse_movements.vectors[:, 1] - 1) * 0.5 * -monitor.height
+            if not mask.all():
+                # carry the last valid position forward over masked vectors
+                last_valid = np.maximum.accumulate(np.where(mask, np.arange(n), -1))
+                new_mouse_positions = np.where(
+                    (last_valid >= 0)[:, None], new_mouse_positions[np.maximum(last_valid, 0)], last_mouse_position
+                )
+            return new_mouse_positions
+
+        steps = np.where(mask[:, None], mouse_movements.vectors, 0.0) * config.MOUSE_SPEED_IN_PX
+        steps[:, 1] *= -1
+        new_mouse_positions = np.asarray(last_mouse_position, dtype=np.float64) + np.cumsum(steps, axis=0)
+        lower = (monitor.x, monitor.y)
+        upper = (monitor.right, monitor.bottom)
+        out_of_screen = ((new_mouse_positions < lower) | (new_mouse_positions > upper)).any(axis=1)
+        if out_of_screen.any():
+            # clamping makes each position depend on the clamped previous one,
+            # so from the first clamped position on it is done step by step
+            first = int(np.argmax(out_of_screen))
+            for axis in (0, 1):
+                position = new_mouse_positions[first - 1, axis] if first > 0 else last_mouse_position[axis]
+                position, lower_axis, upper_axis = float(position), lower[axis], upper[axis]
+                clamped_positions = []
+                for step in steps[first:, axis].tolist():
+                    position += step
+                    if position < lower_axis:
+                        position = lower_axis
+                    elif position > upper_axis:
+                        position = upper_axis
+                    clamped_positions.append(position)
+                new_mouse_positions[first:, axis] = clamped_positions
+        return new_mouse_positions
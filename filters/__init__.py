@@ -0,0 +1,12 @@
+import config
+from filters.filter import Filter
+from filters.one_euro_filter import OneEuroFilter
+
+filters: dict[str, type[Filter]] = {
+    "one-euro": OneEuroFilter,
+}
+
+
+def create_filters(data_source_key: str) -> list[Filter]:
+    """Creates the filters `config.FILTERS` configures for the given data source, in order."""
+    return [filters[key](**arguments) for key, arguments in config.FILTERS.get(data_source_key, [])]
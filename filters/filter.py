@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+
+class Filter(ABC):
+    """Smoothes the stream of mouse positions between the tracking approach and the publisher.
+
+    A filter works in place on the mouse position and is driven by the timestamps
+    of the samples, so it behaves the same at any sample rate."""
+
+    @abstractmethod
+    def apply(self, mouse_position: list, timestamp_ns: int):
+        """Filters the given mouse position in place. `timestamp_ns` is the `time.monotonic_ns()`
+        timestamp of the sample the mouse position was computed from."""
+        pass
+
+    @abstractmethod
+    def reset(self):
+        """Forgets all previous positions, e.g. after the signal got lost."""
+        pass
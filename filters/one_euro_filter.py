@@ -0,0 +1,67 @@
+import math
+
+import config
+from filters.filter import Filter
+
+
+class OneEuroFilter(Filter):
+    """The 1€ filter by Casiez et al., a low-pass filter whose cutoff frequency follows the speed.
+
+    While the gaze rests, the cutoff is low and the jitter gets smoothed away. While the gaze moves,
+    the cutoff rises and the lag shrinks. `min_cutoff` (in Hz) sets the smoothing at rest, `beta`
+    how fast the cutoff rises with the speed (in pixels per second), `derivative_cutoff` (in Hz)
+    the smoothing of the speed itself. Both axes share the cutoff of the 2D speed, so the
+    smoothing does not depend on the direction of a movement.
+    See https://gery.casiez.net/1euro/"""
+
+    def __init__(
+        self,
+        min_cutoff: float = config.ONE_EURO_FILTER_MIN_CUTOFF_IN_HZ,
+        beta: float = config.ONE_EURO_FILTER_BETA,
+        derivative_cutoff: float = config.ONE_EURO_FILTER_DERIVATIVE_CUTOFF_IN_HZ,
+    ):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.derivative_cutoff = derivative_cutoff
+        self.reset()
+
+    def reset(self):
+        self._last_timestamp_ns = None
+        self._x = 0.0
+        self._y = 0.0
+        self._dx = 0.0
+        self._dy = 0.0
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1 / (2 * math.pi * cutoff)
+        return 1 / (1 + tau / dt)
+
+    def apply(self, mouse_position: list, timestamp_ns: int):
+        x = mouse_position[0]
+        y = mouse_position[1]
+        if self._last_timestamp_ns is None or timestamp_ns < self._last_timestamp_ns:
+            self._last_timestamp_ns = timestamp_ns
+            self._x = x
+            self._y = y
+            self._dx = 0.0
+            self._dy = 0.0
+            return
+        if timestamp_ns == self._last_timestamp_ns:
+            # the same sample again, there is no time to smooth over
+            mouse_position[0] = self._x
+            mouse_position[1] = self._y
+            return
+
+        dt = (timestamp_ns - self._last_timestamp_ns) / 1_000_000_000
+        self._last_timestamp_ns = timestamp_ns
+
+        alpha = self._alpha(self.derivative_cutoff, dt)
+        self._dx += alpha * ((x - self._x) / dt - self._dx)
+        self._dy += alpha * ((y - self._y) / dt - self._dy)
+
+        alpha = self._alpha(self.min_cutoff + self.beta * math.hypot(self._dx, self._dy), dt)
+        self._x += alpha * (x - self._x)
+        self._y += alpha * (y - self._y)
+        mouse_position[0] = self._x
+        mouse_position[1] = self._y
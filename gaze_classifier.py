@@ -0,0 +1,142 @@
+import math
+from enum import Enum
+from typing import Optional
+
+import config
+from misc import Vector
+
+
+class GazeEventType(Enum):
+    FIXATION = "fixation"
+    SACCADE = "saccade"
+    SIGNAL_LOSS = "signal_loss"
+
+
+class GazeClassifier:
+    """Labels a stream of timestamped gaze positions on the screen as fixations, saccades and signal loss.
+
+    Two methods are supported, both O(1) per sample:
+
+    - "ivt" (velocity threshold): a sample slower than `velocity_threshold` (in pixels per
+      second) relative to the previous one belongs to a fixation, a faster one is a saccade.
+      A fixation only ends after `min_saccade_samples` faster samples in a row. Fewer are
+      skipped as noise, so a single outlier doesn't reset the fixation.
+    - "idt" (dispersion threshold): a fixation grows as long as the dispersion of its samples,
+      (max x - min x) + (max y - min y), stays below `dispersion_threshold` (in pixels).
+      The first sample exceeding it starts the next candidate fixation.
+
+    The centroid and duration of the current fixation are kept up to date. A fixation counts as
+    confirmed once it lasted `min_fixation_duration_ns`; with "idt" shorter ones are saccades.
+    A gap of more than `max_gap_ns` between two samples is signal loss."""
+
+    def __init__(
+        self,
+        method: str = config.GAZE_CLASSIFIER_METHOD,
+        velocity_threshold: float = config.IVT_VELOCITY_THRESHOLD_IN_PX_PER_SEC,
+        min_saccade_samples: int = config.IVT_MIN_SACCADE_SAMPLES,
+        dispersion_threshold: float = config.IDT_DISPERSION_THRESHOLD_IN_PX,
+        min_fixation_duration_ns: int = config.MIN_FIXATION_DURATION_IN_MILLISEC * 1_000_000,
+        max_gap_ns: int = config.MAX_GAZE_SAMPLE_GAP_IN_MILLISEC * 1_000_000,
+    ):
+        assert method in ("ivt", "idt"), f"unknown method {method}"
+        self.method = method
+        self.velocity_threshold = velocity_threshold
+        self.min_saccade_samples = min_saccade_samples
+        self.dispersion_threshold = dispersion_threshold
+        self.min_fixation_duration_ns = min_fixation_duration_ns
+        self.max_gap_ns = max_gap_ns
+
+        self.event_type = GazeEventType.SIGNAL_LOSS
+        self.fixation_centroid = [0.0, 0.0]
+        self.fixation_start_ns: Optional[int] = None
+        self.fixation_duration_ns = 0
+        self.reset()
+
+    def reset(self):
+        self.event_type = GazeEventType.SIGNAL_LOSS
+        self.fixation_start_ns = None
+        self.fixation_duration_ns = 0
+        self._last_x = 0.0
+        self._last_y = 0.0
+        self._last_timestamp_ns: Optional[int] = None
+        # the samples in a row exceeding the velocity threshold
+        self._saccade_samples = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._count = 0
+        self._min_x = self._max_x = 0.0
+        self._min_y = self._max_y = 0.0
+
+    def is_fixation_confirmed(self) -> bool:
+        return self.event_type is GazeEventType.FIXATION and self.fixation_duration_ns >= self.min_fixation_duration_ns
+
+    def signal_lost(self) -> GazeEventType:
+        self.reset()
+        return self.event_type
+
+    def classify(self, position: Vector, timestamp_ns: int) -> GazeEventType:
+        """Classifies the next gaze position and returns its label."""
+        x = position[0]
+        y = position[1]
+        last_timestamp_ns = self._last_timestamp_ns
+        if last_timestamp_ns is not None and not 0 < timestamp_ns - last_timestamp_ns <= self.max_gap_ns:
+            self.reset()
+            last_timestamp_ns = None
+
+        if last_timestamp_ns is None:
+            self._start_fixation(x, y, timestamp_ns)
+            self.event_type = GazeEventType.FIXATION if self.method == "ivt" else GazeEventType.SACCADE
+        elif self.method == "ivt":
+            dt = (timestamp_ns - last_timestamp_ns) / 1_000_000_000
+            if math.hypot(x - self._last_x, y - self._last_y) / dt < self.velocity_threshold:
+                self._saccade_samples = 0
+                if self.event_type is not GazeEventType.FIXATION:
+                    self._start_fixation(self._last_x, self._last_y, last_timestamp_ns)
+                self._add_to_fixation(x, y, timestamp_ns)
+                self.event_type = GazeEventType.FIXATION
+            else:
+                self._saccade_samples += 1
+                if self.event_type is GazeEventType.FIXATION and self._saccade_samples < self.min_saccade_samples:
+                    # skipped, so the velocity of the next sample is measured from the fixation again
+                    return self.event_type
+                self.event_type = GazeEventType.SACCADE
+                self.fixation_start_ns = None
+                self.fixation_duration_ns = 0
+        else:
+            min_x = x if x < self._min_x else self._min_x
+            max_x = x if x > self._max_x else self._max_x
+            min_y = y if y < self._min_y else self._min_y
+            max_y = y if y > self._max_y else self._max_y
+            if (max_x - min_x) + (max_y - min_y) <= self.dispersion_threshold:
+                self._min_x, self._max_x, self._min_y, self._max_y = min_x, max_x, min_y, max_y
+                self._add_to_fixation(x, y, timestamp_ns)
+            else:
+                self._start_fixation(x, y, timestamp_ns)
+            if self.fixation_duration_ns >= self.min_fixation_duration_ns:
+                self.event_type = GazeEventType.FIXATION
+            else:
+                self.event_type = GazeEventType.SACCADE
+
+        self._last_x = x
+        self._last_y = y
+        self._last_timestamp_ns = timestamp_ns
+        return self.event_type
+
+    def _start_fixation(self, x: float, y: float, timestamp_ns: int):
+        self.fixation_start_ns = timestamp_ns
+        self.fixation_duration_ns = 0
+        self._sum_x = x
+        self._sum_y = y
+        self._count = 1
+        self._min_x = self._max_x = x
+        self._min_y = self._max_y = y
+        self.fixation_centroid[0] = x
+        self.fixation_centroid[1] = y
+
+    def _add_to_fixation(self, x: float, y: float, timestamp_ns: int):
+        self._sum_x += x
+        self._sum_y += y
+        self._count += 1
+        self.fixation_centroid[0] = self._sum_x / self._count
+        self.fixation_centroid[1] = self._sum_y / self._count
+        self.fixation_duration_ns = timestamp_ns - self.fixation_start_ns
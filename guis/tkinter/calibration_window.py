@@ -1,6 +1,6 @@
 import platform
 from tkinter import Canvas, Toplevel
-from typing import Callable
+from typing import Callable, Optional
 
 from PIL import Image
 from PIL.ImageTk import PhotoImage
@@ -9,6 +9,7 @@ import config
 from guis.tkinter.canvas_gaze_button import CanvasGazeButton
 from misc import Vector
 from guis.tkinter import COLORS
+from monitors import Monitor
 
 
 class CalibrationWindowButton:
@@ -20,8 +21,10 @@ class CalibrationWindowButton:
 
 
 class CalibrationWindow:
+    """Covers the given monitor, or the whole screen if none is given. Positions passed in and out
+    are in pixels of the desktop spanning all monitors, like the mouse positions of the engine."""
 
-    def __init__(self, root_window):
+    def __init__(self, root_window, monitor: Monitor = None):
         self.window = Toplevel(root_window)
         self.window.title(config.APP_FULL_NAME)
 
@@ -32,10 +35,25 @@ class CalibrationWindow:
             icon_image = Image.open(config.APP_ICON_LINUX)
             self.window.iconphoto(False, PhotoImage(icon_image))
 
-        self.window.attributes("-fullscreen", True)
-
-        self.screen_width = self.window.winfo_screenwidth()
-        self.screen_height = self.window.winfo_screenheight()
+        if monitor is None:
+            self.window.attributes("-fullscreen", True)
+            self.screen_x = 0
+            self.screen_y = 0
+            self.screen_width = self.window.winfo_screenwidth()
+            self.screen_height = self.window.winfo_screenheight()
+        else:
+            self.screen_x = monitor.x
+            self.screen_y = monitor.y
+            self.screen_width = monitor.width
+            self.screen_height = monitor.height
+            self.window.geometry(f"{monitor.width}x{monitor.height}{monitor.x:+d}{monitor.y:+d}")
+            if monitor.spans:
+                # window managers make fullscreen windows cover a single monitor
+                self.window.overrideredirect(True)
+            else:
+                # moved onto the monitor first, window managers make it fullscreen on its current monitor
+                self.window.update_idletasks()
+                self.window.attributes("-fullscreen", True)
 
         self.canvas = Canvas(
             self.window,
@@ -46,6 +64,10 @@ class CalibrationWindow:
         )
         self.canvas.pack()
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        self.click_callback: Optional[Callable[[Vector], None]] = None
+        self.mouse_point = self.canvas.create_oval(
+            0, 0, 0, 0, fill="white", outline="", state="hidden", tag="mouse_point"
+        )
         self.canvas_buttons: list[CanvasGazeButton] = []
         self.seconds_till_button_trigger = 3
 
@@ -88,10 +110,17 @@ class CalibrationWindow:
     def unset_debug_text(self):
         self.canvas.delete("debug_text")
 
+    def to_screen(self, canvas_position: Vector) -> Vector:
+        """The position on the desktop of a position on the canvas of the window."""
+        return (canvas_position[0] + self.screen_x, canvas_position[1] + self.screen_y)
+
+    def _to_canvas(self, vector: Vector) -> Vector:
+        return (vector[0] - self.screen_x, vector[1] - self.screen_y)
+
     def set_calibration_point(self, vector: Vector, text: str = None):
         self.unset_calibration_point()
-        x, y = vector
-        x_text, y_text = vector
+        x, y = self._to_canvas(vector)
+        x_text, y_text = x, y
         target_radius = 30
         radius = target_radius
 
@@ -125,22 +154,39 @@ class CalibrationWindow:
     def unset_calibration_point(self):
         self.canvas.delete("calibration_point")
 
-    def set_mouse_point(self, vector: Vector):
-        self.unset_mouse_point()
-        self._update_buttons(vector)
+    def set_mouse_point(self, vector: Vector, update_buttons: bool = True):
+        vector = self._to_canvas(vector)
+        if update_buttons:
+            self._update_buttons(vector)
         if self.window.winfo_exists():  # in case the window got closed by a button action
             radius = 5
             x, y = vector
-            self.canvas.create_oval(
-                x - radius, y - radius, x + radius, y + radius, fill="white", tag="mouse_point", outline=""
-            )
+            # created once, then only moved, and kept above what got drawn since
+            self.canvas.coords(self.mouse_point, x - radius, y - radius, x + radius, y + radius)
+            self.canvas.itemconfigure(self.mouse_point, state="normal")
+            self.canvas.tag_raise(self.mouse_point)
 
     def _update_buttons(self, vector: Vector):
         for button in self.canvas_buttons:
             button.update_progress_and_trigger(vector)
 
+    def update_buttons_with_fixation(
+        self, centroid: Optional[Vector], fixation_start_ns: int, duration_ns: int
+    ) -> Optional[CanvasGazeButton]:
+        """Returns the button which got triggered, if any."""
+        if centroid is not None:
+            centroid = self._to_canvas(centroid)
+        for button in self.canvas_buttons:
+            if button.update_progress_with_fixation(centroid, fixation_start_ns, duration_ns):
+                return button
+        return None
+
+    def on_click(self, func: Callable[[Vector], None]):
+        """Calls the function with the position of every click into the window."""
+        self.click_callback = func
+
     def unset_mouse_point(self):
-        self.canvas.delete("mouse_point")
+        self.canvas.itemconfigure(self.mouse_point, state="hidden")
 
     def set_image(self, path: str):
         self.unset_image()
@@ -191,6 +237,8 @@ class CalibrationWindow:
     def _on_canvas_click(self, mouse_click):
         x = mouse_click.x
         y = mouse_click.y
+        if self.click_callback is not None:
+            self.click_callback(self.to_screen((x, y)))
         for button in self.canvas_buttons:
             if button.is_vector_in_button((x, y)):
                 button.func()
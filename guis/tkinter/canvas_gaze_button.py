@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from random import random
 from tkinter import Canvas
+from typing import Optional
 
 from guis.tkinter import COLORS
 from misc import Vector
@@ -34,6 +35,7 @@ class CanvasGazeButton:
         self.progress_rect = None
         self.focus_start = None
         self.focus_end = None
+        self.triggered_fixation_start_ns = None
 
     def delete(self):
         self.canvas.delete(self.tag)
@@ -61,6 +63,32 @@ class CanvasGazeButton:
         elif self.focus_start is not None:
             self.reset_progress()
 
+    def update_progress_with_fixation(
+        self, centroid: Optional[Vector], fixation_start_ns: int, duration_ns: int
+    ) -> bool:
+        """Like `update_progress_and_trigger`, but the progress is the duration of the fixation
+        with the given centroid, so short glances and saccades over the button don't count.
+        A fixation triggers the button at most once. Without a fixation, `centroid` is None.
+        Returns True if the button got triggered."""
+        if (
+            centroid is not None
+            and fixation_start_ns != self.triggered_fixation_start_ns
+            and self.is_vector_in_button(centroid)
+        ):
+            progress = duration_ns / (self.seconds_till_trigger * 1_000_000_000)
+            self._redraw_progress_rect(progress)
+            if progress >= 1.0:
+                self.triggered_fixation_start_ns = fixation_start_ns
+                self.reset_progress()
+                self.func()
+                return True
+        else:
+            self._redraw_progress_rect(0.0)
+        return False
+
+    def center(self) -> Vector:
+        return ((self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2)
+
     def _redraw_progress_rect(self, progress: float):
         x1_progress_bar = self.x0 + int((self.x1 - self.x0) * progress)
         if x1_progress_bar < self.x0:
@@ -1,6 +1,5 @@
 from tkinter.ttk import Button, Frame, Label, Scrollbar
 from tkinter import Canvas
-from typing import Generic, TypeVar
 
 from PIL import Image
 from PIL.ImageTk import PhotoImage
@@ -9,18 +8,9 @@ from tkinter.constants import Y
 from tkinter.constants import LEFT, RIGHT, BOTH
 from guis.tkinter import COLORS
 from guis.tkinter.scrollable_frame import ScrollableFrame
+from plugins import PluginOption
 
-
-T = TypeVar("T")
-
-
-class DropdownOption:
-    def __init__(self, key: str, title: str, description: str, icon: str, clazz: Generic[T]):
-        self.key = key
-        self.title = title
-        self.description = description
-        self.icon = icon
-        self.clazz = clazz
+DropdownOption = PluginOption
 
 
 class Dropdown:
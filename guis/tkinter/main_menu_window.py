@@ -2,9 +2,8 @@ import platform
 import tkinter
 from tkinter import Canvas, Menu, Tk
 from tkinter.ttk import Button, Frame, Label
-from typing import Callable
+from typing import Callable, Optional
 
-import screeninfo
 from PIL import Image
 from PIL.ImageTk import PhotoImage
 
@@ -14,6 +13,7 @@ from guis.tkinter.about_window import AboutWindow
 from guis.tkinter.calibration_window import CalibrationWindow
 from guis.tkinter.dropdown import Dropdown, DropdownOption
 from misc import Vector, resource_path
+from monitors import Monitor, MonitorLayout
 
 MainMenuOption = DropdownOption
 
@@ -85,6 +85,7 @@ class MainMenuWindow:
         right_frame.pack(side="right", fill=tkinter.BOTH, expand=True, padx=20, pady=20)
 
         self.data_source_has_data_label = Label(left_frame)
+        self.data_source_has_data = None
         self.data_source_has_data_label.pack(anchor="w")
 
         self.calibration_results_label = Label(left_frame)
@@ -93,36 +94,52 @@ class MainMenuWindow:
         self.calibration_button = Button(left_frame, text="re-calibrate", command=self._start_calibration)
         self.calibration_button.pack(padx=12, pady=12)
 
-        monitor = screeninfo.get_monitors()[0]
-        preview_width = 350
-        self.preview_scale = preview_width / monitor.width
-        preview_height = self.preview_scale * monitor.height
+        self.drift_check_button = Button(left_frame, text="drift check", command=self._start_drift_check)
+        self.drift_check_button.pack(padx=12)
+
+        self.latency_label = Label(left_frame, justify="left")
+        self.latency_label.pack(anchor="w")
+
+        # shows all monitors, see `set_monitor_layout`
+        self.preview_width = 350
+        self.preview_scale = 1.0
         self.preview_canvas = Canvas(
             right_frame,
-            background=COLORS["canvas_bg"],
-            width=preview_width,
-            height=preview_height,
+            background=COLORS["bg"],
+            width=self.preview_width,
+            height=self.preview_width * 9 / 16,
             highlightthickness=0,
         )
         self.preview_canvas.pack(side="top", anchor="w")
-        self.preview_canvas.create_text(
-            preview_width // 2, preview_height // 2, text="Preview", font=("default", 24), fill=COLORS["bg"]
+        self.preview_canvas.bind("<Button-1>", self._on_preview_click)
+        self.preview_mouse_point = self.preview_canvas.create_oval(
+            0, 0, 0, 0, fill="white", outline="", state="hidden", tag="preview_mouse_point"
         )
 
+        self.monitor_label = Label(right_frame, justify="left")
+        self.monitor_label.pack(anchor="w", pady=6)
+        self.all_monitors_button = Button(right_frame, text="span all monitors", command=self._select_all_monitors)
+        self.all_monitors_button.pack(anchor="w")
+
+        self.monitor_layout: Optional[MonitorLayout] = None
+        self.calibration_monitor: Optional[Monitor] = None
+
         self.calibration_callback = None
+        self.drift_check_callback = None
+        self.monitor_callback = None
 
     def set_mouse_point(self, vector: Vector):
-        self.unset_mouse_point()
-        if vector is not None:
-            radius = 3
-            x = vector[0] * self.preview_scale
-            y = vector[1] * self.preview_scale
-            self.preview_canvas.create_oval(
-                x - radius, y - radius, x + radius, y + radius, fill="white", tag="preview_mouse_point", outline=""
-            )
+        if vector is None:
+            self.unset_mouse_point()
+            return
+        radius = 3
+        x, y = self._to_preview(vector)
+        # created once, then only moved
+        self.preview_canvas.coords(self.preview_mouse_point, x - radius, y - radius, x + radius, y + radius)
+        self.preview_canvas.itemconfigure(self.preview_mouse_point, state="normal")
 
     def unset_mouse_point(self):
-        self.preview_canvas.delete("preview_mouse_point")
+        self.preview_canvas.itemconfigure(self.preview_mouse_point, state="hidden")
 
     # data sources
 
@@ -157,28 +174,107 @@ class MainMenuWindow:
     def on_publisher_change_requested(self, func):
         self.publisher_dropdown.on_selection_changed(func)
 
+    # monitors
+
+    def set_monitor_layout(self, monitor_layout: MonitorLayout, calibration_monitor: Monitor):
+        """Draws the monitors into the preview, the one calibrations are done on highlighted.
+        Clicking a monitor requests it for calibration, see `on_monitor_change_requested`."""
+        self.monitor_layout = monitor_layout
+        self.calibration_monitor = calibration_monitor
+        bounds = monitor_layout.bounds
+        self.preview_scale = self.preview_width / bounds.width
+        self.preview_canvas.config(height=self.preview_scale * bounds.height)
+        self.preview_canvas.delete("preview_monitor")
+        for monitor in monitor_layout.monitors:
+            x0, y0 = self._to_preview((monitor.x, monitor.y))
+            x1, y1 = self._to_preview((monitor.right, monitor.bottom))
+            is_selected = calibration_monitor.spans or monitor.key == calibration_monitor.key
+            self.preview_canvas.create_rectangle(
+                x0 + 1,
+                y0 + 1,
+                x1 - 1,
+                y1 - 1,
+                fill=COLORS["canvas_bg"],
+                outline=COLORS["text"] if is_selected else "",
+                width=2,
+                tag="preview_monitor",
+            )
+            self.preview_canvas.create_text(
+                (x0 + x1) / 2,
+                (y0 + y1) / 2,
+                text="Preview",
+                font=("default", 18),
+                fill=COLORS["bg"],
+                tag="preview_monitor",
+            )
+        self.preview_canvas.tag_lower("preview_monitor")
+        if calibration_monitor.spans:
+            monitor_name = "all monitors"
+        else:
+            monitor_name = calibration_monitor.name or f"monitor {monitor_layout.monitors.index(calibration_monitor)}"
+        self.monitor_label.config(
+            text=f"calibrating on {monitor_name} ({calibration_monitor.width}x{calibration_monitor.height})"
+        )
+
+    def on_monitor_change_requested(self, func: Callable[[str], None]):
+        """Calls the function with the selection of the monitor, see `MonitorLayout.get`."""
+        self.monitor_callback = func
+
+    def _to_preview(self, vector: Vector) -> Vector:
+        bounds = self.monitor_layout.bounds if self.monitor_layout is not None else None
+        if bounds is None:
+            return (vector[0] * self.preview_scale, vector[1] * self.preview_scale)
+        return ((vector[0] - bounds.x) * self.preview_scale, (vector[1] - bounds.y) * self.preview_scale)
+
+    def _on_preview_click(self, mouse_click):
+        if self.monitor_layout is None or self.monitor_callback is None:
+            return
+        bounds = self.monitor_layout.bounds
+        monitor = self.monitor_layout.monitor_at(
+            (bounds.x + mouse_click.x / self.preview_scale, bounds.y + mouse_click.y / self.preview_scale)
+        )
+        if monitor is not None:
+            self.monitor_callback(str(self.monitor_layout.monitors.index(monitor)))
+
+    def _select_all_monitors(self):
+        if self.monitor_callback is not None:
+            self.monitor_callback("all")
+
     # the rest
 
     def set_has_calibration_result(self, has_result):
         self.calibration_results_label.config(text="✅︎ calibrated" if has_result else "❌ not yet calibrated.")
 
     def set_data_source_has_data(self, data_source_has_data):
+        if data_source_has_data == self.data_source_has_data:
+            return
+        self.data_source_has_data = data_source_has_data
         self.data_source_has_data_label.config(
             text="✅︎ receive data from data source." if data_source_has_data else "❌ receive no data from data source."
         )
 
+    def set_latency_text(self, text: str):
+        self.latency_label.config(text=text)
+
     def mainloop(self):
         self.window.mainloop()
 
     def on_calibration_requested(self, func):
         self.calibration_callback = func
 
+    def on_drift_check_requested(self, func):
+        self.drift_check_callback = func
+
     def after(self, milliseconds: int, func: Callable = None, *args):
         self.window.after(milliseconds, func, *args)
 
     def _start_calibration(self):
         if self.calibration_callback is not None:
-            self.calibration_callback(CalibrationWindow(self.window))
+            self.calibration_callback(CalibrationWindow(self.window, self.calibration_monitor))
+
+    def _start_drift_check(self):
+        if self.drift_check_callback is not None:
+            self.drift_check_callback(CalibrationWindow(self.window, self.calibration_monitor))
 
     def _open_about_window(self):
         self.about = AboutWindow(self.window)
@@ -0,0 +1,53 @@
+import time
+import traceback
+from typing import Callable
+
+# marks that no new state got submitted for a key since the last frame
+_NOTHING_NEW = object()
+
+
+class RenderScheduler:
+    """Hands states over from other threads, e.g. the engine's, to the Tk thread and renders them there,
+    at most `frame_rate_in_hz` times per second.
+
+    `submit` can be called from any thread and only stores the state, the latest one per key wins.
+    Every frame, the Tk thread calls the renderer of each key with a new state, once. So however fast
+    states come in, rendering never competes with them for more than the capped frame rate."""
+
+    def __init__(self, window, frame_rate_in_hz: float):
+        # anything with Tk's `after`, e.g. the main menu window
+        self.window = window
+        self.frame_interval_ns = int(1_000_000_000 / frame_rate_in_hz)
+        self._renderers: dict[str, Callable[[object], None]] = {}
+        self._pending: dict[str, object] = {}
+        self._running = False
+
+    def on_render(self, key: str, func: Callable[[object], None]):
+        """Renders the states submitted with the given key on the Tk thread."""
+        self._renderers[key] = func
+
+    def submit(self, key: str, state: object):
+        self._pending[key] = state
+
+    def start(self):
+        self._running = True
+        self.window.after(0, self._render_frame)
+
+    def stop(self):
+        self._running = False
+
+    def _render_frame(self):
+        if not self._running:
+            return
+        started_ns = time.monotonic_ns()
+        for key, func in self._renderers.items():
+            state = self._pending.pop(key, _NOTHING_NEW)
+            if state is not _NOTHING_NEW:
+                try:
+                    func(state)
+                except Exception:
+                    # a failing renderer must not stop the frames of the others
+                    traceback.print_exc()
+        # the time of rendering counts into the frame, so the frame rate stays capped
+        remaining_ns = self.frame_interval_ns - (time.monotonic_ns() - started_ns)
+        self.window.after(max(1, remaining_ns // 1_000_000), self._render_frame)
@@ -0,0 +1,124 @@
+import json
+import math
+import threading
+from typing import Optional
+
+import numpy as np
+
+
+class LatencyHistogram:
+    """A fixed-memory histogram of latencies in nanoseconds.
+
+    The bins are spaced logarithmically between `min_ns` and `max_ns`, so percentiles have
+    a constant relative error (about 2.5% with the default 400 bins) over the whole range.
+    Recording a latency is O(1) and never allocates."""
+
+    def __init__(self, min_ns: int = 1_000, max_ns: int = 10_000_000_000, bins: int = 400):
+        self.min_ns = min_ns
+        self.max_ns = max_ns
+        self._log_min = math.log(min_ns)
+        self._log_step = (math.log(max_ns) - self._log_min) / bins
+        self._bins = bins
+        self._counts = np.zeros(bins + 2, dtype=np.int64)  # including an underflow and an overflow bin
+        self.count = 0
+        self.sum_ns = 0
+        self.max_recorded_ns = 0
+
+    def record(self, latency_ns: int):
+        if latency_ns < self.min_ns:
+            i = 0
+        elif latency_ns >= self.max_ns:
+            i = self._bins + 1
+        else:
+            i = int((math.log(latency_ns) - self._log_min) / self._log_step) + 1
+        self._counts[i] += 1
+        self.count += 1
+        self.sum_ns += latency_ns
+        if latency_ns > self.max_recorded_ns:
+            self.max_recorded_ns = latency_ns
+
+    def reset(self):
+        self._counts[:] = 0
+        self.count = 0
+        self.sum_ns = 0
+        self.max_recorded_ns = 0
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """The upper bound of the bin the given percentile falls in, in nanoseconds.
+        It is capped by the highest recorded latency."""
+        if self.count == 0:
+            return None
+        rank = math.ceil(self.count * percent / 100)
+        i = int(np.searchsorted(np.cumsum(self._counts), max(rank, 1)))
+        if i == 0:
+            return float(self.min_ns)
+        if i > self._bins:
+            return float(self.max_recorded_ns)
+        return min(math.exp(self._log_min + i * self._log_step), float(self.max_recorded_ns))
+
+    def summary(self) -> dict:
+        """Count, mean, max and p50/p95/p99 in milliseconds."""
+        to_ms = lambda ns: None if ns is None else ns / 1_000_000  # noqa: E731
+        return {
+            "count": self.count,
+            "mean_ms": to_ms(self.sum_ns / self.count if self.count else None),
+            "p50_ms": to_ms(self.percentile(50)),
+            "p95_ms": to_ms(self.percentile(95)),
+            "p99_ms": to_ms(self.percentile(99)),
+            "max_ms": to_ms(self.max_recorded_ns if self.count else None),
+        }
+
+
+class LatencyTracker:
+    """Collects the per-stage latencies of samples running through the pipeline.
+
+    A sample is stamped when it got received by the data source client, when the engine
+    picked it up, after the transformation into a mouse position and after publishing:
+
+    - queue: received -> picked up
+    - transform: picked up -> transformed
+    - publish: transformed -> published
+    - total: received -> published
+
+    Behind a `PublisherWorker`, "published" means handed over to the worker,
+    the worker has its own histograms of the time it needs."""
+
+    STAGES = ("queue", "transform", "publish", "total")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+
+    def record(self, received_ns: int, picked_up_ns: int, transformed_ns: int, published_ns: Optional[int]):
+        with self._lock:
+            self.histograms["queue"].record(picked_up_ns - received_ns)
+            self.histograms["transform"].record(transformed_ns - picked_up_ns)
+            if published_ns is not None:
+                self.histograms["publish"].record(published_ns - transformed_ns)
+                self.histograms["total"].record(published_ns - received_ns)
+
+    def reset(self):
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.reset()
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def summary_text(self) -> str:
+        lines = []
+        for stage, summary in self.summary().items():
+            if summary["count"] == 0:
+                lines.append(f"{stage}: no samples")
+            else:
+                lines.append(
+                    f"{stage}: p50 {summary['p50_ms']:.2f} ms, p95 {summary['p95_ms']:.2f} ms,"
+                    + f" p99 {summary['p99_ms']:.2f} ms"
+                )
+        return "\n".join(lines)
+
+    def dump(self, path: str, extra: dict = None):
+        """Writes the summary as JSON to the given file, together with the entries of `extra`."""
+        with open(path, "w") as f:
+            json.dump({**self.summary(), **(extra or {})}, f, indent=2)
@@ -1,25 +1,39 @@
+import sys
+
+# installed before anything else gets imported, see --profile-startup
+if any(arg == "--profile-startup" or arg.startswith("--profile-startup=") for arg in sys.argv):
+    from startup_profiler import StartupProfiler
+
+    startup_profiler = StartupProfiler()
+    startup_profiler.install()
+else:
+    startup_profiler = None
+
 import argparse
 import time
 import traceback
 from datetime import datetime, timedelta
-from threading import Thread
-from typing import Callable, Iterator, List
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, TextIO
 
 import numpy as np
-import screeninfo
 
 import calibration
 import config
 from calibration import CalibrationInstruction, CalibrationResult
 from data_sources import data_sources
-from guis.tkinter.calibration_window import (CalibrationWindow,
-                                             CalibrationWindowButton)
-from guis.tkinter.main_menu_window import MainMenuWindow
+from engine import Engine
+from gaze_classifier import GazeClassifier, GazeEventType
+from latency import LatencyTracker
 from misc import Vector
-from mouse_movement import MouseMovementType
+from monitors import Monitor
 from publishers import publishers
+from publishers.publisher_worker import PublisherWorker
 from tracking_approaches import tracking_approaches
 
+if TYPE_CHECKING:
+    # the GUI, and with it Tk, is only imported once it is run, so --headless works without Tk
+    from guis.tkinter.calibration_window import CalibrationWindow
+
 parser = argparse.ArgumentParser()
 parser.add_argument(
     "--data-source",
@@ -40,87 +54,169 @@ parser.add_argument(
     choices=publishers,
     default=next(iter(publishers)),
 )
+parser.add_argument(
+    "--monitor",
+    help='The monitor to calibrate on and to map mouse positions onto: "primary", "all" to span all monitors,'
+    + ' the index or the name of a monitor. default="%(default)s"',
+    default=config.CALIBRATION_MONITOR,
+)
+parser.add_argument(
+    "--screen",
+    help="The screen to map mouse positions onto, as WIDTHxHEIGHT+X+Y, instead of the detected monitors."
+    + " Without a display, the screen stored with the calibration is used if this is not given.",
+    type=Monitor.from_geometry,
+    metavar="WxH+X+Y",
+)
+parser.add_argument(
+    "--profile-startup",
+    help="Report how long importing every module took, like python -X importtime, once started."
+    + " Written to the given file, or printed if none is given.",
+    nargs="?",
+    const="-",
+    metavar="FILE",
+)
+parser.add_argument(
+    "--restore-calibration",
+    help="Make a previous calibration of the given data source, tracking approach and monitor the current one"
+    + " again, by its creation timestamp as listed when it is unknown. The latest previous one if none is given.",
+    nargs="?",
+    const="latest",
+    metavar="CREATED_NS",
+)
+parser.add_argument(
+    "--headless",
+    help="Run without GUI, using the stored calibration of the given data source and tracking approach.",
+    action="store_true",
+)
+parser.add_argument(
+    "--latency-report",
+    help="Measure the latency of every pipeline stage and write a report as JSON to the given file on exit.",
+    metavar="FILE",
+)
+parser.add_argument(
+    "--record",
+    help="Append every raw sample of the data source to the given recording file.",
+    metavar="FILE",
+)
+parser.add_argument(
+    "--replay-file",
+    help='The recording played back by the "replay" data source. Asked for when not given, required with --headless.',
+    metavar="FILE",
+)
+parser.add_argument(
+    "--replay-as-fast-as-possible",
+    help='Let the "replay" data source ignore the original timing of the recording.',
+    action="store_true",
+)
 
 args = parser.parse_args()
+if args.headless and args.data_source == "replay" and args.replay_file is None:
+    # there is no file dialog to ask for it
+    parser.error('the "replay" data source needs --replay-file with --headless')
 
-selected_data_source = None
-selected_tracking_approach = None
-selected_publisher = None
-
-data_source = None
-tracking_approach = None
-publisher = None
-
-running = True
+engine = None
 
-calibration_result = None
 temp_calibration_result = None
 
 main_menu_window = None
+render_scheduler = None
 calibration_window = None
 in_calibration = False
+latest_fixation = None
 
-request_loop_thread = None
-last_data_source_vector = None
-monitor = screeninfo.get_monitors()[0]
-last_mouse_position = [monitor.width / 2, monitor.height / 2]
 
-
-def reload_data_source(data_source_key):
-    global selected_data_source, data_source
-    selected_data_source = data_source_key
-    if data_source is not None:
-        data_source.stop()
-    data_source = data_sources[selected_data_source].clazz()
-    data_source.start()
+def reload_calibration_result():
+    has_result = engine.reload_calibration_result()
+    if main_menu_window is not None:
+        main_menu_window.set_has_calibration_result(has_result)
+
+
+def refresh_monitor_layout():
+    """Notices resolution changes and monitors plugged in or out, except while a calibration window is open.
+    If the monitors can't be read, the previous ones are kept."""
+    try:
+        if calibration_window is None and engine.refresh_monitor_layout():
+            reload_calibration_result()
+            main_menu_window.set_monitor_layout(engine.monitor_layout, engine.monitor)
+    except Exception:
+        traceback.print_exc()
+    finally:
+        main_menu_window.after(config.MONITOR_LAYOUT_REFRESH_IN_SEC * 1000, refresh_monitor_layout)
+
+
+def on_monitor_change_requested(monitor_selection: str):
+    engine.select_monitor(monitor_selection)
+    reload_calibration_result()
+    main_menu_window.set_monitor_layout(engine.monitor_layout, engine.monitor)
+
+
+def on_engine_update(data_source_vector: Optional[Vector], mouse_position: Optional[Vector]):
+    """Called by the engine's thread, so the state is only handed over to the Tk thread."""
+    render_scheduler.submit(
+        "engine",
+        (
+            data_source_vector is not None,
+            (mouse_position[0], mouse_position[1]) if mouse_position is not None else None,
+        ),
+    )
 
 
-def reload_tracking_approach(tracking_approach_key):
-    global selected_tracking_approach, tracking_approach
-    selected_tracking_approach = tracking_approach_key
-    tracking_approach = tracking_approaches[selected_tracking_approach].clazz()
+def render_engine_update(state: tuple[bool, Optional[Vector]]):
+    data_source_has_data, mouse_position = state
+    main_menu_window.set_data_source_has_data(data_source_has_data)
+    if mouse_position is not None and calibration_window is None:
+        main_menu_window.set_mouse_point(mouse_position)
+    else:
+        main_menu_window.unset_mouse_point()
+    if mouse_position is not None and calibration_window is not None and not in_calibration:
+        calibration_window.set_mouse_point(mouse_position, update_buttons=not config.GAZE_BUTTON_DWELL_ON_FIXATIONS)
+
+
+def on_engine_gaze_event(gaze_event_type: GazeEventType, gaze_classifier: GazeClassifier):
+    """Called by the engine's thread, so the fixation is only handed over to the Tk thread:
+    its centroid, start, duration and whether it ended meanwhile. An ended fixation is handed over
+    with its final duration, so the Tk thread doesn't miss a button it triggered right before."""
+    global latest_fixation
+    if gaze_event_type is GazeEventType.FIXATION:
+        centroid = gaze_classifier.fixation_centroid
+        latest_fixation = (
+            (centroid[0], centroid[1]),
+            gaze_classifier.fixation_start_ns,
+            gaze_classifier.fixation_duration_ns,
+            False,
+        )
+    elif latest_fixation is not None and not latest_fixation[3]:
+        latest_fixation = latest_fixation[:3] + (True,)
+    else:
+        return
+    render_scheduler.submit("fixation", latest_fixation)
 
 
-def reload_publisher(publisher_key):
-    global selected_publisher, publisher
-    selected_publisher = publisher_key
-    if publisher is not None:
-        publisher.stop()
-    publisher = publishers[selected_publisher].clazz()
-    publisher.start()
+def render_fixation(fixation: tuple[Vector, int, int, bool]):
+    if calibration_window is None or in_calibration:
+        return
+    centroid, fixation_start_ns, fixation_duration_ns, ended = fixation
+    # kept, as the triggered button may close the window
+    window = calibration_window
+    triggered_button = window.update_buttons_with_fixation(centroid, fixation_start_ns, fixation_duration_ns)
+    if triggered_button is not None:
+        # the user looked at the button meanwhile, which tells where the calibration drifted
+        engine.add_screen_correspondence(
+            window.to_screen(triggered_button.center()),
+            fixation_start_ns,
+            fixation_start_ns + fixation_duration_ns,
+        )
+    elif ended:
+        window.update_buttons_with_fixation(None, None, 0)
 
 
-def reload_calibration_result():
-    global selected_data_source, selected_tracking_approach, tracking_approach
-    global calibration_result, main_menu_window, last_mouse_position
-    calibration_result = None
-    last_mouse_position = [monitor.width / 2, monitor.height / 2]
-    if calibration.has_result(selected_data_source, selected_tracking_approach):
-        calibration_result = calibration.load_result(selected_data_source, selected_tracking_approach)
-        tracking_approach.calibrate(calibration_result)
-    main_menu_window.set_has_calibration_result(calibration_result is not None)
-
-
-def loop():
-    global last_data_source_vector, last_mouse_position
-    while running:
-        try:
-            last_data_source_vector = data_source.get_next_vector()
-            main_menu_window.unset_mouse_point()
-            main_menu_window.set_data_source_has_data(last_data_source_vector is not None)
-            if last_data_source_vector is not None and tracking_approach.is_calibrated():
-                mouse_movement = tracking_approach.get_next_mouse_movement(last_data_source_vector)
-                if mouse_movement is not None:
-                    last_mouse_position = get_new_mouse_position(mouse_movement, last_mouse_position)
-                    if calibration_window is not None:
-                        if not in_calibration:
-                            calibration_window.set_mouse_point(last_mouse_position)
-                    else:
-                        main_menu_window.set_mouse_point(last_mouse_position)
-                        publisher.push(last_mouse_position)
-        except Exception:
-            traceback.print_exc()
-        time.sleep(config.LOOP_SLEEP_IN_MILLISEC / 1000)
+def on_calibration_window_click(position: Vector):
+    if not in_calibration:
+        # users look at what they click, which tells where the calibration drifted
+        now_ns = time.monotonic_ns()
+        engine.add_screen_correspondence(
+            position, now_ns - config.DRIFT_CORRECTION_CLICK_WINDOW_IN_MILLISEC * 1_000_000, now_ns
+        )
 
 
 def close_and_unset_calibration_window():
@@ -128,16 +224,16 @@ def close_and_unset_calibration_window():
     in_calibration = False
     calibration_window.close_window()
     calibration_window = None
+    engine.publishing_paused = False
 
 
 def accept_or_reject_temp_calibration_result(accept_temp_calibration_result: bool):
-    global temp_calibration_result, calibration_result
+    global temp_calibration_result
     if accept_temp_calibration_result:
-        calibration_result = temp_calibration_result
-        calibration.delete_result(selected_data_source, selected_tracking_approach)
-        calibration.save_result(selected_data_source, selected_tracking_approach, calibration_result)
+        engine.commit_calibration_result()
+        main_menu_window.set_has_calibration_result(True)
     else:
-        tracking_approach.calibrate(calibration_result)
+        engine.rollback_calibration_result()
     temp_calibration_result = None
 
 
@@ -162,6 +258,8 @@ def show_final_text_for_seconds(seconds, on_finish):
 
 
 def calibration_done():
+    from guis.tkinter.calibration_window import CalibrationWindowButton
+
     global in_calibration
     in_calibration = False
     calibration_window.set_buttons(
@@ -186,20 +284,47 @@ def calibration_done():
     show_final_text_for_seconds(config.SHOW_FINAL_CALIBRATION_TEXT_FOR_SEC, redo_calibration)
 
 
-def on_calibration_requested(new_calibration_window: CalibrationWindow):
+def on_calibration_requested(new_calibration_window: "CalibrationWindow"):
     global calibration_window, in_calibration
     calibration_window = new_calibration_window
+    engine.publishing_paused = config.PAUSE_PUBLISHING_WHILE_CALIBRATING
+    engine.rollback_calibration_result()  # a redone calibration starts from the stored one again
 
     in_calibration = True
     calibration_window.unset_mouse_point()
+    calibration_window.on_click(on_calibration_window_click)
 
-    calibration_instructions = tracking_approach.get_calibration_instructions()
+    calibration_instructions = engine.tracking_approach.get_calibration_instructions()
     show_preparational_text(
         calibration_instructions.preparational_text,
         lambda: execute_calibrations(iter(calibration_instructions.instructions), calibration_done),
     )
 
 
+def on_drift_check_requested(new_calibration_window: "CalibrationWindow"):
+    global calibration_window, in_calibration
+    drift_check = engine.tracking_approach.get_drift_check() if engine.tracking_approach.is_calibrated() else None
+    calibration_window = new_calibration_window
+    if drift_check is None:
+        close_and_unset_calibration_window()
+        return
+
+    in_calibration = True
+    calibration_window.unset_mouse_point()
+    calibration_window.bind("<Escape>", lambda _: close_and_unset_calibration_window())
+    calibration_instruction, target = drift_check
+    execute_calibration(calibration_instruction, lambda estimate: drift_check_done(estimate, target))
+
+
+def drift_check_done(estimate: tuple[Vector, int, float], target: Vector):
+    if calibration_window is None:  # when the drift check was cancelled
+        return
+    vector, sample_count, _ = estimate
+    if sample_count > 0:
+        engine.add_correspondence(vector, target)
+    close_and_unset_calibration_window()
+
+
 def show_preparational_text(preparational_text: str, on_finish: Callable, end_time=None):
     now = datetime.now()
     if end_time is None:
@@ -219,33 +344,10 @@ def show_preparational_text(preparational_text: str, on_finish: Callable, end_ti
         calibration_window.after(250, show_preparational_text, preparational_text, on_finish, end_time)
 
 
-def scale_vector_to_screen(vector):
-    return ((vector[0] + 1) * 0.5 * monitor.width, (vector[1] - 1) * 0.5 * -monitor.height)
-
-
-def get_new_mouse_position(mouse_movement, last_mouse_position):
-    if mouse_movement.type == MouseMovementType.TO_POSITION:
-        new_mouse_position = scale_vector_to_screen(mouse_movement.vector)
-    if mouse_movement.type == MouseMovementType.BY:
-        new_mouse_position = [
-            last_mouse_position[0] + mouse_movement.vector[0] * config.MOUSE_SPEED_IN_PX,
-            last_mouse_position[1] - mouse_movement.vector[1] * config.MOUSE_SPEED_IN_PX,
-        ]
-        if new_mouse_position[0] < 0:
-            new_mouse_position[0] = 0
-        if new_mouse_position[0] > monitor.width:
-            new_mouse_position[0] = monitor.width
-        if new_mouse_position[1] < 0:
-            new_mouse_position[1] = 0
-        if new_mouse_position[1] > monitor.height:
-            new_mouse_position[1] = monitor.height
-    return new_mouse_position
-
-
 def execute_calibrations(
     calibration_instructions: Iterator,
     on_finish: Callable,
-    collected_vectors: List[Vector] = [],
+    collected_estimates: List[tuple[Vector, int, float]] = [],
 ):
     global temp_calibration_result
     next_instruction = next(calibration_instructions, None)
@@ -253,17 +355,20 @@ def execute_calibrations(
         calibration_window.unset_calibration_point()
         calibration_window.unset_main_text()
         calibration_window.unset_image()
-        temp_calibration_result = CalibrationResult(collected_vectors)
-        tracking_approach.calibrate(temp_calibration_result)
+        vectors, sample_counts, dispersions = zip(*collected_estimates) if collected_estimates else ([], [], [])
+        temp_calibration_result = CalibrationResult(list(vectors), list(sample_counts), list(dispersions))
+        engine.preview_calibration_result(temp_calibration_result)
         on_finish()
     else:
         execute_calibration(
             next_instruction,
-            lambda vector: execute_calibrations(calibration_instructions, on_finish, collected_vectors + [vector]),
+            lambda estimate: execute_calibrations(calibration_instructions, on_finish, collected_estimates + [estimate]),
         )
 
 
-def execute_calibration(calibration_instruction: CalibrationInstruction, on_finish: Callable[[Vector], None]):
+def execute_calibration(
+    calibration_instruction: CalibrationInstruction, on_finish: Callable[[tuple[Vector, int, float]], None]
+):
     calibration_window.unset_calibration_point()
     calibration_window.unset_main_text()
     calibration_window.unset_image()
@@ -273,46 +378,44 @@ def execute_calibration(calibration_instruction: CalibrationInstruction, on_fini
     image = calibration_instruction.image
 
     if vector is not None:
-        calibration_window.set_calibration_point(scale_vector_to_screen(vector))
+        calibration_window.set_calibration_point(engine.scale_vector_to_screen(vector))
     if text is not None:
         calibration_window.set_main_text(text)
     if image is not None:
         calibration_window.set_image(image)
 
-    end_time = datetime.now() + timedelta(
-        seconds=config.WAIT_TIME_BEFORE_COLLECTING_VECTORS_IN_SEC + config.VECTOR_COLLECTION_TIME_IN_SEC
-    )
+    start_ns = time.monotonic_ns() + config.WAIT_TIME_BEFORE_COLLECTING_VECTORS_IN_SEC * 1_000_000_000
+    end_ns = start_ns + config.VECTOR_COLLECTION_TIME_IN_SEC * 1_000_000_000
     calibration_window.after(
         config.WAIT_TIME_BEFORE_COLLECTING_VECTORS_IN_SEC * 1000,
         collect_calibration_vectors,
         calibration_instruction,
         on_finish,
-        end_time,
+        start_ns,
+        end_ns,
     )
 
 
 def collect_calibration_vectors(
     calibration_instruction: CalibrationInstruction,
-    on_finish: Callable[[Vector], None],
-    end_time: datetime,
-    vectors: List[Vector] = None,
+    on_finish: Callable[[tuple[Vector, int, float]], None],
+    start_ns: int,
+    end_ns: int,
 ):
-    if vectors is None:
-        vectors = []
-
-    now = datetime.now()
-    if now > end_time:
-        on_finish(np.mean(np.array(vectors), axis=0) if len(vectors) > 0 else (0, 0))
+    """Counts down till the end of the collection time, then estimates the calibration vector.
+    The vectors themselves are not collected here: the engine's sample buffer holds every
+    sample of the data source, at its full rate, independent of this GUI thread."""
+    now_ns = time.monotonic_ns()
+    if now_ns > end_ns:
+        _, vectors = engine.sample_buffer.window(start_ns, end_ns)
+        on_finish(calibration.estimate_calibration_vector(np.array(vectors)))
     else:
-        if last_data_source_vector is not None:
-            vectors.append(last_data_source_vector)
-
         vector = calibration_instruction.vector
         text = calibration_instruction.text
-        remaining_seconds = int((end_time - now).total_seconds())
+        remaining_seconds = (end_ns - now_ns) // 1_000_000_000
 
         if vector is not None:
-            calibration_window.set_calibration_point(scale_vector_to_screen(vector), str(remaining_seconds))
+            calibration_window.set_calibration_point(engine.scale_vector_to_screen(vector), str(remaining_seconds))
         elif text is not None:
             calibration_window.set_main_text(text + f" ... {remaining_seconds}")
         else:
@@ -323,41 +426,165 @@ def collect_calibration_vectors(
             collect_calibration_vectors,
             calibration_instruction,
             on_finish,
-            end_time,
-            vectors,
+            start_ns,
+            end_ns,
         )
 
 
-main_menu_window = MainMenuWindow()
+def report_startup():
+    if startup_profiler is None:
+        return
+    startup_profiler.uninstall()
+    if args.profile_startup == "-":
+        write_startup_report(sys.stderr)
+    else:
+        with open(args.profile_startup, "w") as f:
+            write_startup_report(f)
 
-reload_data_source(args.data_source)
-reload_tracking_approach(args.tracking_approach)
-reload_publisher(args.publisher)
-reload_calibration_result()
 
-main_menu_window.set_data_source_options(data_sources)
-main_menu_window.set_current_data_source(selected_data_source)
-main_menu_window.on_data_source_change_requested(
-    lambda new_data_source: (reload_data_source(new_data_source), reload_calibration_result())
-)
+def write_startup_report(file: TextIO):
+    startup_profiler.report(file)
+    for registry in (data_sources, tracking_approaches, publishers):
+        for option in registry.values():
+            if option.import_time_ns is not None:
+                print(f"plugin {option.key} imported in {option.import_time_ns / 1_000_000:.1f} ms", file=file)
+
+
+def show_latencies():
+    text = engine.latency_tracker.summary_text()
+    if isinstance(engine.publisher, PublisherWorker):
+        text += "\n" + engine.publisher.summary_text()
+    main_menu_window.set_latency_text(text)
+    main_menu_window.after(config.LATENCY_DISPLAY_INTERVAL_IN_MILLISEC, show_latencies)
 
-main_menu_window.set_tracking_approach_options(tracking_approaches)
-main_menu_window.set_current_tracking_approach(selected_tracking_approach)
-main_menu_window.on_tracking_approach_change_requested(
-    lambda new_tracking_approach: (reload_tracking_approach(new_tracking_approach), reload_calibration_result())
-)
 
-main_menu_window.set_publisher_options(publishers)
-main_menu_window.set_current_publisher(selected_publisher)
-main_menu_window.on_publisher_change_requested(reload_publisher)
+def dump_latencies():
+    if engine.latency_tracker is not None and args.latency_report:
+        publisher_summary = engine.publisher_summary()
+        engine.latency_tracker.dump(
+            args.latency_report, {"publisher": publisher_summary} if publisher_summary is not None else None
+        )
 
-main_menu_window.on_calibration_requested(on_calibration_requested)
 
-request_loop = Thread(target=loop)
-request_loop.start()
+def restore_calibration():
+    history = engine.list_calibration_history()
+    if args.restore_calibration == "latest" and history:
+        created_ns = history[0]
+    elif args.restore_calibration.isdigit() and int(args.restore_calibration) in history:
+        created_ns = int(args.restore_calibration)
+    else:
+        print(
+            f'No previous calibration "{args.restore_calibration}" found for data source "{args.data_source}"'
+            + f' and tracking approach "{args.tracking_approach}". The previous calibrations are:'
+        )
+        for created_ns in history:
+            print(f"  {created_ns}  ({datetime.fromtimestamp(created_ns / 1_000_000_000):%Y-%m-%d %H:%M:%S})")
+        sys.exit(1)
+    engine.restore_calibration_result(created_ns)
+    print(f"Restored the calibration of {datetime.fromtimestamp(created_ns / 1_000_000_000):%Y-%m-%d %H:%M:%S}.")
+
+
+def run_headless():
+    engine.reload_data_source(args.data_source)
+    engine.reload_tracking_approach(args.tracking_approach)
+    engine.reload_publisher(args.publisher)
+    if args.restore_calibration is not None:
+        restore_calibration()
+    if not engine.reload_calibration_result():
+        print(
+            f'No calibration found for data source "{args.data_source}" and tracking approach'
+            + f' "{args.tracking_approach}". Run Miranda with GUI to calibrate first.'
+        )
+    engine.start()
+    report_startup()
+    try:
+        while True:
+            time.sleep(config.MONITOR_LAYOUT_REFRESH_IN_SEC)
+            try:
+                if engine.refresh_monitor_layout():
+                    engine.reload_calibration_result()
+            except Exception:
+                # keeps running with the previous monitors
+                traceback.print_exc()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+        dump_latencies()
+
+
+def run_gui():
+    from guis.tkinter.main_menu_window import MainMenuWindow
+    from guis.tkinter.render_scheduler import RenderScheduler
+
+    global main_menu_window, render_scheduler
+    main_menu_window = MainMenuWindow()
+    render_scheduler = RenderScheduler(main_menu_window, config.GUI_FRAME_RATE_IN_HZ)
+    render_scheduler.on_render("engine", render_engine_update)
+    render_scheduler.on_render("fixation", render_fixation)
+
+    engine.reload_data_source(args.data_source)
+    engine.reload_tracking_approach(args.tracking_approach)
+    engine.reload_publisher(args.publisher)
+    if args.restore_calibration is not None:
+        restore_calibration()
+    reload_calibration_result()
+
+    main_menu_window.set_data_source_options(data_sources)
+    main_menu_window.set_current_data_source(engine.selected_data_source)
+    main_menu_window.on_data_source_change_requested(
+        lambda new_data_source: (engine.reload_data_source(new_data_source), reload_calibration_result())
+    )
 
-main_menu_window.mainloop()
-running = False
-request_loop.join(timeout=1)
-data_source.stop()
-publisher.stop()
+    main_menu_window.set_tracking_approach_options(tracking_approaches)
+    main_menu_window.set_current_tracking_approach(engine.selected_tracking_approach)
+    main_menu_window.on_tracking_approach_change_requested(
+        lambda new_tracking_approach: (
+            engine.reload_tracking_approach(new_tracking_approach),
+            reload_calibration_result(),
+        )
+    )
+
+    main_menu_window.set_publisher_options(publishers)
+    main_menu_window.set_current_publisher(engine.selected_publisher)
+    main_menu_window.on_publisher_change_requested(engine.reload_publisher)
+
+    main_menu_window.set_monitor_layout(engine.monitor_layout, engine.monitor)
+    main_menu_window.on_monitor_change_requested(on_monitor_change_requested)
+    refresh_monitor_layout()
+
+    main_menu_window.on_calibration_requested(on_calibration_requested)
+    main_menu_window.on_drift_check_requested(on_drift_check_requested)
+
+    engine.on_update(on_engine_update)
+    if config.GAZE_BUTTON_DWELL_ON_FIXATIONS:
+        engine.on_gaze_event(on_engine_gaze_event)
+    engine.start()
+    render_scheduler.start()
+
+    if engine.latency_tracker is not None:
+        show_latencies()
+    # once the main menu got shown
+    main_menu_window.after(0, report_startup)
+
+    main_menu_window.mainloop()
+    render_scheduler.stop()
+    engine.stop()
+    dump_latencies()
+
+
+engine = Engine(
+    monitor=args.screen,
+    monitor_selection=args.monitor,
+    latency_tracker=(
+        LatencyTracker() if config.LATENCY_INSTRUMENTATION_ENABLED or args.latency_report is not None else None
+    ),
+    data_source_arguments={
+        "replay": {"path": args.replay_file, "realtime": not args.replay_as_fast_as_possible},
+    },
+    recording_path=args.record,
+)
+if args.headless:
+    run_headless()
+else:
+    run_gui()
@@ -0,0 +1,167 @@
+import re
+from bisect import bisect_right
+from typing import Optional
+
+import screeninfo
+
+from misc import Vector
+
+
+class Monitor:
+    """A monitor, or the area spanning several, in pixels of the desktop, which spans all monitors.
+
+    Maps the vectors of the tracking approaches, which range from -1.0<=x<=1.0 and 1.0>=y>=-1.0
+    (see `CalibrationInstruction`), onto the monitor and back, by affine maps precomputed once."""
+
+    def __init__(
+        self, x: int, y: int, width: int, height: int, name: str = None, is_primary: bool = False, spans: bool = False
+    ):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.name = name
+        self.is_primary = is_primary
+        # True for the area spanning all monitors of a layout
+        self.spans = spans
+        self.right = x + width
+        self.bottom = y + height
+        self.key = (x, y, width, height)
+
+        self._scale_x = width * 0.5
+        self._scale_y = -height * 0.5
+        self._offset_x = x + width * 0.5
+        self._offset_y = y + height * 0.5
+
+    @classmethod
+    def of(cls, monitor) -> "Monitor":
+        """The Monitor of a monitor of `screeninfo`."""
+        if isinstance(monitor, Monitor):
+            return monitor
+        return cls(monitor.x, monitor.y, monitor.width, monitor.height, monitor.name, bool(monitor.is_primary))
+
+    @classmethod
+    def from_geometry(cls, geometry: str) -> "Monitor":
+        """The monitor of a geometry like "1920x1080" or "1920x1080+1920+0", width x height + x + y."""
+        match = re.fullmatch(r"(\d+)x(\d+)(?:([+-]\d+)([+-]\d+))?", geometry.strip())
+        if match is None:
+            raise ValueError(f'"{geometry}" is no geometry like 1920x1080+0+0')
+        width, height, x, y = match.groups()
+        return cls(int(x or 0), int(y or 0), int(width), int(height), is_primary=True)
+
+    def __repr__(self):
+        return f"Monitor({self.name!r}, {self.width}x{self.height} at {self.x},{self.y})"
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Monitor)
+            and self.key == other.key
+            and self.name == other.name
+            and self.is_primary == other.is_primary
+            and self.spans == other.spans
+        )
+
+    @property
+    def id(self) -> str:
+        """Identifies the monitor in file names, e.g. of calibration results."""
+        if self.spans:
+            return "all"
+        if self.name:
+            return re.sub(r"[^A-Za-z0-9-]", "", self.name)
+        return f"{self.width}x{self.height}{self.x:+d}{self.y:+d}"
+
+    def to_screen(self, vector: Vector) -> Vector:
+        return (vector[0] * self._scale_x + self._offset_x, vector[1] * self._scale_y + self._offset_y)
+
+    def to_screen_into(self, vector: Vector, position: list):
+        """The allocation-free counterpart of `to_screen`: writes the position into the given list."""
+        position[0] = vector[0] * self._scale_x + self._offset_x
+        position[1] = vector[1] * self._scale_y + self._offset_y
+
+    def from_screen(self, position: Vector) -> Vector:
+        return ((position[0] - self._offset_x) / self._scale_x, (position[1] - self._offset_y) / self._scale_y)
+
+    def contains(self, position: Vector) -> bool:
+        return self.x <= position[0] < self.right and self.y <= position[1] < self.bottom
+
+    def clamp_into(self, position: list):
+        x = position[0]
+        y = position[1]
+        position[0] = self.x if x < self.x else self.right if x > self.right else x
+        position[1] = self.y if y < self.y else self.bottom if y > self.bottom else y
+
+
+class MonitorLayout:
+    """The monitors of the desktop.
+
+    `monitor_at` finds the monitor of a position by two binary searches: the desktop is cut
+    into vertical slabs at every left and right monitor edge, each slab keeps the monitors
+    crossing it sorted from top to bottom. `refresh` reads the monitors again, e.g. after a
+    resolution change or when a monitor got plugged in."""
+
+    def __init__(self, monitors: list[Monitor] = None):
+        # when given, the monitors are fixed, e.g. for benchmarks
+        self.fixed = monitors is not None
+        self.monitors: list[Monitor] = []
+        self.primary: Optional[Monitor] = None
+        self.bounds: Optional[Monitor] = None
+        self._slab_xs: list[int] = []
+        self._slabs: list[tuple[list[int], list[Monitor]]] = []
+        self._set_monitors(monitors if monitors is not None else self._read_monitors())
+
+    def refresh(self) -> bool:
+        """Reads the monitors again. Returns True if they changed.
+        Without any monitor, e.g. while the displays get reconfigured, the previous ones are kept."""
+        if self.fixed:
+            return False
+        monitors = self._read_monitors()
+        if not monitors or monitors == self.monitors:
+            return False
+        self._set_monitors(monitors)
+        return True
+
+    def get(self, selection: str) -> Monitor:
+        """The monitor selected by "primary", "all" for the area spanning all monitors, the index of
+        the monitor or its name. Falls back to the primary monitor if there is no such monitor."""
+        if selection == "all":
+            return self.bounds
+        if selection.isdigit() and int(selection) < len(self.monitors):
+            return self.monitors[int(selection)]
+        for monitor in self.monitors:
+            if selection in (monitor.name, monitor.id):
+                return monitor
+        return self.primary
+
+    def monitor_at(self, position: Vector) -> Optional[Monitor]:
+        """The monitor showing the given position, None if it is on none."""
+        slab_index = bisect_right(self._slab_xs, position[0]) - 1
+        if not 0 <= slab_index < len(self._slabs):
+            return None
+        tops, monitors = self._slabs[slab_index]
+        index = bisect_right(tops, position[1]) - 1
+        if index >= 0 and position[1] < monitors[index].bottom:
+            return monitors[index]
+        return None
+
+    def _set_monitors(self, monitors: list[Monitor]):
+        self.monitors = monitors
+        self.primary = next((monitor for monitor in monitors if monitor.is_primary), None) or monitors[0]
+        x = min(monitor.x for monitor in monitors)
+        y = min(monitor.y for monitor in monitors)
+        right = max(monitor.right for monitor in monitors)
+        bottom = max(monitor.bottom for monitor in monitors)
+        self.bounds = Monitor(x, y, right - x, bottom - y, "all", spans=True)
+
+        self._slab_xs = sorted({monitor.x for monitor in monitors} | {monitor.right for monitor in monitors})
+        self._slabs = []
+        for slab_x in self._slab_xs[:-1]:
+            # of overlapping monitors, e.g. mirrored ones, the lower one wins
+            crossing = sorted(
+                (monitor for monitor in monitors if monitor.x <= slab_x < monitor.right),
+                key=lambda monitor: monitor.y,
+            )
+            self._slabs.append(([monitor.y for monitor in crossing], crossing))
+
+    @staticmethod
+    def _read_monitors() -> list[Monitor]:
+        return [Monitor.of(monitor) for monitor in screeninfo.get_monitors()]
@@ -1,4 +1,7 @@
 from enum import Enum
+
+import numpy as np
+
 from misc import Vector
 
 
@@ -8,6 +11,22 @@ class MouseMovementType(Enum):
 
 
 class MouseMovement:
+    __slots__ = ("type", "vector")
+
     def __init__(self, mouse_movement_type: MouseMovementType, vector: Vector):
         self.type = mouse_movement_type
         self.vector = vector
+
+
+class MouseMovements:
+    """The MouseMovements of many vectors at once, all of the same type.
+    `vectors` is an (N, 2) array. `mask` is a boolean array of length N, which is False
+    where a vector results in no MouseMovement at all."""
+
+    def __init__(self, mouse_movement_type: MouseMovementType, vectors: np.ndarray, mask: np.ndarray):
+        self.type = mouse_movement_type
+        self.vectors = vectors
+        self.mask = mask
+
+    def __len__(self) -> int:
+        return len(self.vectors)
@@ -0,0 +1,38 @@
+import importlib
+import time
+from typing import Union
+
+
+class PluginOption:
+    """An option of the registries `data_sources`, `tracking_approaches` and `publishers`:
+    what the GUI shows for it, and the class implementing it.
+
+    The class may be given as "module:ClassName". Then it is imported on the first access of
+    `clazz` only, so a session imports the selected plugins and their dependencies, but not
+    those of all the others."""
+
+    def __init__(self, key: str, title: str, description: str, icon: str, clazz: Union[type, str]):
+        self.key = key
+        self.title = title
+        self.description = description
+        self.icon = icon
+        if isinstance(clazz, str):
+            self.import_path = clazz
+            self._clazz = None
+        else:
+            self.import_path = f"{clazz.__module__}:{clazz.__qualname__}"
+            self._clazz = clazz
+        # how long importing the class took, None till it got imported here
+        self.import_time_ns = None
+
+    @property
+    def clazz(self) -> type:
+        if self._clazz is None:
+            module_name, class_name = self.import_path.split(":")
+            started_ns = time.perf_counter_ns()
+            self._clazz = getattr(importlib.import_module(module_name), class_name)
+            self.import_time_ns = time.perf_counter_ns() - started_ns
+        return self._clazz
+
+    def is_loaded(self) -> bool:
+        return self._clazz is not None
@@ -1,21 +1,19 @@
-from publishers.udp_publisher import UdpPublisher
 from misc import resource_path
-from guis.tkinter.main_menu_window import MainMenuOption
-from publishers.mouse_publisher import MousePublisher
+from plugins import PluginOption
 
-publishers: dict[MainMenuOption] = {
-    "udp": MainMenuOption(
+publishers: dict[str, PluginOption] = {
+    "udp": PluginOption(
         key="udp",
         title="UDP-Publisher",
         description="Publish the gaze results over UDP in a simple JSON format.",
         icon=resource_path("assets/publisher_udp.png"),
-        clazz=UdpPublisher,
+        clazz="publishers.udp_publisher:UdpPublisher",
     ),
-    "mouse": MainMenuOption(
+    "mouse": PluginOption(
         key="mouse",
         title="Mouse Movement",
         description="Moves the mouse cursor according to the gaze.\nDoesn't work with the Mouse data source.",
         icon=resource_path("assets/publisher_mouse.png"),
-        clazz=MousePublisher,
+        clazz="publishers.mouse_publisher:MousePublisher",
     )
 }
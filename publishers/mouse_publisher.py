@@ -1,43 +1,76 @@
+from typing import Optional
+
+import screeninfo
+
+import config
+from cursors import create_cursor_backend
+from cursors.cursor_backend import CursorBackend, Position
+from monitors import MonitorLayout
 from publishers.publisher import Publisher
 from misc import Vector
-import pyautogui
 from datetime import datetime, timedelta
 
 
 class MousePublisher(Publisher):
     """Moves the Mouse to the given Vector.
-    When the mouse is moved manually this publisher pauses for some time."""
+    When the mouse is moved manually this publisher pauses for some time.
+
+    Manual movements are detected by comparing the cursor position with the position it was
+    last moved to, which is remembered instead of queried after every move. Only positions
+    on a monitor are reached for sure, the system puts the cursor elsewhere for the others, e.g.
+    for the dead zones of an area spanning monitors of different sizes. After moving to those,
+    the position is queried."""
 
-    def __init__(self):
+    def __init__(self, cursor_backend: Optional[CursorBackend] = None):
+        self.cursor_backend = cursor_backend
         self.manually_moved_to = None
         self.pause_publishing_until = None
         self.pause_time_in_seconds = 1
 
-        self.last_moved_to = None
+        self.last_moved_to: Optional[Position] = None
+        self.tolerance = config.MOUSE_PUBLISHER_MANUAL_MOVE_TOLERANCE_IN_PX
+        # None without a display, then the position is queried after every move
+        self.monitor_layout: Optional[MonitorLayout] = None
 
     def start(self):
-        # Since in our case touching the corners is expected, we deactivate pyautogui's failsafe.
-        # see https://pyautogui.readthedocs.io/en/latest/#fail-safes
-        pyautogui.FAILSAFE = False
+        if self.cursor_backend is None:
+            self.cursor_backend = create_cursor_backend()
+        try:
+            self.monitor_layout = MonitorLayout()
+        except screeninfo.ScreenInfoError:
+            self.monitor_layout = None
 
     def stop(self):
-        pyautogui.FAILSAFE = True
+        if self.cursor_backend is not None:
+            self.cursor_backend.close()
+            self.cursor_backend = None
         self.manually_moved_to = None
         self.pause_publishing_until = None
         self.last_moved_to = None
 
     def push(self, vector: Vector):
-        mouse_position = pyautogui.position()
-        if self.last_moved_to is not None and self.last_moved_to != mouse_position:
+        mouse_position = self.cursor_backend.position()
+        last_moved_to = self.last_moved_to
+        if last_moved_to is not None and (
+            abs(last_moved_to[0] - mouse_position[0]) > self.tolerance
+            or abs(last_moved_to[1] - mouse_position[1]) > self.tolerance
+        ):
             self.manually_moved_to = mouse_position
             self.last_moved_to = mouse_position
             self.pause_publishing_until = datetime.now() + timedelta(seconds=self.pause_time_in_seconds)
+            # the monitors may have changed meanwhile
+            if self.monitor_layout is not None:
+                self.monitor_layout.refresh()
         elif self.pause_publishing_until:
             if self.pause_publishing_until < datetime.now():
                 self.manually_moved_to = None
                 self.pause_publishing_until = None
-                pyautogui.moveTo(*vector, _pause=False)
-                self.last_moved_to = pyautogui.position()
+                self._move_to(vector, mouse_position)
         else:
-            pyautogui.moveTo(*vector, _pause=False)
-            self.last_moved_to = pyautogui.position()
+            self._move_to(vector, mouse_position)
+
+    def _move_to(self, vector: Vector, mouse_position: Position):
+        moved_to = self.cursor_backend.move_to(vector[0], vector[1], mouse_position)
+        if self.monitor_layout is None or self.monitor_layout.monitor_at(moved_to) is None:
+            moved_to = self.cursor_backend.position()
+        self.last_moved_to = moved_to
@@ -19,5 +19,7 @@ class Publisher(ABC):
 
     @abstractmethod
     def push(self, vector: Vector):
-        """pushes the vector to the output method."""
+        """pushes the vector to the output method.
+        The vector may be a buffer that gets overwritten with the next vector,
+        so publishers must not keep a reference to it."""
         pass
@@ -0,0 +1,108 @@
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+
+from latency import LatencyHistogram
+from misc import Vector
+from publishers.publisher import Publisher
+
+
+class PublisherWorker(Publisher):
+    """Runs a publisher on an own thread behind a bounded queue.
+
+    `push` only copies the vector into the queue and returns, so a slow publisher never stalls
+    the caller. When the queue is full, the oldest vector is dropped, so the publisher always
+    catches up to the latest one. With a queue size of 1 it only ever publishes the latest vector.
+
+    The counters tell how the publisher keeps up: the current queue depth, the number of dropped
+    vectors, and histograms of the time vectors wait in the queue and the time `push` of the
+    publisher takes."""
+
+    def __init__(self, publisher: Publisher, queue_size: int = 1):
+        self.publisher = publisher
+        self.queue_size = queue_size
+
+        self._queue: deque[tuple[Vector, int]] = deque(maxlen=queue_size)
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.pushed_count = 0
+        self.published_count = 0
+        self.dropped_count = 0
+        self.wait_histogram = LatencyHistogram()
+        self.service_histogram = LatencyHistogram()
+
+    def start(self):
+        self.publisher.start()
+        self._running = True
+        self._thread = threading.Thread(target=self._work, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1)
+        self._queue.clear()
+        self.publisher.stop()
+
+    def push(self, vector: Vector):
+        # the vector may be a buffer of the caller, so it gets copied
+        item = ((vector[0], vector[1]), time.monotonic_ns())
+        with self._condition:
+            if len(self._queue) == self.queue_size:
+                self.dropped_count += 1
+            self._queue.append(item)
+            self.pushed_count += 1
+            self._condition.notify()
+
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def summary(self) -> dict:
+        with self._condition:
+            return {
+                "publisher": type(self.publisher).__name__,
+                "queue_size": self.queue_size,
+                "queue_depth": len(self._queue),
+                "pushed": self.pushed_count,
+                "published": self.published_count,
+                "dropped": self.dropped_count,
+                "wait": self.wait_histogram.summary(),
+                "service": self.service_histogram.summary(),
+            }
+
+    def summary_text(self) -> str:
+        summary = self.summary()
+        text = (
+            f"{summary['publisher']}: queue {summary['queue_depth']}/{summary['queue_size']},"
+            + f" {summary['dropped']} of {summary['pushed']} dropped"
+        )
+        if summary["service"]["count"] > 0:
+            text += f", service p95 {summary['service']['p95_ms']:.2f} ms"
+        return text
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                vector, enqueued_ns = self._queue.popleft()
+
+            started_ns = time.monotonic_ns()
+            try:
+                self.publisher.push(vector)
+            except Exception:
+                traceback.print_exc()
+            finished_ns = time.monotonic_ns()
+
+            with self._condition:
+                self.published_count += 1
+                self.wait_histogram.record(started_ns - enqueued_ns)
+                self.service_histogram.record(finished_ns - started_ns)
@@ -1,25 +1,155 @@
-import json
+import ipaddress
 import socket
+import struct
+import threading
+import time
 from datetime import datetime
+from typing import Optional
 
+import config
 from publishers.publisher import Publisher
 from misc import Vector
 
+# the same JSON json.dumps would create, but without building a dict and encoding it per message
+MESSAGE_TEMPLATE = '{"x": %s, "y": %s, "timestamp": "%s"}'
+
+# The binary format: a header followed by `count` records.
+# The timestamp is time.monotonic_ns() of the sender, the sequence number counts every pushed vector.
+BINARY_MAGIC = b"MIRA"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBB2x")  # magic, version, count
+BINARY_RECORD = struct.Struct("<QIdd")  # timestamp_ns, sequence_number, x, y
+
+MESSAGE_FORMATS = ("json", "binary")
+
 
 class UdpPublisher(Publisher):
-    """Pushes the vector as JSON objects over UDP"""
+    """Pushes the vector over UDP, either as JSON objects or in a compact binary format.
 
-    def __init__(self, host="127.0.0.1", port=9999):
-        self.sock = None
-        self.server_address = (host, port)
+    Every destination, which may also be a multicast group, gets an own connected socket.
+    With a batch size > 1, that many vectors are collected and sent in one datagram, as JSON array
+    or as binary records after one header. A batch that doesn't fill up, e.g. at a low sample rate,
+    is sent by an own thread once its first vector is `max_batch_age_ns` old."""
+
+    def __init__(
+        self,
+        host: str = None,
+        port: int = None,
+        destinations: list[tuple[str, int]] = None,
+        message_format: str = None,
+        batch_size: int = None,
+        max_batch_age_ns: int = None,
+    ):
+        if destinations is None:
+            if host is None and port is None:
+                destinations = config.UDP_PUBLISHER_DESTINATIONS
+            else:
+                destinations = [(host if host is not None else "127.0.0.1", port if port is not None else 9999)]
+        self.destinations = list(destinations)
+        self.message_format = message_format if message_format is not None else config.UDP_PUBLISHER_FORMAT
+        assert self.message_format in MESSAGE_FORMATS, f"unknown message format {self.message_format}"
+        self.batch_size = batch_size if batch_size is not None else config.UDP_PUBLISHER_BATCH_SIZE
+        assert 1 <= self.batch_size <= 255, "the batch size has to fit into the binary header"
+        if max_batch_age_ns is None:
+            max_batch_age_ns = config.UDP_PUBLISHER_MAX_BATCH_AGE_IN_MILLISEC * 1_000_000
+        self.max_batch_age_ns = max_batch_age_ns
+
+        self.sockets: list[socket.socket] = []
+        self.sequence_number = 0
+        self._batch_count = 0
+        self._json_messages = []
+        self._buffer = bytearray(BINARY_HEADER.size + self.batch_size * BINARY_RECORD.size)
+        self._buffer_view = memoryview(self._buffer)
+        # guards the batch, which the flush thread sends when it got too old
+        self._condition = threading.Condition()
+        self._batch_started_ns = 0
+        self._running = False
+        self._flush_thread: Optional[threading.Thread] = None
 
     def start(self):
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for host, port in self.destinations:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            if _is_multicast(host):
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, config.UDP_PUBLISHER_MULTICAST_TTL)
+            sock.connect((host, port))
+            self.sockets.append(sock)
+        if self.batch_size > 1:
+            self._running = True
+            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flush_thread.start()
 
     def stop(self):
-        self.sock.close()
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=1)
+        self._flush_thread = None
+        with self._condition:
+            if self._batch_count > 0:
+                self._send_batch()
+        for sock in self.sockets:
+            sock.close()
+        self.sockets = []
 
     def push(self, vector: Vector):
-        message = {"x": vector[0], "y": vector[1], "timestamp": str(datetime.now())}
-        json_message = json.dumps(message)
-        self.sock.sendto(json_message.encode(), self.server_address)
+        with self._condition:
+            self._add_to_batch(vector)
+
+    def _add_to_batch(self, vector: Vector):
+        self.sequence_number = (self.sequence_number + 1) & 0xFFFFFFFF
+        if self._batch_count == 0 and self.batch_size > 1:
+            self._batch_started_ns = time.monotonic_ns()
+            self._condition.notify()
+        if self.message_format == "binary":
+            BINARY_RECORD.pack_into(
+                self._buffer,
+                BINARY_HEADER.size + self._batch_count * BINARY_RECORD.size,
+                time.monotonic_ns(),
+                self.sequence_number,
+                vector[0],
+                vector[1],
+            )
+        else:
+            self._json_messages.append(
+                MESSAGE_TEMPLATE % (repr(float(vector[0])), repr(float(vector[1])), datetime.now())
+            )
+        self._batch_count += 1
+        if self._batch_count == self.batch_size:
+            self._send_batch()
+
+    def _flush_loop(self):
+        with self._condition:
+            while self._running:
+                if self._batch_count == 0:
+                    self._condition.wait()
+                    continue
+                remaining_ns = self._batch_started_ns + self.max_batch_age_ns - time.monotonic_ns()
+                if remaining_ns > 0:
+                    self._condition.wait(remaining_ns / 1_000_000_000)
+                else:
+                    self._send_batch()
+
+    def _send_batch(self):
+        if self.message_format == "binary":
+            BINARY_HEADER.pack_into(self._buffer, 0, BINARY_MAGIC, BINARY_VERSION, self._batch_count)
+            datagram = self._buffer_view[: BINARY_HEADER.size + self._batch_count * BINARY_RECORD.size]
+        elif self.batch_size == 1:
+            datagram = self._json_messages[0].encode()
+        else:
+            datagram = ("[" + ", ".join(self._json_messages) + "]").encode()
+        self._batch_count = 0
+        self._json_messages.clear()
+
+        for sock in self.sockets:
+            try:
+                sock.send(datagram)
+            except ConnectionError:
+                pass  # nobody listens at this destination right now, connected UDP sockets tell us so
+
+
+def _is_multicast(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_multicast
+    except ValueError:
+        return False  # a host name, e.g. "localhost"
@@ -0,0 +1,80 @@
+import os
+import struct
+import threading
+from typing import Optional
+
+import numpy as np
+
+from misc import Vector
+
+# A recording is a header followed by fixed-size records, one per data source sample.
+# Records are only ever appended, so a recording survives a crash up to the last flushed sample.
+HEADER = struct.Struct("<8sI4x")
+MAGIC = b"MIRANDA\x00"
+VERSION = 1
+
+SOURCE_KEY_LENGTH = 16
+RECORD = struct.Struct(f"<qdd{SOURCE_KEY_LENGTH}s")
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp_ns", "<i8"),
+        ("x", "<f8"),
+        ("y", "<f8"),
+        ("source", f"S{SOURCE_KEY_LENGTH}"),
+    ]
+)
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+
+class Recorder:
+    """Appends every sample of a data source to a binary recording.
+    `record` is meant to be subscribed to a DataSource."""
+
+    def __init__(self, path: str, source_key: str):
+        self.path = path
+        self.source_key = source_key.encode()[:SOURCE_KEY_LENGTH]
+        self._lock = threading.Lock()
+        self._file = None
+
+    def start(self):
+        is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        if not is_new:
+            read_header(self.path)  # refuse to append to anything else than a recording
+        self._file = open(self.path, "ab")
+        if is_new:
+            self._file.write(HEADER.pack(MAGIC, VERSION))
+
+    def stop(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def record(self, vector: Vector, timestamp_ns: int):
+        with self._lock:
+            if self._file is not None:
+                self._file.write(RECORD.pack(timestamp_ns, vector[0], vector[1], self.source_key))
+
+
+def read_header(path: str) -> int:
+    """Validates the header of a recording and returns its version."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is not a recording: the header is incomplete.")
+    magic, version = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a recording.")
+    if version != VERSION:
+        raise ValueError(f"{path} has the unsupported recording version {version}.")
+    return version
+
+
+def open_recording(path: str) -> Optional[np.memmap]:
+    """Maps the records of a recording into memory without reading them.
+    Returns None for a recording without records. An incomplete last record is ignored."""
+    read_header(path)
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if count == 0:
+        return None
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from misc import Vector
+
+# one timestamped mouse position: monotonic_ns, x, y
+Sample = tuple[int, float, float]
+
+
+class Resampler:
+    """Publishes mouse positions on a fixed output clock, independent of the rate of the data source.
+
+    Every tick, a position is estimated from the two latest mouse positions: between them it is
+    interpolated, after the latest one it is extrapolated along their velocity. By default the
+    output is delayed by one interval of the data source, so the tick's position lies between
+    two mouse positions and is interpolated. A positive `lead_time_ns` instead predicts ahead of
+    the tick's time, extrapolating to hide the latency of the pipeline. A negative one delays
+    the output further. Extrapolation is limited to `max_extrapolation_ns` after the latest
+    position. When no new position arrived for longer than that, nothing is published at all.
+
+    `add` is called by the engine's thread, the ticks run on an own thread."""
+
+    def __init__(
+        self,
+        output_rate_in_hz: float,
+        push: Callable[[Vector], None],
+        lead_time_ns: int = 0,
+        max_extrapolation_ns: int = 50_000_000,
+        bounds: Optional[tuple[float, float, float, float]] = None,
+    ):
+        self.interval_ns = int(1_000_000_000 / output_rate_in_hz)
+        self.push = push
+        self.lead_time_ns = lead_time_ns
+        self.max_extrapolation_ns = max_extrapolation_ns
+        # left, top, right and bottom the positions are clamped to, as extrapolation may overshoot the screen
+        self.bounds = bounds
+
+        # replaced as a whole, so the ticks always see a consistent pair
+        self._samples: tuple[Optional[Sample], Optional[Sample]] = (None, None)
+        # the smoothed interval between the mouse positions, the interpolation delay
+        self.source_interval_ns = 0
+        self._position = [0.0, 0.0]
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._tick_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1)
+
+    def add(self, mouse_position: Vector, timestamp_ns: int):
+        latest = self._samples[1]
+        sample = (timestamp_ns, mouse_position[0], mouse_position[1])
+        if latest is None or timestamp_ns <= latest[0]:
+            self._samples = (None, sample)
+        else:
+            self._samples = (latest, sample)
+            interval_ns = timestamp_ns - latest[0]
+            if self.source_interval_ns == 0:
+                self.source_interval_ns = interval_ns
+            elif interval_ns <= 4 * self.source_interval_ns:  # a gap in the data is no interval
+                self.source_interval_ns += (interval_ns - self.source_interval_ns) // 8
+
+    def reset(self):
+        self._samples = (None, None)
+        self.source_interval_ns = 0
+
+    def target_time(self, tick_ns: int) -> int:
+        """The time the position published at the given tick is estimated for."""
+        if self.lead_time_ns > 0:
+            return tick_ns + self.lead_time_ns
+        return tick_ns + self.lead_time_ns - self.source_interval_ns
+
+    def position_at(self, timestamp_ns: int, mouse_position: list) -> bool:
+        """Writes the estimated position at the given time into `mouse_position`.
+        Returns False if there is no position to estimate from."""
+        previous, latest = self._samples
+        if latest is None or timestamp_ns - latest[0] > self.max_extrapolation_ns:
+            return False
+        if previous is None:
+            mouse_position[0] = latest[1]
+            mouse_position[1] = latest[2]
+        else:
+            # the line through both positions, never reaching back further than the previous one
+            t = (max(timestamp_ns, previous[0]) - latest[0]) / (latest[0] - previous[0])
+            mouse_position[0] = latest[1] + (latest[1] - previous[1]) * t
+            mouse_position[1] = latest[2] + (latest[2] - previous[2]) * t
+        if self.bounds is not None:
+            left, top, right, bottom = self.bounds
+            x = mouse_position[0]
+            y = mouse_position[1]
+            mouse_position[0] = left if x < left else right if x > right else x
+            mouse_position[1] = top if y < top else bottom if y > bottom else y
+        return True
+
+    def _tick_loop(self):
+        next_tick_ns = time.monotonic_ns()
+        while not self._stop_event.is_set():
+            if self.position_at(self.target_time(next_tick_ns), self._position):
+                self.push(self._position)
+
+            next_tick_ns += self.interval_ns
+            now_ns = time.monotonic_ns()
+            if next_tick_ns < now_ns:
+                # we fell behind, e.g. after a long push, so skip the missed ticks instead of catching up
+                next_tick_ns = now_ns
+            self._stop_event.wait((next_tick_ns - now_ns) / 1_000_000_000)
@@ -0,0 +1,127 @@
+from typing import Optional
+
+import numpy as np
+
+from misc import Vector
+
+
+class SampleBuffer:
+    """A fixed-capacity ring buffer holding the most recent (monotonic_ns, x, y) samples.
+
+    All memory is allocated up front. Every sample is written twice, at its ring index and
+    at ring index + capacity, so the last n samples are always one contiguous slice. This
+    way `timestamps`, `vectors` and `window` return views without copying.
+
+    The buffer has a single writer, usually the thread of a DataSource. Views handed out
+    to readers are overwritten once the buffer wraps around, so readers that keep them
+    for longer than a couple of samples have to copy them."""
+
+    def __init__(self, capacity: int):
+        assert capacity > 0
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self._vectors = np.zeros((2 * capacity, 2), dtype=np.float64)
+        self._next_index = 0
+        self._count = 0
+
+        # running sums over the buffered samples, for O(1) mean and standard deviation
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_of_squares_x = 0.0
+        self._sum_of_squares_y = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        self._next_index = 0
+        self._count = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_of_squares_x = 0.0
+        self._sum_of_squares_y = 0.0
+
+    def append(self, vector: Vector, timestamp_ns: int):
+        i = self._next_index
+        x, y = float(vector[0]), float(vector[1])
+
+        if self._count == self.capacity:
+            old_x = float(self._vectors[i, 0])
+            old_y = float(self._vectors[i, 1])
+            self._sum_x -= old_x
+            self._sum_y -= old_y
+            self._sum_of_squares_x -= old_x * old_x
+            self._sum_of_squares_y -= old_y * old_y
+        else:
+            self._count += 1
+
+        self._timestamps[i] = timestamp_ns
+        self._timestamps[i + self.capacity] = timestamp_ns
+        self._vectors[i, 0] = x
+        self._vectors[i, 1] = y
+        self._vectors[i + self.capacity, 0] = x
+        self._vectors[i + self.capacity, 1] = y
+        self._sum_x += x
+        self._sum_y += y
+        self._sum_of_squares_x += x * x
+        self._sum_of_squares_y += y * y
+
+        self._next_index = (i + 1) % self.capacity
+
+    def timestamps(self, n: int = None) -> np.ndarray:
+        """The timestamps of the last n samples (all by default), oldest first."""
+        start, end = self._slice(n)
+        return self._timestamps[start:end]
+
+    def vectors(self, n: int = None) -> np.ndarray:
+        """The (n, 2) vectors of the last n samples (all by default), oldest first."""
+        start, end = self._slice(n)
+        return self._vectors[start:end]
+
+    def window(self, start_ns: int, end_ns: int = None) -> tuple[np.ndarray, np.ndarray]:
+        """The timestamps and vectors of all buffered samples with start_ns <= timestamp < end_ns."""
+        timestamps = self.timestamps()
+        first = np.searchsorted(timestamps, start_ns, side="left")
+        last = len(timestamps) if end_ns is None else np.searchsorted(timestamps, end_ns, side="left")
+        return timestamps[first:last], self.vectors()[first:last]
+
+    def last_seconds(self, seconds: float, now_ns: int = None) -> tuple[np.ndarray, np.ndarray]:
+        """The timestamps and vectors of the samples of the last given seconds."""
+        if now_ns is None:
+            if self._count == 0:
+                return self.window(0)
+            now_ns = int(self.timestamps(1)[0])
+        return self.window(now_ns - int(seconds * 1_000_000_000), now_ns + 1)
+
+    def latest(self) -> Optional[tuple[int, Vector]]:
+        if self._count == 0:
+            return None
+        i = (self._next_index - 1) % self.capacity
+        return int(self._timestamps[i]), (float(self._vectors[i, 0]), float(self._vectors[i, 1]))
+
+    def mean(self) -> Optional[Vector]:
+        if self._count == 0:
+            return None
+        return (self._sum_x / self._count, self._sum_y / self._count)
+
+    def std(self) -> Optional[Vector]:
+        if self._count == 0:
+            return None
+        mean_x, mean_y = self.mean()
+        variance_x = max(self._sum_of_squares_x / self._count - mean_x * mean_x, 0.0)
+        variance_y = max(self._sum_of_squares_y / self._count - mean_y * mean_y, 0.0)
+        return (variance_x**0.5, variance_y**0.5)
+
+    def sample_rate(self) -> Optional[float]:
+        """The average sample rate in Hz over the buffered samples."""
+        if self._count < 2:
+            return None
+        timestamps = self.timestamps()
+        duration_ns = timestamps[-1] - timestamps[0]
+        return (self._count - 1) * 1_000_000_000 / duration_ns if duration_ns > 0 else None
+
+    def _slice(self, n: Optional[int]) -> tuple[int, int]:
+        n = self._count if n is None else min(n, self._count)
+        # until the buffer is full, nothing wrapped around yet
+        end = self._next_index + self.capacity if self._count == self.capacity else self._next_index
+        return end - n, end
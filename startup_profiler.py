@@ -0,0 +1,95 @@
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from typing import Optional, TextIO
+
+
+class _TimedLoader:
+    """Wraps the loader of a module to time the execution of the module."""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+
+class StartupProfiler(MetaPathFinder):
+    """Measures how long importing every module takes, like `python -X importtime`,
+    but also for frozen builds, where that option is not available.
+
+    Installed as first finder of `sys.meta_path`, it lets the other finders find the modules and wraps
+    their loaders. The self time of a module excludes the modules it imports, the cumulative time
+    includes them."""
+
+    def __init__(self):
+        self.started_ns = time.perf_counter_ns()
+        # (module name, nesting level, self time, cumulative time), in the order the imports finished
+        self.imports: list[tuple[str, int, int, int]] = []
+        # start time and time spent in nested imports of the imports running
+        self._stack: list[list[int]] = []
+        self._finding = False
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._finding = False
+
+    def _enter(self):
+        self._stack.append([time.perf_counter_ns(), 0])
+
+    def _exit(self, name: str):
+        started_ns, nested_ns = self._stack.pop()
+        cumulative_ns = time.perf_counter_ns() - started_ns
+        if self._stack:
+            self._stack[-1][1] += cumulative_ns
+        self.imports.append((name, len(self._stack), cumulative_ns - nested_ns, cumulative_ns))
+
+    def report(self, file: TextIO = None, slowest: Optional[int] = 15):
+        """Prints every import in the format of `-X importtime`, the slowest top-level imports and
+        the time since the profiler got created."""
+        file = file if file is not None else sys.stderr
+        print("import time: self [us] | cumulative | imported package", file=file)
+        for name, level, self_ns, cumulative_ns in self.imports:
+            print(f"import time: {self_ns // 1000:>9} | {cumulative_ns // 1000:>10} | {'  ' * level}{name}", file=file)
+        if slowest:
+            print(f"\nslowest {slowest} top-level imports [ms]:", file=file)
+            top_level = sorted((i for i in self.imports if i[1] == 0), key=lambda i: i[3], reverse=True)
+            for name, _, _, cumulative_ns in top_level[:slowest]:
+                print(f"{cumulative_ns / 1_000_000:>9.1f}  {name}", file=file)
+        total_ns = sum(i[3] for i in self.imports if i[1] == 0)
+        print(
+            f"\n{len(self.imports)} modules imported in {total_ns / 1_000_000:.1f} ms,"
+            + f" startup took {(time.perf_counter_ns() - self.started_ns) / 1_000_000:.1f} ms",
+            file=file,
+        )
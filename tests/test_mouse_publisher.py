@@ -0,0 +1,71 @@
+import unittest
+
+from cursors.cursor_backend import CursorBackend
+from monitors import Monitor, MonitorLayout
+from publishers.mouse_publisher import MousePublisher
+
+# a 1920x1080 monitor and a 1280x720 one right of it, so below the latter is a dead zone
+LAYOUT = MonitorLayout([Monitor(0, 0, 1920, 1080, is_primary=True), Monitor(1920, 0, 1280, 720)])
+
+
+class FakeCursorBackend(CursorBackend):
+    """Moves like a system that keeps the cursor on the monitors."""
+
+    def __init__(self):
+        self.cursor_position = (0, 0)
+        self.moves = 0
+
+    def position(self):
+        return self.cursor_position
+
+    def bounds(self):
+        return (0, 0, 3200, 1080)
+
+    def _move(self, x, y):
+        self.moves += 1
+        self.cursor_position = (x, y) if LAYOUT.monitor_at((x, y)) is not None else (x, 719)
+
+
+class MousePublisherTest(unittest.TestCase):
+    """Runs without any display, e.g. with `python -m unittest discover tests`."""
+
+    def setUp(self):
+        self.backend = FakeCursorBackend()
+        self.publisher = MousePublisher(self.backend)
+        self.publisher.start()
+        self.publisher.monitor_layout = LAYOUT
+
+    def test_moves_the_cursor(self):
+        self.publisher.push((100.4, 200.6))
+        self.assertEqual(self.backend.cursor_position, (100, 201))
+
+    def test_clamps_to_the_desktop(self):
+        self.publisher.push((5000, -10))
+        self.assertEqual(self.backend.cursor_position, (3199, 0))
+        self.assertIsNone(self.publisher.pause_publishing_until)
+
+    def test_dead_zone_is_no_manual_move(self):
+        for vector in ((2500, 900), (2600, 1000), (100, 100)):
+            self.publisher.push(vector)
+        self.assertIsNone(self.publisher.pause_publishing_until)
+        self.assertEqual(self.backend.cursor_position, (100, 100))
+
+    def test_small_mismatch_is_no_manual_move(self):
+        self.publisher.push((100, 100))
+        self.backend.cursor_position = (101, 99)
+        self.publisher.push((300, 300))
+        self.assertIsNone(self.publisher.pause_publishing_until)
+        self.assertEqual(self.backend.cursor_position, (300, 300))
+
+    def test_pauses_after_a_manual_move(self):
+        self.publisher.push((100, 100))
+        self.backend.cursor_position = (500, 500)
+        self.publisher.push((300, 300))
+        self.assertIsNotNone(self.publisher.pause_publishing_until)
+        self.assertEqual(self.publisher.manually_moved_to, (500, 500))
+        self.publisher.push((400, 400))
+        self.assertEqual(self.backend.cursor_position, (500, 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import shutil
+import subprocess
+import time
+import unittest
+
+XVFB = shutil.which("Xvfb")
+
+
+@unittest.skipIf(XVFB is None, "needs Xvfb")
+class XlibCursorBackendTest(unittest.TestCase):
+    """Moves the cursor of a virtual X server, run e.g. with `python -m unittest discover tests`."""
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from cursors.xlib_cursor_backend import XlibCursorBackend
+        except ImportError as e:
+            raise unittest.SkipTest(f"needs python-xlib: {e}")
+        cls.display_name = f":{90 + os.getpid() % 100}"
+        cls.xvfb = subprocess.Popen(
+            [XVFB, cls.display_name, "-screen", "0", "800x600x24", "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                cls.backend = XlibCursorBackend(cls.display_name)
+                break
+            except Exception:
+                if time.monotonic() > deadline or cls.xvfb.poll() is not None:
+                    cls.xvfb.kill()
+                    raise
+                time.sleep(0.1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.backend.close()
+        cls.xvfb.terminate()
+        cls.xvfb.wait(timeout=5)
+
+    def assert_position(self, expected):
+        # the move is sent without waiting for the X server, so it may take a moment
+        deadline = time.monotonic() + 2
+        while self.backend.position() != expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.backend.position(), expected)
+
+    def test_bounds_are_the_screen(self):
+        self.assertEqual(self.backend.bounds(), (0, 0, 800, 600))
+
+    def test_move_to(self):
+        self.assertEqual(self.backend.move_to(123.4, 456.6), (123, 457))
+        self.assert_position((123, 457))
+
+    def test_move_to_clamps_to_the_screen(self):
+        self.assertEqual(self.backend.move_to(-50, 10_000), (0, 599))
+        self.assert_position((0, 599))
+
+    def test_move_to_skips_the_current_position(self):
+        self.backend.move_to(10, 20)
+        self.assert_position((10, 20))
+        self.assertEqual(self.backend.move_to(10.2, 19.8, current_position=(10, 20)), (10, 20))
+        self.assert_position((10, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,19 @@
-from tracking_approaches.d_pad_tracking_approach import DPadTrackingApproach
-from tracking_approaches.gaze_on_screen_tracking_approach import \
-    GazeOnScreenTrackingApproach
 from misc import resource_path
-from guis.tkinter.main_menu_window import MainMenuOption
+from plugins import PluginOption
 
-tracking_approaches: dict[MainMenuOption] = {
-    "gaze-on-screen": MainMenuOption(
+tracking_approaches: dict[str, PluginOption] = {
+    "gaze-on-screen": PluginOption(
         key="gaze-on-screen",
         title="Gaze on Screen",
         description="Take the gaze and map it to the screen directly.",
         icon=resource_path("assets/tracking_approach_gaze_on_screen.png"),
-        clazz=GazeOnScreenTrackingApproach,
+        clazz="tracking_approaches.gaze_on_screen_tracking_approach:GazeOnScreenTrackingApproach",
     ),
-    "d-pad": MainMenuOption(
+    "d-pad": PluginOption(
         key="d-pad",
         title="D-Pad",
         description='Control the "gaze" by looking on a D-Pad.',
         icon=resource_path("assets/tracking_approach_d_pad.png"),
-        clazz=DPadTrackingApproach,
+        clazz="tracking_approaches.d_pad_tracking_approach:DPadTrackingApproach",
     ),
 }
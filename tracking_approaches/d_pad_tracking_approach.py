@@ -2,43 +2,20 @@ from typing import Optional
 
 import numpy as np
 
-from calibration import (CalibrationInstruction, CalibrationInstructions,
-                         CalibrationResult)
+from calibration import CalibrationInstruction, CalibrationInstructions
 from misc import Vector
-from mouse_movement import MouseMovement, MouseMovementType
-from tracking_approaches.tracking_approach import TrackingApproach
+from mouse_movement import MouseMovement, MouseMovements, MouseMovementType
+from tracking_approaches.homography import (perspective_transform,
+                                            perspective_transform_batch)
+from tracking_approaches.homography_tracking_approach import \
+    HomographyTrackingApproach
 
 
-def compute_perspective_transformation_matrix(src_matrix, dst_matrix):
-    A = []
-    for i in range(4):
-        x, y = src_matrix[i][0], src_matrix[i][1]
-        u, v = dst_matrix[i][0], dst_matrix[i][1]
-        A.append([-x, -y, -1, 0, 0, 0, x * u, y * u, u])
-        A.append([0, 0, 0, -x, -y, -1, x * v, y * v, v])
-    A = np.array(A)
-
-    U, S, Vt = np.linalg.svd(A)
-    H = Vt[-1].reshape(3, 3)
-
-    return H / H[-1, -1]
-
-
-def perspective_transform(transformation_matrix, vector):
-    vector_homogeneous = np.array([vector[0], vector[1], 1])
-    transformed_vector_homogeneous = np.dot(transformation_matrix, vector_homogeneous)
-    transformed_vector = transformed_vector_homogeneous[:2] / transformed_vector_homogeneous[2]
-    return transformed_vector
-
-
-class DPadTrackingApproach(TrackingApproach):
+class DPadTrackingApproach(HomographyTrackingApproach):
     """A TrackingApproach using a d-pad.
     Look at the corners of the d-pad moves the mouse cursor.
     Looking outside the d-pad and at the center of the d-pad stops the mouse movement."""
 
-    def __init__(self):
-        self.transformation_matrix = None
-
     def get_calibration_instructions(self) -> CalibrationInstructions:
         return CalibrationInstructions(
             "The following instructions will tell to you to look onto specific corners of your d-pad.",
@@ -50,19 +27,43 @@ class DPadTrackingApproach(TrackingApproach):
             ],
         )
 
-    def calibrate(self, calibration_result: CalibrationResult):
-        self.transformation_matrix = compute_perspective_transformation_matrix(
-            calibration_result.vectors, [(-1, 1), (1, 1), (1, -1), (-1, -1)]
-        )
-
-    def is_calibrated(self) -> bool:
-        return self.transformation_matrix is not None
+    def get_drift_check(self) -> Optional[tuple[CalibrationInstruction, Vector]]:
+        return CalibrationInstruction(text="look at the CENTER of your d-pad."), (0, 0)
 
     def get_next_mouse_movement(self, vector: Vector) -> Optional[MouseMovement]:
-        new_vector = perspective_transform(self.transformation_matrix, vector)
+        calibration = self.calibration
+        if calibration is None:
+            return None
+        new_vector = perspective_transform(calibration.matrix, vector)
 
         if (-1 <= new_vector[0] <= 1) and (1 >= new_vector[1] >= -1):
             if not ((-0.25 <= new_vector[0] <= 0.25) and (0.25 >= new_vector[1] >= -0.25)):
                 return MouseMovement(MouseMovementType.BY, new_vector)
 
         return MouseMovement(MouseMovementType.BY, (0, 0))
+
+    def update_mouse_movement(self, vector: Vector, mouse_movement: MouseMovement) -> bool:
+        calibration = self.calibration
+        if calibration is None:
+            return False
+        new_vector = mouse_movement.vector
+        calibration.compiled.transform_into(vector[0], vector[1], new_vector)
+        x, y = new_vector[0], new_vector[1]
+        if not ((-1 <= x <= 1) and (1 >= y >= -1)) or ((-0.25 <= x <= 0.25) and (0.25 >= y >= -0.25)):
+            new_vector[0] = 0.0
+            new_vector[1] = 0.0
+        mouse_movement.type = MouseMovementType.BY
+        return True
+
+    def get_mouse_movements(self, vectors: np.ndarray) -> Optional[MouseMovements]:
+        calibration = self.calibration
+        if len(vectors) == 0 or calibration is None:
+            return None
+        new_vectors = perspective_transform_batch(calibration.matrix, vectors)
+        x = new_vectors[:, 0]
+        y = new_vectors[:, 1]
+        in_d_pad = (-1 <= x) & (x <= 1) & (-1 <= y) & (y <= 1)
+        in_center = (-0.25 <= x) & (x <= 0.25) & (-0.25 <= y) & (y <= 0.25)
+        new_vectors[~(in_d_pad & ~in_center)] = 0
+        # like get_next_mouse_movement, every vector results in a movement, standing still is a movement by (0, 0)
+        return MouseMovements(MouseMovementType.BY, new_vectors, np.ones(len(new_vectors), dtype=bool))
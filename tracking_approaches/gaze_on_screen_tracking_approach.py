@@ -2,41 +2,20 @@ from typing import Optional
 
 import numpy as np
 
-from calibration import (CalibrationInstruction, CalibrationInstructions,
-                         CalibrationResult)
+from calibration import CalibrationInstruction, CalibrationInstructions
 from misc import Vector
-from mouse_movement import MouseMovement, MouseMovementType
-from tracking_approaches.tracking_approach import TrackingApproach
+from mouse_movement import MouseMovement, MouseMovements, MouseMovementType
+from tracking_approaches.homography import (perspective_transform,
+                                            perspective_transform_batch)
+from tracking_approaches.homography_tracking_approach import \
+    HomographyTrackingApproach
 
 
-def compute_perspective_transformation_matrix(src_matrix, dst_matrix):
-    A = []
-    for i in range(4):
-        x, y = src_matrix[i][0], src_matrix[i][1]
-        u, v = dst_matrix[i][0], dst_matrix[i][1]
-        A.append([-x, -y, -1, 0, 0, 0, x * u, y * u, u])
-        A.append([0, 0, 0, -x, -y, -1, x * v, y * v, v])
-    A = np.array(A)
-
-    U, S, Vt = np.linalg.svd(A)
-    H = Vt[-1].reshape(3, 3)
-
-    return H / H[-1, -1]
-
-
-def perspective_transform(transformation_matrix, vector):
-    vector_homogeneous = np.array([vector[0], vector[1], 1])
-    transformed_vector_homogeneous = np.dot(transformation_matrix, vector_homogeneous)
-    transformed_vector = transformed_vector_homogeneous[:2] / transformed_vector_homogeneous[2]
-    return transformed_vector
-
-
-class GazeOnScreenTrackingApproach(TrackingApproach):
+class GazeOnScreenTrackingApproach(HomographyTrackingApproach):
     """The most classical TrackingApproach:
     Directly translate the user's gaze onto the screen."""
 
-    def __init__(self):
-        self.transformation_matrix = None
+    has_screen_targets = True
 
     def get_calibration_instructions(self) -> CalibrationInstructions:
         return CalibrationInstructions(
@@ -49,15 +28,27 @@ class GazeOnScreenTrackingApproach(TrackingApproach):
             ],
         )
 
-    def calibrate(self, calibration_result: CalibrationResult):
-        self.transformation_matrix = compute_perspective_transformation_matrix(
-            calibration_result.vectors,
-            [instruction.vector for instruction in self.get_calibration_instructions().instructions],
-        )
-
-    def is_calibrated(self) -> bool:
-        return self.transformation_matrix is not None
+    def get_drift_check(self) -> Optional[tuple[CalibrationInstruction, Vector]]:
+        return CalibrationInstruction((0, 0), "look at the CENTER."), (0, 0)
 
     def get_next_mouse_movement(self, vector: Vector) -> Optional[MouseMovement]:
-        new_vector = perspective_transform(self.transformation_matrix, vector)
+        calibration = self.calibration
+        if calibration is None:
+            return None
+        new_vector = perspective_transform(calibration.matrix, vector)
         return MouseMovement(MouseMovementType.TO_POSITION, new_vector)
+
+    def update_mouse_movement(self, vector: Vector, mouse_movement: MouseMovement) -> bool:
+        calibration = self.calibration
+        if calibration is None:
+            return False
+        calibration.compiled.transform_into(vector[0], vector[1], mouse_movement.vector)
+        mouse_movement.type = MouseMovementType.TO_POSITION
+        return True
+
+    def get_mouse_movements(self, vectors: np.ndarray) -> Optional[MouseMovements]:
+        calibration = self.calibration
+        if len(vectors) == 0 or calibration is None:
+            return None
+        new_vectors = perspective_transform_batch(calibration.matrix, vectors)
+        return MouseMovements(MouseMovementType.TO_POSITION, new_vectors, np.ones(len(new_vectors), dtype=bool))
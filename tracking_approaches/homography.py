@@ -0,0 +1,118 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+def compute_perspective_transformation_matrix(src_matrix, dst_matrix):
+    A = []
+    for i in range(4):
+        x, y = src_matrix[i][0], src_matrix[i][1]
+        u, v = dst_matrix[i][0], dst_matrix[i][1]
+        A.append([-x, -y, -1, 0, 0, 0, x * u, y * u, u])
+        A.append([0, 0, 0, -x, -y, -1, x * v, y * v, v])
+    A = np.array(A)
+
+    U, S, Vt = np.linalg.svd(A)
+    H = Vt[-1].reshape(3, 3)
+
+    return H / H[-1, -1]
+
+
+def perspective_transform(transformation_matrix, vector):
+    vector_homogeneous = np.array([vector[0], vector[1], 1])
+    transformed_vector_homogeneous = np.dot(transformation_matrix, vector_homogeneous)
+    transformed_vector = transformed_vector_homogeneous[:2] / transformed_vector_homogeneous[2]
+    return transformed_vector
+
+
+def perspective_transform_batch(transformation_matrix, vectors: np.ndarray) -> np.ndarray:
+    """Transforms an (N, 2) array of vectors at once. Returns an (N, 2) array."""
+    vectors = np.asarray(vectors, dtype=np.float64)
+    H = transformation_matrix
+    x = vectors[:, 0]
+    y = vectors[:, 1]
+    w = H[2, 0] * x + H[2, 1] * y + H[2, 2]
+    transformed_vectors = np.empty_like(vectors)
+    transformed_vectors[:, 0] = (H[0, 0] * x + H[0, 1] * y + H[0, 2]) / w
+    transformed_vectors[:, 1] = (H[1, 0] * x + H[1, 1] * y + H[1, 2]) / w
+    return transformed_vectors
+
+
+class CompiledHomography:
+    """A transformation matrix unpacked into plain floats.
+    Transforming a vector with it is scalar math only: no numpy arrays get allocated."""
+
+    __slots__ = ("h00", "h01", "h02", "h10", "h11", "h12", "h20", "h21", "h22")
+
+    def __init__(self, transformation_matrix):
+        ((self.h00, self.h01, self.h02), (self.h10, self.h11, self.h12), (self.h20, self.h21, self.h22)) = (
+            np.asarray(transformation_matrix, dtype=np.float64).tolist()
+        )
+
+    def transform_into(self, x: float, y: float, out: list):
+        """Transforms (x, y) and writes the result into the first two elements of `out`."""
+        w = self.h20 * x + self.h21 * y + self.h22
+        out[0] = (self.h00 * x + self.h01 * y + self.h02) / w
+        out[1] = (self.h10 * x + self.h11 * y + self.h12) / w
+
+
+class HomographyCalibration(NamedTuple):
+    """An immutable snapshot of a calibrated homography: the transformation matrix and its compiled form.
+    TrackingApproaches hold it in a single attribute, so replacing it is one atomic reference swap
+    and a thread reading it once per sample always gets a consistent matrix and compiled form."""
+
+    matrix: np.ndarray
+    compiled: CompiledHomography
+
+    @classmethod
+    def compute(cls, src_matrix, dst_matrix) -> "HomographyCalibration":
+        matrix = compute_perspective_transformation_matrix(src_matrix, dst_matrix)
+        matrix.flags.writeable = False
+        return cls(matrix, CompiledHomography(matrix))
+
+
+class HomographyRLS:
+    """Corrects the drift of a calibrated homography online, by recursive least squares.
+
+    Each correspondence, a source vector and the target the user looked at meanwhile, gives two
+    linear equations in the 8 free parameters of the homography (h22 = 1). Folding them into the
+    fit takes constant time. The fit starts at the given calibration. `initial_uncertainty` sets
+    how far the first correspondences may pull it. The `forgetting_factor` (< 1) makes older
+    correspondences count less over time. To keep the fit stable when correspondences are rare or
+    similar, its uncertainty never grows beyond the initial one."""
+
+    def __init__(
+        self, calibration: HomographyCalibration, forgetting_factor: float = 0.98, initial_uncertainty: float = 1.0
+    ):
+        self.forgetting_factor = forgetting_factor
+        self.calibration = calibration
+        self._parameters = (calibration.matrix / calibration.matrix[2, 2]).flatten()[:8].copy()
+        self._covariance = np.eye(8) * initial_uncertainty
+        self._max_trace = 8 * initial_uncertainty
+        self._features = np.zeros(8)
+
+    def add_correspondence(self, source: tuple[float, float], target: tuple[float, float]) -> HomographyCalibration:
+        """Folds the correspondence into the fit and returns the corrected calibration."""
+        x, y = source
+        u, v = target
+        features = self._features
+        for is_v, observed in ((False, u), (True, v)):
+            features[:] = 0
+            offset = 3 if is_v else 0
+            features[offset : offset + 3] = (x, y, 1)
+            features[6:] = (-observed * x, -observed * y)
+
+            covariance_features = self._covariance @ features
+            gain = covariance_features / (self.forgetting_factor + features @ covariance_features)
+            self._parameters += gain * (observed - features @ self._parameters)
+            self._covariance -= np.outer(gain, covariance_features)
+            self._covariance /= self.forgetting_factor
+
+        trace = np.trace(self._covariance)
+        if trace > self._max_trace:
+            self._covariance *= self._max_trace / trace
+
+        matrix = np.append(self._parameters, 1.0).reshape(3, 3)
+        matrix.flags.writeable = False
+        self.calibration = HomographyCalibration(matrix, CompiledHomography(matrix))
+        return self.calibration
@@ -0,0 +1,54 @@
+from typing import Optional
+
+import numpy as np
+
+import config
+from calibration import CalibrationResult
+from misc import Vector
+from tracking_approaches.homography import HomographyCalibration, HomographyRLS
+from tracking_approaches.tracking_approach import TrackingApproach
+
+
+class HomographyTrackingApproach(TrackingApproach):
+    """A TrackingApproach mapping the vectors by a homography, calibrated by four corners.
+    It corrects the drift of the homography online, see `add_correspondence`."""
+
+    # the vectors the four corners of the CalibrationResult are mapped onto
+    calibration_targets: list[Vector] = [(-1, 1), (1, 1), (1, -1), (-1, -1)]
+
+    def __init__(self):
+        # replaced as a whole, never changed in place
+        self.calibration: Optional[HomographyCalibration] = None
+        self.drift_correction: Optional[HomographyRLS] = None
+
+    @property
+    def transformation_matrix(self) -> Optional[np.ndarray]:
+        calibration = self.calibration
+        return calibration.matrix if calibration is not None else None
+
+    def compile_calibration(self, calibration_result: CalibrationResult) -> HomographyCalibration:
+        return HomographyCalibration.compute(calibration_result.vectors, self.calibration_targets)
+
+    def calibrate(self, calibration_result: CalibrationResult):
+        self.calibration = self.compile_calibration(calibration_result)
+
+    def get_compiled_calibration(self) -> Optional[HomographyCalibration]:
+        return self.calibration
+
+    def set_compiled_calibration(self, compiled_calibration: Optional[HomographyCalibration]):
+        self.calibration = compiled_calibration
+
+    def is_calibrated(self) -> bool:
+        return self.calibration is not None
+
+    def add_correspondence(self, vector: Vector, target: Vector) -> bool:
+        calibration = self.calibration
+        if calibration is None:
+            return False
+        if self.drift_correction is None or self.drift_correction.calibration is not calibration:
+            # calibrated anew meanwhile, so the correction starts over from there
+            self.drift_correction = HomographyRLS(
+                calibration, config.DRIFT_CORRECTION_FORGETTING_FACTOR, config.DRIFT_CORRECTION_INITIAL_UNCERTAINTY
+            )
+        self.calibration = self.drift_correction.add_correspondence(vector, target)
+        return True
@@ -2,8 +2,11 @@ from abc import ABC, abstractmethod
 from misc import Vector
 from typing import Optional
 
-from calibration import CalibrationInstructions, CalibrationResult
-from mouse_movement import MouseMovement
+import numpy as np
+
+from calibration import (CalibrationInstruction, CalibrationInstructions,
+                         CalibrationResult)
+from mouse_movement import MouseMovement, MouseMovements
 
 
 class TrackingApproach(ABC):
@@ -17,6 +20,10 @@ class TrackingApproach(ABC):
     a calibration, a list of CalibrationInstructions are provided.
     """
 
+    # True if the targets of the CalibrationInstructions are positions on the screen,
+    # so anything the user looks at on the screen can serve as target of `add_correspondence`
+    has_screen_targets = False
+
     @abstractmethod
     def get_calibration_instructions(self) -> CalibrationInstructions:
         """Gives CalibrationInstructions for guiding a calibration."""
@@ -28,6 +35,36 @@ class TrackingApproach(ABC):
         a transformation matrix will be created."""
         pass
 
+    def compile_calibration(self, calibration_result: CalibrationResult) -> Optional[object]:
+        """Computes everything `calibrate` would, e.g. a transformation matrix, without calibrating
+        the TrackingApproach, and returns it as an immutable snapshot for `set_compiled_calibration`.
+        Returns None if not supported."""
+        return None
+
+    def get_compiled_calibration(self) -> Optional[object]:
+        """The snapshot the TrackingApproach is currently calibrated with, to be restored by
+        `set_compiled_calibration` later without computing it again. The snapshot must not be
+        changed afterwards, since it may be shared. Returns None if not supported."""
+        return None
+
+    def set_compiled_calibration(self, compiled_calibration: Optional[object]):
+        """Calibrates the TrackingApproach with a snapshot of `compile_calibration` or `get_compiled_calibration`,
+        or uncalibrates it with None. Implementations replace the snapshot with a single reference
+        assignment, so it can be called while another thread transforms vectors.
+        Does nothing by default, since there are no snapshots unless `compile_calibration` is supported."""
+        pass
+
+    def add_correspondence(self, vector: Vector, target: Vector) -> bool:
+        """Corrects the calibration online with a vector and the target the user looked at meanwhile,
+        given in the coordinates of the CalibrationInstructions, e.g. when a gaze button got triggered.
+        Returns False if not supported or not calibrated."""
+        return False
+
+    def get_drift_check(self) -> Optional[tuple[CalibrationInstruction, Vector]]:
+        """The instruction of a quick check with a single target, and that target. The vector collected
+        meanwhile is passed to `add_correspondence`. Returns None if not supported."""
+        return None
+
     @abstractmethod
     def is_calibrated(self) -> bool:
         """Returns True if the TrackingApproach has been calibrated."""
@@ -38,3 +75,36 @@ class TrackingApproach(ABC):
         """Based on a vector, a MouseMovement might be translated. For example, when looking at
         a certain position, the mouse shall move to a certain position on the screen."""
         pass
+
+    def update_mouse_movement(self, vector: Vector, mouse_movement: MouseMovement) -> bool:
+        """The allocation-free counterpart of `get_next_mouse_movement`: writes type and vector
+        of the MouseMovement into the given one, whose vector has to be a mutable sequence
+        of length 2. Returns False if there is no MouseMovement.
+
+        This default implementation copies the result of `get_next_mouse_movement`.
+        TrackingApproaches override it to skip the allocations."""
+        new_mouse_movement = self.get_next_mouse_movement(vector)
+        if new_mouse_movement is None:
+            return False
+        mouse_movement.type = new_mouse_movement.type
+        mouse_movement.vector[0] = new_mouse_movement.vector[0]
+        mouse_movement.vector[1] = new_mouse_movement.vector[1]
+        return True
+
+    def get_mouse_movements(self, vectors: np.ndarray) -> Optional[MouseMovements]:
+        """Translates an (N, 2) array of vectors into MouseMovements in one call,
+        e.g. for offline evaluation, replays or catching up after a stall.
+        Returns None for an empty array.
+
+        This default implementation calls `get_next_mouse_movement` for every vector.
+        TrackingApproaches override it with a vectorized version."""
+        movements = [self.get_next_mouse_movement(vector) for vector in vectors]
+        types = {movement.type for movement in movements if movement is not None}
+        if len(types) == 0:
+            return None
+        assert len(types) == 1, "all MouseMovements of a batch need to be of the same type"
+        return MouseMovements(
+            types.pop(),
+            np.array([movement.vector if movement is not None else (0, 0) for movement in movements], dtype=float),
+            np.array([movement is not None for movement in movements]),
+        )